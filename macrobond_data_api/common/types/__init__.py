@@ -37,10 +37,16 @@ from .revision_info import RevisionInfo, RevisionInfoDict
 
 from .get_all_vintage_series_result import GetAllVintageSeriesResult
 
+from .vintage_matrix import VintageMatrix
+
+from .vintage_index import VintageIndex
+
 from .metadata import Metadata
 
 from .series_with_vintages import SeriesWithVintages, VintageValues
 
+from .compact_vintages import CompactVintages
+
 from .revision_history_request import RevisionHistoryRequest
 
 from .values_metadata import ValuesMetadata
@@ -1,7 +1,11 @@
+import re
 from datetime import datetime, timezone, timedelta, date, time
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from .format_exception import FormatException
 
+# The layouts used by the web API, which datetime.fromisoformat parses identically in all supported Python versions
+_FAST_LAYOUT = re.compile(r"\d{4}-\d\d-\d\d(?:T\d\d:\d\d:\d\d(?:\.\d{3}|\.\d{6})?(?:Z|[+-]\d\d:\d\d)?)?", re.ASCII)
+
 
 def _parse_date(s: str) -> Tuple[date, str]:
     if len(s) < 4 or not s[:4].isascii() or not s[:4].isdigit():
@@ -111,3 +115,41 @@ def _parse_iso8601(s: str) -> datetime:
         parsed_time = _parse_time(s[1:], None)
         return datetime.combine(parsed_date, parsed_time)
     return datetime(parsed_date.year, parsed_date.month, parsed_date.day)
+
+
+def _parse_iso8601_fast(s: str) -> datetime:
+    if _FAST_LAYOUT.fullmatch(s) is None:
+        return _parse_iso8601(s)
+    if s[-1] == "Z":
+        # fromisoformat does not accept Z before Python 3.11
+        return datetime.fromisoformat(s[:-1] + "+00:00")
+    return datetime.fromisoformat(s)
+
+
+def _parse_iso8601_many(values: Iterable[str]) -> List[datetime]:
+    memo: Dict[str, datetime] = {}
+    ret: List[datetime] = []
+    for s in values:
+        parsed = memo.get(s)
+        if parsed is None:
+            parsed = memo[s] = _parse_iso8601_fast(s)
+        ret.append(parsed)
+    return ret
+
+
+class _Iso8601Memo:
+    """Parses one value at a time and remembers the most recent values, for use while streaming."""
+
+    __slots__ = ("_memo", "_max_size")
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self._memo: Dict[str, datetime] = {}
+        self._max_size = max_size
+
+    def parse(self, s: str) -> datetime:
+        parsed = self._memo.get(s)
+        if parsed is None:
+            if len(self._memo) >= self._max_size:
+                self._memo.clear()
+            parsed = self._memo[s] = _parse_iso8601_fast(s)
+        return parsed
@@ -0,0 +1,210 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple, overload
+
+from .series_with_vintages import VintageValues
+
+__pdoc__ = {
+    "CompactVintages.__init__": False,
+}
+
+
+class CompactVintages(Sequence[VintageValues]):
+    """
+    All vintages of a time series stored as changes from the previous vintage.
+
+    Consecutive vintages usually only differ in a few observations at the end. The dates are stored once for all
+    vintages, and each vintage only stores the values that were added or revised since the previous vintage. Every
+    `keyframe_interval` vintages, all values are stored, so that any vintage can be created by applying at most
+    `keyframe_interval` changes. A vintage whose dates are not a continuous range of all dates is stored as it is.
+
+    The vintages are created as `macrobond_data_api.common.types.series_with_vintages.VintageValues` when they are
+    accessed.
+
+    Create it with `macrobond_data_api.common.types.series_with_vintages.SeriesWithVintages.to_compact_vintages`
+    or `from_vintages`.
+
+    Examples
+    --------
+    ```python
+    for series in api.get_many_series_with_revisions(requests):
+        vintages = series.to_compact_vintages()
+        last = vintages[-1]
+    ```
+    """
+
+    __slots__ = ("dates", "_time_stamps", "_ranges", "_keyframes", "_changes", "_irregular")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.dates: List[datetime] = []
+        """The dates of all vintages, sorted."""
+        self._time_stamps: List[Optional[datetime]] = []
+        self._ranges: List[Tuple[int, int]] = []
+        self._keyframes: Dict[int, Tuple[Optional[float], ...]] = {}
+        self._changes: Dict[int, Tuple[Tuple[int, ...], Tuple[Optional[float], ...]]] = {}
+        self._irregular: Dict[int, Tuple[Tuple[datetime, ...], Tuple[Optional[float], ...]]] = {}
+
+    @classmethod
+    def from_vintages(cls, vintages: Sequence[VintageValues], keyframe_interval: int = 100) -> "CompactVintages":
+        """
+        Create the compact form of a sequence of vintages.
+
+        Parameters
+        ----------
+        vintages : Sequence[`macrobond_data_api.common.types.series_with_vintages.VintageValues`]
+            The vintages, oldest first.
+        keyframe_interval : int
+            The largest number of vintages between two vintages where all values are stored.
+        """
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be 1 or greater")
+
+        self = cls()
+        position_of_date: Dict[datetime, int] = {}
+        # The values of all dates as of the previous vintage
+        current: List[Optional[float]] = []
+        previous: Optional[Tuple[int, int]] = None
+        since_keyframe = keyframe_interval
+
+        for vintage in vintages:
+            index = len(self._time_stamps)
+            self._time_stamps.append(vintage.vintage_time_stamp)
+            dates = vintage.dates
+            values = vintage.values
+
+            start = self._add_dates(dates, position_of_date)
+            if start is None:
+                self._ranges.append((0, 0))
+                self._irregular[index] = (tuple(dates), tuple(values))
+                previous = None
+                continue
+
+            end = start + len(dates)
+            current.extend([None] * (len(self.dates) - len(current)))
+            self._ranges.append((start, end))
+
+            changes: Optional[Tuple[List[int], List[Optional[float]]]] = None
+            if previous is not None and since_keyframe < keyframe_interval:
+                # The values outside the range of the previous vintage are always stored
+                previous_start, previous_end = previous
+                overlap_start = min(max(start, previous_start), end)
+                overlap_end = max(min(end, previous_end), overlap_start)
+                positions = list(range(start, overlap_start))
+                positions.extend(
+                    position
+                    for position, old, new in zip(
+                        range(overlap_start, overlap_end),
+                        current[overlap_start:overlap_end],
+                        values[overlap_start - start : overlap_end - start],
+                    )
+                    if old != new
+                )
+                positions.extend(range(overlap_end, end))
+                new_values = [values[x - start] for x in positions]
+                # Storing all values is smaller when most of them changed
+                if len(positions) * 2 < len(values):
+                    changes = (positions, new_values)
+
+            if changes is None:
+                self._keyframes[index] = tuple(values)
+                since_keyframe = 1
+            else:
+                self._changes[index] = (tuple(changes[0]), tuple(changes[1]))
+                since_keyframe += 1
+
+            current[start:end] = values
+            previous = (start, end)
+
+        return self
+
+    @property
+    def vintage_time_stamps(self) -> List[Optional[datetime]]:
+        """The time stamps of the vintages."""
+        return list(self._time_stamps)
+
+    def get_dates(self, index: int) -> List[datetime]:
+        """Get the dates of one vintage."""
+        index = self._check_index(index)
+        irregular = self._irregular.get(index)
+        if irregular is not None:
+            return list(irregular[0])
+        start, end = self._ranges[index]
+        return self.dates[start:end]
+
+    def get_values(self, index: int) -> List[Optional[float]]:
+        """Get the values of one vintage."""
+        index = self._check_index(index)
+        irregular = self._irregular.get(index)
+        if irregular is not None:
+            return list(irregular[1])
+
+        keyframe = index
+        while keyframe not in self._keyframes:
+            keyframe -= 1
+
+        start, end = self._ranges[keyframe]
+        if keyframe == index:
+            return list(self._keyframes[index])
+
+        values: List[Optional[float]] = [None] * len(self.dates)
+        values[start:end] = self._keyframes[keyframe]
+        for i in range(keyframe + 1, index + 1):
+            positions, changed = self._changes[i]
+            for position, value in zip(positions, changed):
+                values[position] = value
+
+        start, end = self._ranges[index]
+        return values[start:end]
+
+    def _add_dates(self, dates: Sequence[datetime], position_of_date: Dict[datetime, int]) -> Optional[int]:
+        """
+        Add the new dates at the end of all dates and return the position of the first date,
+        or None if the dates are not a continuous range of all dates.
+        """
+        if len(dates) == 0:
+            return len(self.dates)
+
+        start = position_of_date.get(dates[0])
+        if start is None:
+            if self.dates and dates[0] <= self.dates[-1]:
+                return None
+            start = len(self.dates)
+
+        overlap = min(len(dates), len(self.dates) - start)
+        if list(dates[:overlap]) != self.dates[start : start + overlap]:
+            return None
+
+        new_dates = dates[overlap:]
+        if any(x >= y for x, y in zip(new_dates, new_dates[1:])):
+            return None
+        if len(new_dates) != 0 and self.dates and new_dates[0] <= self.dates[-1]:
+            return None
+
+        for date in new_dates:
+            position_of_date[date] = len(self.dates)
+            self.dates.append(date)
+        return start
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self._time_stamps)
+        if not 0 <= index < len(self._time_stamps):
+            raise IndexError("vintage index out of range")
+        return index
+
+    @overload
+    def __getitem__(self, i: int) -> VintageValues:
+        pass
+
+    @overload
+    def __getitem__(self, s: slice) -> Sequence[VintageValues]:
+        pass
+
+    def __getitem__(self, key):  # type: ignore
+        if isinstance(key, slice):
+            return [self[x] for x in range(*key.indices(len(self)))]
+        index = self._check_index(key)
+        return VintageValues(self._time_stamps[index], self.get_dates(index), self.get_values(index))
+
+    def __len__(self) -> int:
+        return len(self._time_stamps)
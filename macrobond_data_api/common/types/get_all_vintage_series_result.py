@@ -4,8 +4,12 @@ from itertools import chain
 from typing import TYPE_CHECKING, Any, Dict, Sequence, overload, List
 
 from macrobond_data_api.common.types.vintage_series import VintageSeries
+from macrobond_data_api.common.types.vintage_matrix import VintageMatrix
+from macrobond_data_api.common.types.vintage_index import VintageIndex
 
 if TYPE_CHECKING:  # pragma: no cover
+    from numpy import float64
+    from numpy.typing import NDArray
     from pandas import DataFrame
 
 __pdoc__ = {
@@ -31,29 +35,46 @@ class GetAllVintageSeriesResult(Sequence[VintageSeries]):
         self.series_name = series_name
         """The name of the requested series."""
 
+    def to_vintage_matrix(self) -> VintageMatrix:
+        """
+        Return the result as a `macrobond_data_api.common.types.vintage_matrix.VintageMatrix`,
+        a 2-D array of observation date by vintage.
+        """
+        return VintageMatrix._create(self.series, self.series_name)
+
+    def to_vintage_index(self) -> VintageIndex:
+        """
+        Return the result as a `macrobond_data_api.common.types.vintage_index.VintageIndex`,
+        that answers point-in-time and nth release queries without making any requests.
+        """
+        return VintageIndex._from_vintage_series(self.series, self.series_name)
+
+    def to_numpy(self) -> "NDArray[float64]":
+        """
+        Return the values as a 2-D numpy array with one row for each observation date and one column for each vintage.
+        See `to_vintage_matrix`.
+        """
+        return self.to_vintage_matrix().to_numpy()
+
     def to_pd_data_frame(self) -> "DataFrame":
         """
-        Return the result as a Pandas DataFrame.
+        Return the result as a Pandas DataFrame with a "date" column and one column for each vintage,
+        in the same order as `series`.
         """
         import pandas  # pylint: disable=import-outside-toplevel
 
-        dates = list(set(chain.from_iterable((x.dates for x in self.series))))
-        dates.sort()
+        matrix = VintageMatrix._create(self.series, self.series_name, sort_vintages=False)
+        if any(isinstance(x.dates, list) for x in self.series):
+            dates: Any = sorted(set(chain.from_iterable(x.dates for x in self.series if x.dates is not None)))
+        else:
+            dates = pandas.DatetimeIndex(matrix.dates)
+            if matrix._dates_have_time_zone:
+                dates = dates.tz_localize("UTC")
 
         df = pandas.DataFrame(
-            {
-                **{"date": dates},
-            }
+            matrix.values, columns=pandas.Index([x.revision_time_stamp for x in self.series], dtype=object)
         )
-
-        for x in self.series:
-            arg: Any = {
-                **{"date": x.dates},
-                **{x.revision_time_stamp: pandas.Series(data=x.values, name="Value", dtype="float64")},
-            }
-            df_to_merge = pandas.DataFrame(arg)
-            df = df.merge(df_to_merge, how="left", left_on="date", right_on="date")
-
+        df.insert(0, "date", dates)
         return df
 
     def to_dict(self) -> Dict[str, Any]:
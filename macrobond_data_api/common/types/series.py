@@ -52,11 +52,13 @@ class Series(Entity):
         """
         The values of the series.
         The number of values is the same as the number of `Series.dates`. 
+        This is a numpy.ndarray of float64 when `macrobond_data_api.web.web_api.WebApi.use_numpy_arrays` is True.
         """
         self.dates = ...  # type: ignore
         """
         The dates of the periods corresponding to the values
         The number of dates is the same as the number of `Series.values`. 
+        This is a numpy.ndarray of datetime64[ns] when `macrobond_data_api.web.web_api.WebApi.use_numpy_arrays` is True.
         """
 
         if values is None:
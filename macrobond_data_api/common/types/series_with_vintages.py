@@ -1,11 +1,14 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
 from macrobond_data_api.common.enums import StatusCode
 
 from .metadata import Metadata
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .compact_vintages import CompactVintages
+
 __pdoc__ = {
     "VintageValues.__init__": False,
     "SeriesWithVintages.__init__": False,
@@ -107,6 +110,20 @@ class SeriesWithVintages:
             else None
         )
 
+    def to_compact_vintages(self, keyframe_interval: int = 100) -> "CompactVintages":
+        """
+        Return the vintages as a `macrobond_data_api.common.types.compact_vintages.CompactVintages`,
+        that only stores the changes between consecutive vintages.
+
+        Parameters
+        ----------
+        keyframe_interval : int
+            The largest number of vintages between two vintages where all values are stored.
+        """
+        from .compact_vintages import CompactVintages  # pylint: disable=import-outside-toplevel
+
+        return CompactVintages.from_vintages(self.vintages, keyframe_interval)
+
     def __init__(
         self,
         error_text: Optional[str],
@@ -0,0 +1,214 @@
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from macrobond_data_api.common.enums import StatusCode
+
+from .series import Series
+from .vintage_series import VintageSeries
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .metadata import Metadata
+    from .series_with_vintages import SeriesWithVintages
+    from .values_metadata import ValuesMetadata
+
+__pdoc__ = {
+    "VintageIndex.__init__": False,
+}
+
+_Vintage = Tuple[Optional[datetime], Sequence[datetime], Sequence[Optional[float]]]
+
+
+def _as_utc(time: datetime) -> datetime:
+    return time.replace(tzinfo=timezone.utc) if time.tzinfo is None else time
+
+
+def _is_same(value: Optional[float], other: Optional[float]) -> bool:
+    # A missing value is NaN when the values are a numpy array, and NaN is not equal to itself
+    return value == other or (value != value and other != other)  # pylint: disable=comparison-with-itself
+
+
+class VintageIndex:
+    """
+    All vintages of a time series, indexed by vintage time stamp, that answers point-in-time queries without making
+    any requests.
+
+    `get_vintage_series` and `get_nth_release` return the same results as
+    `macrobond_data_api.common.api.Api.get_one_vintage_series` and `macrobond_data_api.common.api.Api.get_one_nth_release`.
+    The vintage is found with a binary search of the time stamps. The times when the values changed are computed the
+    first time they are needed.
+
+    Create it with `macrobond_data_api.common.types.get_all_vintage_series_result.GetAllVintageSeriesResult.to_vintage_index`
+    or `from_series_with_vintages`.
+
+    Examples
+    --------
+    ```python
+    index = api.get_all_vintage_series("usgdp").to_vintage_index()
+    for time in backtest_times:
+        series = index.get_vintage_series(time)
+    ```
+    """
+
+    __slots__ = ("series_name", "metadata", "_time_stamps", "_vintages", "_has_initial", "_changes")
+
+    def __init__(self, series_name: str, metadata: Optional["Metadata"], vintages: Sequence[_Vintage]) -> None:
+        self.series_name = series_name
+        """The name of the series."""
+        self.metadata = metadata
+        """The metadata of the series."""
+
+        # The vintage without a time stamp is the oldest
+        self._vintages = sorted(vintages, key=lambda x: (x[0] is not None, _as_utc(x[0]) if x[0] else None))
+        self._has_initial = len(self._vintages) != 0 and self._vintages[0][0] is None
+        self._time_stamps = [_as_utc(x[0]) for x in self._vintages if x[0] is not None]
+        self._changes: Optional[Dict[datetime, Tuple[List[int], List[Optional[float]]]]] = None
+
+    @classmethod
+    def _from_vintage_series(cls, series: Sequence[VintageSeries], series_name: str) -> "VintageIndex":
+        return cls(
+            series_name,
+            series[-1].metadata if series else None,
+            [
+                (
+                    x.revision_time_stamp,
+                    x.dates if x.dates is not None else [],
+                    x.values if x.values is not None else [],
+                )
+                for x in series
+                if not x.is_error
+            ],
+        )
+
+    @classmethod
+    def from_series_with_vintages(cls, series: "SeriesWithVintages", series_name: str) -> "VintageIndex":
+        """
+        Create an index from a result of `macrobond_data_api.common.api.Api.get_many_series_with_revisions`.
+
+        Parameters
+        ----------
+        series : `macrobond_data_api.common.types.series_with_vintages.SeriesWithVintages`
+            The series with all vintages. A partial (206) result only contains the new vintages.
+        series_name : str
+            The name of the series.
+        """
+        return cls(series_name, series.metadata, [(x.vintage_time_stamp, x.dates, x.values) for x in series.vintages])
+
+    @property
+    def vintage_time_stamps(self) -> List[datetime]:
+        """The sorted time stamps of the vintages."""
+        return list(self._time_stamps)
+
+    def get_vintage_series(self, time: datetime, include_times_of_change: bool = False) -> VintageSeries:
+        """
+        Get the series as it was known at a point in time.
+
+        Parameters
+        ----------
+        time : datetime
+            The time of the vintage to return. A time without time zone is in UTC.
+        include_times_of_change : bool
+            Include information of the time each values was last changed.
+
+        Returns
+        -------
+        `macrobond_data_api.common.types.vintage_series.VintageSeries`
+            The vintage, or a series with the status NOT_FOUND if there was no vintage at that time.
+        """
+        position = self._find(time)
+        if position < 0:
+            return VintageSeries(
+                self.series_name,
+                f"There is no vintage at {time.isoformat()}",
+                StatusCode.NOT_FOUND,
+                None,
+                None,
+                None,
+                None,
+                None,
+            )
+
+        vintage_time_stamp, dates, values = self._vintages[position]
+        values_metadata: Optional["ValuesMetadata"] = None
+        if include_times_of_change:
+            values_metadata = []
+            changes = self._get_changes()
+            for date in dates:
+                changed_in = changes[date][0]
+                vintage = changed_in[bisect_right(changed_in, position) - 1]
+                values_metadata.append({"RevisionTimeStamp": self._vintages[vintage][0]})
+
+        return VintageSeries(
+            self.series_name,
+            None,
+            StatusCode.OK,
+            self.metadata,
+            values_metadata,
+            list(values),
+            list(dates),
+            vintage_time_stamp,
+        )
+
+    def get_nth_release(self, nth: int, include_times_of_change: bool = False) -> Series:
+        """
+        Get a series where each value is the nth change of the value.
+
+        Parameters
+        ----------
+        nth : int
+            The nth change of each value, where 0 is the first release.
+        include_times_of_change : bool
+            Include information of the time each values was changed.
+
+        Returns
+        -------
+        `macrobond_data_api.common.types.series.Series`
+            The values that have not changed nth times are None. The series ends at the last value that has.
+        """
+        if nth < 0:
+            raise ValueError("nth must be 0 or greater")
+
+        changes = self._get_changes()
+        dates = sorted(changes)
+        values: List[Optional[float]] = []
+        values_metadata: List[Dict[str, Any]] = []
+        end = 0
+        for date in dates:
+            changed_in, changed_values = changes[date]
+            if len(changed_in) > nth:
+                values.append(changed_values[nth])
+                time_stamp = self._vintages[changed_in[nth]][0]
+                values_metadata.append({"RevisionTimeStamp": time_stamp} if time_stamp else {})
+                end = len(values)
+            else:
+                values.append(None)
+                values_metadata.append({})
+
+        return Series(
+            self.series_name,
+            "",
+            StatusCode.OK,
+            self.metadata,
+            values_metadata[:end] if include_times_of_change else None,
+            values[:end],
+            dates[:end],
+        )
+
+    def _find(self, time: datetime) -> int:
+        """The position of the last vintage at or before time, or -1."""
+        return bisect_right(self._time_stamps, _as_utc(time)) - (0 if self._has_initial else 1)
+
+    def _get_changes(self) -> Dict[datetime, Tuple[List[int], List[Optional[float]]]]:
+        """For each date, the positions of the vintages where the value changed and the new values."""
+        if self._changes is None:
+            changes: Dict[datetime, Tuple[List[int], List[Optional[float]]]] = {}
+            for position, (_, dates, values) in enumerate(self._vintages):
+                for date, value in zip(dates, values):
+                    change = changes.get(date)
+                    if change is None:
+                        changes[date] = ([position], [value])
+                    elif not _is_same(change[1][-1], value):
+                        change[0].append(position)
+                        change[1].append(value)
+            self._changes = changes
+        return self._changes
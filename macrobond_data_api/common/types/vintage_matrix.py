@@ -0,0 +1,143 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy import datetime64, float64
+    from numpy.typing import NDArray
+    from pandas import DataFrame
+
+    from .vintage_series import VintageSeries
+
+__pdoc__ = {
+    "VintageMatrix.__init__": False,
+}
+
+
+def _to_datetime64(dates: Any) -> Tuple["NDArray[datetime64]", bool]:
+    """Convert dates to datetime64[ns] in UTC. Also returns True if the dates had a time zone."""
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    if isinstance(dates, numpy.ndarray):
+        return dates.astype("datetime64[ns]", copy=False), False
+
+    has_time_zone = False
+    naive: List[Optional[datetime]] = []
+    for date in dates:
+        if date is not None and date.tzinfo is not None:
+            has_time_zone = True
+            date = date.astimezone(timezone.utc).replace(tzinfo=None)
+        naive.append(date)
+    return numpy.array(naive, dtype="datetime64[ns]"), has_time_zone
+
+
+@dataclass(init=False)
+class VintageMatrix:
+    """
+    All vintages of a time series as a "revision triangle": a 2-D array with one row for each observation date and
+    one column for each vintage.
+
+    Create it with `macrobond_data_api.common.types.get_all_vintage_series_result.GetAllVintageSeriesResult.to_vintage_matrix`.
+    """
+
+    __slots__ = ("series_name", "dates", "vintages", "values", "_dates_have_time_zone", "_vintages_have_time_zone")
+
+    series_name: str
+    """The name of the requested series."""
+
+    dates: "NDArray[datetime64]"
+    """The observation dates of all vintages, sorted and without duplicates, as datetime64[ns] in UTC."""
+
+    vintages: "NDArray[datetime64]"
+    """The time stamps of the vintages, sorted, as datetime64[ns] in UTC."""
+
+    values: "NDArray[float64]"
+    """
+    The values with the shape (len(dates), len(vintages)).
+    The value is NaN if a vintage has no value for a date.
+    """
+
+    def __init__(
+        self,
+        series_name: str,
+        dates: "NDArray[datetime64]",
+        vintages: "NDArray[datetime64]",
+        values: "NDArray[float64]",
+        _dates_have_time_zone: bool = False,
+        _vintages_have_time_zone: bool = False,
+    ) -> None:
+        self.series_name = series_name
+        self.dates = dates
+        self.vintages = vintages
+        self.values = values
+        self._dates_have_time_zone = _dates_have_time_zone
+        self._vintages_have_time_zone = _vintages_have_time_zone
+
+    @classmethod
+    def _create(
+        cls, series: Sequence["VintageSeries"], series_name: str, sort_vintages: bool = True
+    ) -> "VintageMatrix":
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        vintages, vintages_have_time_zone = _to_datetime64([x.revision_time_stamp for x in series])
+        dates_have_time_zone = False
+
+        if all(isinstance(x.dates, numpy.ndarray) for x in series if x.dates is not None):
+            date_arrays: List[Any] = [
+                x.dates if x.dates is not None else numpy.array([], dtype="datetime64[ns]") for x in series
+            ]
+            all_dates = numpy.concatenate(date_arrays) if date_arrays else numpy.array([], dtype="datetime64[ns]")
+            dates, rows = numpy.unique(all_dates.astype("datetime64[ns]", copy=False), return_inverse=True)
+            lengths = [len(x) for x in date_arrays]
+        else:
+            # The vintages mostly have the same dates, so each distinct date is only converted once
+            row_of_date: Dict[Any, int] = {}
+            codes: List[int] = []
+            lengths = []
+            for x in series:
+                x_dates = x.dates if x.dates is not None else []
+                codes.extend([row_of_date.setdefault(date, len(row_of_date)) for date in x_dates])
+                lengths.append(len(x_dates))
+            unsorted_dates, dates_have_time_zone = _to_datetime64(list(row_of_date))
+            date_order = numpy.argsort(unsorted_dates, kind="stable")
+            dates = unsorted_dates[date_order]
+            rank = numpy.empty(len(date_order), dtype=numpy.intp)
+            rank[date_order] = numpy.arange(len(date_order))
+            rows = rank[numpy.array(codes, dtype=numpy.intp)]
+
+        columns = numpy.repeat(numpy.arange(len(series)), lengths)
+        values = numpy.full((len(dates), len(series)), numpy.nan, dtype=numpy.float64)
+        if len(rows):
+            values[rows, columns] = numpy.concatenate(
+                [numpy.asarray(x.values if x.values is not None else [], dtype=numpy.float64) for x in series]
+            )
+
+        if sort_vintages:
+            order = numpy.argsort(vintages, kind="stable")
+            vintages = vintages[order]
+            values = values[:, order]
+        return cls(series_name, dates, vintages, values, dates_have_time_zone, vintages_have_time_zone)
+
+    def to_numpy(self) -> "NDArray[float64]":
+        """
+        Return the values as a 2-D numpy array with one row for each date in `dates`
+        and one column for each vintage in `vintages`.
+        """
+        return self.values
+
+    def to_pd_data_frame(self) -> "DataFrame":
+        """
+        Return the matrix as a Pandas DataFrame with a "date" column and one column for each vintage.
+        """
+        import pandas  # pylint: disable=import-outside-toplevel
+
+        dates = pandas.DatetimeIndex(self.dates)
+        vintages = pandas.DatetimeIndex(self.vintages)
+        if self._dates_have_time_zone:
+            dates = dates.tz_localize(timezone.utc)
+        if self._vintages_have_time_zone:
+            vintages = vintages.tz_localize(timezone.utc)
+
+        df = pandas.DataFrame(self.values, columns=vintages, copy=False)
+        df.insert(0, "date", dates)
+        return df
@@ -1,8 +1,20 @@
 from .scope import Scope
 from .web_api import WebApi
 from .configuration import Configuration
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
 from .web_client import WebClient
 from .data_package_list_poller import DataPackageListPoller
+from .data_package_list_checkpoint_store import (
+    DataPackageListCheckpointStore,
+    SqliteDataPackageListCheckpointStore,
+)
+from .series_cache import SeriesCache
+from .vintage_store import VintageStore
+from .subscription_list_change_queue import SubscriptionListChangeQueue
+from .async_session import AsyncSession
+from .async_transport import AsyncResponse, AsyncTransport, HttpxTransport
+from .async_web_api import AsyncWebApi
 from .auth_exceptions import (
     AuthBaseException,
     AuthDiscoveryException,
@@ -1,5 +1,7 @@
 import time
-from typing import Dict, Optional
+from contextlib import contextmanager
+from threading import Lock
+from typing import Dict, Iterator, Optional, Tuple
 
 
 class _CacheItem:
@@ -11,6 +13,9 @@ class _CacheItem:
 
 class _AccessTokenCache:
     _cache: Dict[str, _CacheItem] = {}
+    _lock = Lock()
+    # authorization_url -> (token_endpoint, expires_at)
+    _token_endpoints: Dict[str, Tuple[str, float]] = {}
 
     def __init__(self, key: Optional[str]) -> None:
         self._key = key
@@ -18,16 +23,42 @@ class _AccessTokenCache:
         self.remove_old_time = time.time
 
     def _get(self) -> _CacheItem:
-        self._remove_old()
+        with self._lock:
+            self._remove_old()
 
-        if self._key is None:
-            return self._no_key_cache_item
+            if self._key is None:
+                return self._no_key_cache_item
 
-        item = self._cache.get(self._key)
-        if item is None:
-            item = self._cache[self._key] = _CacheItem(None, None, time.time())
+            item = self._cache.get(self._key)
+            if item is None:
+                item = self._cache[self._key] = _CacheItem(None, None, time.time())
 
-        return item
+            return item
+
+    def _set(self, access_token: str, expires_at: int) -> None:
+        item = self._get()
+        item.expires_at = expires_at
+        item.access_token = access_token
+
+    def _get_token_endpoint(self, authorization_url: str) -> Optional[str]:
+        with self._lock:
+            entry = self._token_endpoints.get(authorization_url)
+        if entry is None or entry[1] < time.time():
+            return None
+        return entry[0]
+
+    def _set_token_endpoint(self, authorization_url: str, token_endpoint: str, ttl: float) -> None:
+        with self._lock:
+            self._token_endpoints[authorization_url] = (token_endpoint, time.time() + ttl)
+
+    def _remove_token_endpoint(self, authorization_url: str) -> None:
+        with self._lock:
+            self._token_endpoints.pop(authorization_url, None)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Held while a new token is fetched, so that other users of the cache can wait for it."""
+        yield
 
     def _remove_old(self) -> int:
         if len(self._cache) == 0:
@@ -1,5 +1,6 @@
 import time
-from typing import Any, Dict, Sequence, Optional, TYPE_CHECKING
+from threading import Lock, Thread
+from typing import Any, Dict, Sequence, Optional, Tuple, TYPE_CHECKING
 
 from .auth_exceptions import (
     AuthFetchTokenException,
@@ -8,7 +9,9 @@ from .auth_exceptions import (
     AuthTooManyRequestsException,
 )
 
+from .configuration import Configuration
 from ._access_token_cache import _AccessTokenCache
+from ._file_access_token_cache import _FileAccessTokenCache
 
 if TYPE_CHECKING:  # pragma: no cover
     from .scope import Scope
@@ -24,8 +27,9 @@ class _AuthClient:
         password: str,
         scope: Sequence["Scope"],
         authorization_url: str,
-        session: "Session",
+        session: Optional["Session"],
         use_access_token_cache: bool,
+        access_token_cache_path: Optional[str] = None,
     ) -> None:
         self._username = username
         self._password = password
@@ -36,38 +40,93 @@ class _AuthClient:
         self.requests_auth = self._requests_auth
         self.token_response: Optional[Dict[str, Any]] = None
         self.leeway = 60
+        self.refresh_ahead = 300
         self.fetch_token_get_time = time.time
         self.is_expired_get_time = time.time
 
+        self._cache: _AccessTokenCache
         if use_access_token_cache:
             key_cache = self.scope + ":" + self.authorization_url + ":" + username + ":" + password
-            self._cache = _AccessTokenCache(key_cache)
+            if access_token_cache_path:
+                self._cache = _FileAccessTokenCache(key_cache, access_token_cache_path)
+            else:
+                self._cache = _AccessTokenCache(key_cache)
         else:
             self._cache = _AccessTokenCache(None)
 
+        # Only one thread at a time fetches a token, the others wait for it and use the new token.
+        # With a file cache, this also applies to other processes.
+        self._lock = Lock()
+        # Held while a renewal thread is running.
+        self._renewal_lock = Lock()
+
     def fetch_token_if_necessary(self) -> bool:
-        if self._is_expired():
-            self.fetch_token()
+        access_token, is_expired, should_renew = self._token_state()
+        if not is_expired:
+            if should_renew:
+                self._start_renewal(access_token)
+            return False
+
+        with self._lock, self._cache._exclusive():
+            if self._cache._get().access_token != access_token:
+                # Another thread or process fetched a new token while this one was waiting
+                return False
+            self._fetch_token_unlocked()
             return True
-        return False
 
     def fetch_token(self) -> None:
-        if self.token_endpoint is None:
-            self.token_endpoint = self._discovery(self.authorization_url)
+        with self._lock, self._cache._exclusive():
+            self._fetch_token_unlocked()
+
+    def _fetch_token_if_current(self, access_token: Optional[str]) -> None:
+        with self._lock, self._cache._exclusive():
+            if self._cache._get().access_token != access_token:
+                # Another thread or process has already replaced the token
+                return
+            self._fetch_token_unlocked()
+
+    def _fetch_token_unlocked(self) -> None:
+        token_endpoint = self.token_endpoint or self._cache._get_token_endpoint(self.authorization_url)
+        if token_endpoint is None:
+            token_endpoint = self._discovery(self.authorization_url)
+            self._cache._set_token_endpoint(self.authorization_url, token_endpoint, Configuration._discovery_cache_ttl)
+        self.token_endpoint = token_endpoint
 
-        self._fetch_token(self.token_endpoint)
+        try:
+            self._fetch_token(token_endpoint)
+        except AuthFetchTokenException:
+            self._forget_token_endpoint()
+            raise
+
+    def _forget_token_endpoint(self) -> None:
+        # The token endpoint may have changed, so do a new discovery next time
+        self.token_endpoint = None
+        self._cache._remove_token_endpoint(self.authorization_url)
 
     def _fetch_token(self, token_endpoint: str) -> None:
-        payload = {
+        session = self._session()
+        response = session.requests_session.post(
+            token_endpoint,
+            data=self._token_payload(),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=session.timeout,
+        )
+        self._process_token_response(response)
+
+    def _session(self) -> "Session":
+        if self.session is None:
+            raise ValueError("No session")
+        return self.session
+
+    def _token_payload(self) -> Dict[str, str]:
+        return {
             "grant_type": "client_credentials",
             "client_id": self._username,
             "client_secret": self._password,
             "scope": self.scope,
         }
-        response = self.session.requests_session.post(
-            token_endpoint, data=payload, headers={"Content-Type": "application/x-www-form-urlencoded"}
-        )
 
+    def _process_token_response(self, response: "Response") -> None:
         self._throw_if_too_many_requests(response)
 
         if response.status_code not in [200, 400]:
@@ -103,14 +162,14 @@ class _AuthClient:
         if not json.get("access_token"):
             raise AuthFetchTokenException("No access_token")
 
-        cache_item = self._cache._get()
-        cache_item.expires_at = expires_at
-        cache_item.access_token = json["access_token"]
+        self._cache._set(json["access_token"], expires_at)
 
     def _discovery(self, url: str) -> str:
+        session = self._session()
+        response = session.requests_session.get(url + ".well-known/openid-configuration", timeout=session.timeout)
+        return self._process_discovery_response(response)
 
-        response = self.session.requests_session.get(url + ".well-known/openid-configuration")
-
+    def _process_discovery_response(self, response: "Response") -> str:
         self._throw_if_too_many_requests(response)
 
         if response.status_code != 200:
@@ -130,18 +189,44 @@ class _AuthClient:
 
         return token_endpoint
 
-    def _is_expired(self) -> bool:
+    def _authorization_header(self, access_token: Optional[str]) -> Optional[str]:
+        return "Bearer " + access_token if access_token else None
+
+    def _token_state(self) -> Tuple[Optional[str], bool, bool]:
+        """
+        Returns the current access token, whether it has expired and whether it should be renewed in the background.
+        The token should be renewed when it expires in less than refresh_ahead seconds.
+        """
         cache_item = self._cache._get()
 
         if not cache_item.expires_at:
-            return True
+            return cache_item.access_token, True, False
         expiration_threshold = cache_item.expires_at - self.leeway
-        return expiration_threshold < self.is_expired_get_time()
+        now = self.is_expired_get_time()
+        return cache_item.access_token, expiration_threshold < now, expiration_threshold - self.refresh_ahead < now
+
+    def _start_renewal(self, access_token: Optional[str]) -> None:
+        if not self._renewal_lock.acquire(blocking=False):  # pylint: disable=consider-using-with
+            return
+        try:
+            Thread(target=self._renew, args=(access_token,), name="token renewal", daemon=True).start()
+        except BaseException:
+            self._renewal_lock.release()
+            raise
+
+    def _renew(self, access_token: Optional[str]) -> None:
+        try:
+            self._fetch_token_if_current(access_token)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # The token is still valid. If it can not be renewed, the error is raised when it has expired.
+            ...
+        finally:
+            self._renewal_lock.release()
 
     def _requests_auth(self, r: "PreparedRequest") -> "PreparedRequest":
-        cache_item = self._cache._get()
-        if cache_item.access_token:
-            r.headers["Authorization"] = "Bearer " + cache_item.access_token
+        authorization = self._authorization_header(self._cache._get().access_token)
+        if authorization:
+            r.headers["Authorization"] = authorization
         return r
 
     def _throw_if_too_many_requests(self, response: "Response") -> None:
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, Optional
+
+from ._access_token_cache import _AccessTokenCache, _CacheItem
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt  # pylint: disable=E0401
+
+    def _lock_file(file: IO[Any]) -> None:
+        file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK gives up after 10 seconds
+                ...
+
+    def _unlock_file(file: IO[Any]) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(file: IO[Any]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(file: IO[Any]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+def _hash_key(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class _FileAccessTokenCache(_AccessTokenCache):
+    """
+    An access token cache that is shared by all processes using the same file.
+    The file also holds the token endpoints from the OpenID discovery documents.
+    The entries are keyed by a hash of the cache key, so the credentials are not stored in the file.
+    """
+
+    def __init__(self, key: str, path: str) -> None:
+        super().__init__(key)
+        self._path = path
+        self._file_key = _hash_key(key)
+        self._file_mtime: Optional[int] = None
+        self._lock_file: Optional[IO[Any]] = None
+
+    def _get(self) -> _CacheItem:
+        item = super()._get()
+
+        try:
+            mtime = os.stat(self._path).st_mtime_ns
+        except FileNotFoundError:
+            return item
+
+        if mtime != self._file_mtime:
+            self._file_mtime = mtime
+            entry = self._read().get(self._file_key)
+            if entry and entry["expires_at"] > (item.expires_at or 0):
+                item.access_token = entry["access_token"]
+                item.expires_at = entry["expires_at"]
+
+        return item
+
+    def _set(self, access_token: str, expires_at: int) -> None:
+        super()._set(access_token, expires_at)
+
+        self._update(self._file_key, {"access_token": access_token, "expires_at": expires_at})
+
+    def _get_token_endpoint(self, authorization_url: str) -> Optional[str]:
+        token_endpoint = super()._get_token_endpoint(authorization_url)
+        if token_endpoint is None:
+            entry = self._read().get(_hash_key("discovery:" + authorization_url))
+            if entry and entry["expires_at"] > time.time():
+                token_endpoint = entry["token_endpoint"]
+                with self._lock:
+                    self._token_endpoints[authorization_url] = (entry["token_endpoint"], entry["expires_at"])
+        return token_endpoint
+
+    def _set_token_endpoint(self, authorization_url: str, token_endpoint: str, ttl: float) -> None:
+        super()._set_token_endpoint(authorization_url, token_endpoint, ttl)
+        self._update(
+            _hash_key("discovery:" + authorization_url),
+            {"token_endpoint": token_endpoint, "expires_at": time.time() + ttl},
+        )
+
+    def _remove_token_endpoint(self, authorization_url: str) -> None:
+        super()._remove_token_endpoint(authorization_url)
+        self._update(_hash_key("discovery:" + authorization_url), None)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        if self._lock_file is not None:
+            # Already held by this cache
+            yield
+            return
+
+        with open(os.open(self._path + ".lock", os.O_RDWR | os.O_CREAT, 0o600), "r+b") as lock_file:
+            _lock_file(lock_file)
+            self._lock_file = lock_file
+            try:
+                yield
+            finally:
+                self._lock_file = None
+                _unlock_file(lock_file)
+
+    def _update(self, file_key: str, entry: Optional[Dict[str, Any]]) -> None:
+        with self._exclusive():
+            now = time.time()
+            data = {x: y for x, y in self._read().items() if y["expires_at"] > now and x != file_key}
+            if entry is not None:
+                data[file_key] = entry
+            self._write(data)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        temp_path = self._path + "." + str(os.getpid()) + ".tmp"
+        with open(os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(temp_path, self._path)
@@ -0,0 +1,231 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from queue import Full, Queue
+from threading import Event
+from typing import Any, Callable, Deque, Generator, Iterable, Iterator, Optional, Set, Tuple, TypeVar
+
+MapChunksInTypeVar = TypeVar("MapChunksInTypeVar")
+MapChunksOutTypeVar = TypeVar("MapChunksOutTypeVar")
+
+_END = object()
+
+
+def map_chunks(
+    func: Callable[[MapChunksInTypeVar], MapChunksOutTypeVar],
+    chunks: Iterable[MapChunksInTypeVar],
+    max_workers: int = 1,
+    preserve_order: bool = True,
+) -> Generator[MapChunksOutTypeVar, None, None]:
+    """
+    Call func for each chunk and yield the results.
+    With max_workers > 1 the calls are made on a thread pool with at most max_workers chunks in flight.
+    If preserve_order is False the results are yielded in completion order.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be 1 or greater")
+
+    if max_workers == 1:
+        for chunk in chunks:
+            yield func(chunk)
+        return
+
+    chunk_iterator = iter(chunks)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        if preserve_order:
+            yield from _map_chunks_ordered(func, chunk_iterator, executor, max_workers)
+        else:
+            yield from _map_chunks_as_completed(func, chunk_iterator, executor, max_workers)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _submit_next(
+    func: Callable[[MapChunksInTypeVar], MapChunksOutTypeVar],
+    chunk_iterator: Iterator[MapChunksInTypeVar],
+    executor: ThreadPoolExecutor,
+) -> Optional["Future[MapChunksOutTypeVar]"]:
+    chunk = next(chunk_iterator, _END)
+    if chunk is _END:
+        return None
+    return executor.submit(func, chunk)  # type: ignore[arg-type]
+
+
+def _map_chunks_ordered(
+    func: Callable[[MapChunksInTypeVar], MapChunksOutTypeVar],
+    chunk_iterator: Iterator[MapChunksInTypeVar],
+    executor: ThreadPoolExecutor,
+    max_workers: int,
+) -> Generator[MapChunksOutTypeVar, None, None]:
+    in_flight: Deque["Future[MapChunksOutTypeVar]"] = deque()
+    while True:
+        while len(in_flight) < max_workers:
+            future = _submit_next(func, chunk_iterator, executor)
+            if future is None:
+                break
+            in_flight.append(future)
+
+        if not in_flight:
+            return
+
+        yield in_flight.popleft().result()
+
+
+def _map_chunks_as_completed(
+    func: Callable[[MapChunksInTypeVar], MapChunksOutTypeVar],
+    chunk_iterator: Iterator[MapChunksInTypeVar],
+    executor: ThreadPoolExecutor,
+    max_workers: int,
+) -> Generator[MapChunksOutTypeVar, None, None]:
+    in_flight: Set["Future[MapChunksOutTypeVar]"] = set()
+    while True:
+        while len(in_flight) < max_workers:
+            future = _submit_next(func, chunk_iterator, executor)
+            if future is None:
+                break
+            in_flight.add(future)
+
+        if not in_flight:
+            return
+
+        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+
+def map_chunk_streams(
+    func: Callable[[MapChunksInTypeVar], Iterable[MapChunksOutTypeVar]],
+    chunks: Iterable[MapChunksInTypeVar],
+    max_workers: int = 1,
+    preserve_order: bool = True,
+    buffer_size: int = 100,
+) -> Generator[MapChunksOutTypeVar, None, None]:
+    """
+    Call func for each chunk and yield the items of the returned iterables while they are produced.
+    With max_workers > 1 the iterables are consumed on a thread pool with at most max_workers chunks in flight.
+    If preserve_order is True, each chunk has its own buffer of buffer_size items and the workers wait when their
+    buffer is full, so at most max_workers * buffer_size items are buffered.
+    If preserve_order is False, the items are yielded in the order they are produced and all workers share one buffer
+    of buffer_size items. In both modes, each waiting worker also holds the one item it is about to add.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be 1 or greater")
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be 1 or greater")
+
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from func(chunk)
+        return
+
+    chunk_iterator = iter(chunks)
+    abort = Event()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        if preserve_order:
+            yield from _map_chunk_streams_ordered(func, chunk_iterator, executor, max_workers, buffer_size, abort)
+        else:
+            yield from _map_chunk_streams_as_completed(func, chunk_iterator, executor, max_workers, buffer_size, abort)
+    finally:
+        abort.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+_ITEM = 0
+_ERROR = 1
+_DONE = 2
+
+
+def _put(queue: "Queue[Tuple[int, Any]]", entry: Tuple[int, Any], abort: Event) -> bool:
+    while not abort.is_set():
+        try:
+            queue.put(entry, timeout=0.1)
+            return True
+        except Full:
+            ...
+    return False
+
+
+def _produce(
+    func: Callable[[MapChunksInTypeVar], Iterable[MapChunksOutTypeVar]],
+    chunk: MapChunksInTypeVar,
+    queue: "Queue[Tuple[int, Any]]",
+    abort: Event,
+) -> None:
+    items: Optional[Iterable[MapChunksOutTypeVar]] = None
+    try:
+        items = func(chunk)
+        for item in items:
+            if not _put(queue, (_ITEM, item), abort):
+                return
+    except BaseException as ex:  # pylint: disable=broad-exception-caught
+        _put(queue, (_ERROR, ex), abort)
+        return
+    finally:
+        close = getattr(items, "close", None)
+        if close is not None:
+            close()
+    _put(queue, (_DONE, None), abort)
+
+
+def _map_chunk_streams_ordered(
+    func: Callable[[MapChunksInTypeVar], Iterable[MapChunksOutTypeVar]],
+    chunk_iterator: Iterator[MapChunksInTypeVar],
+    executor: ThreadPoolExecutor,
+    max_workers: int,
+    buffer_size: int,
+    abort: Event,
+) -> Generator[MapChunksOutTypeVar, None, None]:
+    in_flight: Deque["Queue[Tuple[int, Any]]"] = deque()
+    while True:
+        while len(in_flight) < max_workers:
+            chunk = next(chunk_iterator, _END)
+            if chunk is _END:
+                break
+            queue: "Queue[Tuple[int, Any]]" = Queue(buffer_size)
+            executor.submit(_produce, func, chunk, queue, abort)  # type: ignore[arg-type]
+            in_flight.append(queue)
+
+        if not in_flight:
+            return
+
+        queue = in_flight[0]
+        while True:
+            kind, value = queue.get()
+            if kind == _ITEM:
+                yield value
+            elif kind == _ERROR:
+                raise value
+            else:
+                break
+        in_flight.popleft()
+
+
+def _map_chunk_streams_as_completed(
+    func: Callable[[MapChunksInTypeVar], Iterable[MapChunksOutTypeVar]],
+    chunk_iterator: Iterator[MapChunksInTypeVar],
+    executor: ThreadPoolExecutor,
+    max_workers: int,
+    buffer_size: int,
+    abort: Event,
+) -> Generator[MapChunksOutTypeVar, None, None]:
+    queue: "Queue[Tuple[int, Any]]" = Queue(buffer_size)
+    running = 0
+    while True:
+        while running < max_workers:
+            chunk = next(chunk_iterator, _END)
+            if chunk is _END:
+                break
+            executor.submit(_produce, func, chunk, queue, abort)  # type: ignore[arg-type]
+            running += 1
+
+        if running == 0:
+            return
+
+        kind, value = queue.get()
+        if kind == _ITEM:
+            yield value
+        elif kind == _ERROR:
+            raise value
+        else:
+            running -= 1
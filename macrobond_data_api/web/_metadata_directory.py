@@ -1,17 +1,23 @@
+import os
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from threading import Event, RLock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
-from json import load as json_load
+from json import load as json_load, dump as json_dump
 
-from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601_fast
 
 from ..common.enums import MetadataAttributeType
 from .web_types.metadata import MetadataAttributeTypeRestriction
 
 from .session import ProblemDetailsException
+from .configuration import Configuration
+from ._split_in_to_chunks import split_in_to_chunks
 
 if TYPE_CHECKING:  # pragma: no cover
     from .session import Session
+    from .web_types.metadata import MetadataAttributeInformationResponse
 
 
 class _MetadataType:
@@ -28,30 +34,47 @@ class _MetadataType:
 
 
 class _MetadataTypeDirectory:
-    __slots__ = ("session",)
+    __slots__ = ("session", "_pending")
 
     session: Optional["Session"]
 
+    _lock = RLock()
     _type_db: Dict[str, Optional[_MetadataType]] = {}
+    _type_db_path: Optional[str] = None
+    _unknown_expires_at: Dict[str, float] = {}
+    _loading: Dict[str, Event] = {}
+    _hits = 0
+    _misses = 0
 
     def __init__(self, session: Optional["Session"]) -> None:
         super().__init__()
         self.session = session
+        self._pending: Dict[str, None] = {}
+
+    def register(self, data: Dict[str, Any]) -> None:
+        """Remember the attribute names of a response, so that their types can be fetched in one request."""
+        type_db = _MetadataTypeDirectory._type_db
+        with _MetadataTypeDirectory._lock:
+            for attribute_name in data:
+                if attribute_name not in type_db:
+                    self._pending[attribute_name] = None
 
     def convert(self, attribute_name: str, obj: Any) -> Any:
-        type_info = _MetadataTypeDirectory._type_db.get(attribute_name)
+        pending: List[str] = []
+        with _MetadataTypeDirectory._lock:
+            is_known = _MetadataTypeDirectory._is_known(attribute_name, monotonic())
+            if is_known:
+                _MetadataTypeDirectory._hits += 1
+            else:
+                _MetadataTypeDirectory._misses += 1
+                self._pending[attribute_name] = None
+                pending = list(self._pending)
+                self._pending.clear()
+
+        if not is_known and self.session is not None:
+            self._fetch(pending)
 
-        if type_info is None and self.session is not None:
-            try:
-                info = self.session.metadata.get_attribute_information(attribute_name)[0]
-                type_info = _MetadataTypeDirectory._type_db[attribute_name] = _MetadataType(
-                    info["valueType"], info.get("valueRestriction")
-                )
-            except ProblemDetailsException as ex:
-                if ex.status == 404:
-                    _MetadataTypeDirectory._type_db[attribute_name] = None
-                else:
-                    raise ex
+        type_info = _MetadataTypeDirectory._type_db.get(attribute_name)
 
         if type_info is not None:
             if type_info.value_type == MetadataAttributeType.INT:
@@ -61,7 +84,7 @@ class _MetadataTypeDirectory:
             if type_info.value_type == MetadataAttributeType.TIME_STAMP:
                 if type_info.value_restriction == MetadataAttributeTypeRestriction.DATE:
                     return datetime(int(obj[0:4]), int(obj[5:7]), int(obj[8:10]))
-                time = _parse_iso8601(obj)
+                time = _parse_iso8601_fast(obj)
                 if time.tzinfo == timezone.utc:
                     time = datetime(
                         time.year,
@@ -81,5 +104,142 @@ class _MetadataTypeDirectory:
                 return json_load(obj)
         return obj
 
+    def _fetch(self, attribute_names: Iterable[str]) -> None:
+        session = self.session
+        if session is None:
+            return
+
+        # Only one thread fetches each attribute, the others wait for it
+        loading = _MetadataTypeDirectory._loading
+        with _MetadataTypeDirectory._lock:
+            names = _MetadataTypeDirectory._unknown_names(attribute_names)
+            wait_for = {loading[x] for x in names if x in loading}
+            names = [x for x in names if x not in loading]
+            event = Event()
+            for name in names:
+                loading[name] = event
+
+        try:
+            for chunk in split_in_to_chunks(names, 100):
+                try:
+                    infos: List[Optional["MetadataAttributeInformationResponse"]] = list(
+                        session.metadata.get_attribute_information(*chunk)
+                    )
+                except ProblemDetailsException as ex:
+                    if ex.status != 404:
+                        raise ex
+                    # At least one of the attributes is unknown, so get them one by one
+                    infos = [self._fetch_one(x) for x in chunk] if len(chunk) > 1 else [None]
+                _MetadataTypeDirectory._add_many(zip(chunk, infos))
+        finally:
+            with _MetadataTypeDirectory._lock:
+                for name in names:
+                    del loading[name]
+            event.set()
+
+        for other in wait_for:
+            other.wait()
+
+    def _fetch_one(self, attribute_name: str) -> Optional["MetadataAttributeInformationResponse"]:
+        if self.session is None:
+            return None
+        try:
+            return self.session.metadata.get_attribute_information(attribute_name)[0]
+        except ProblemDetailsException as ex:
+            if ex.status == 404:
+                return None
+            raise ex
+
+    @staticmethod
+    def _is_known(attribute_name: str, now: float) -> bool:
+        if attribute_name == "Name":
+            return True
+        type_db = _MetadataTypeDirectory._type_db
+        if attribute_name not in type_db:
+            return False
+        if type_db[attribute_name] is None and _MetadataTypeDirectory._unknown_expires_at[attribute_name] <= now:
+            del type_db[attribute_name]
+            del _MetadataTypeDirectory._unknown_expires_at[attribute_name]
+            return False
+        return True
+
+    @staticmethod
+    def _unknown_names(attribute_names: Iterable[str]) -> List[str]:
+        with _MetadataTypeDirectory._lock:
+            _MetadataTypeDirectory._load_type_db()
+            now = monotonic()
+            return [x for x in dict.fromkeys(attribute_names) if not _MetadataTypeDirectory._is_known(x, now)]
+
+    @staticmethod
+    def _add_many(infos: Iterable[Tuple[str, Optional["MetadataAttributeInformationResponse"]]]) -> None:
+        type_db = _MetadataTypeDirectory._type_db
+        unknown_expires_at = _MetadataTypeDirectory._unknown_expires_at
+        with _MetadataTypeDirectory._lock:
+            now = monotonic()
+            for attribute_name, info in infos:
+                type_db.pop(attribute_name, None)
+                if info is not None:
+                    type_db[attribute_name] = _MetadataType(info["valueType"], info.get("valueRestriction"))
+                else:
+                    type_db[attribute_name] = None
+                    unknown_expires_at[attribute_name] = now + Configuration._metadata_unknown_type_ttl
+
+            # Evict the oldest entries, they are fetched again if they are needed
+            while len(type_db) > Configuration._metadata_type_directory_max_size:
+                attribute_name = next(iter(type_db))
+                del type_db[attribute_name]
+                unknown_expires_at.pop(attribute_name, None)
+
+            _MetadataTypeDirectory._save_type_db()
+
+    @staticmethod
+    def _stats() -> Dict[str, int]:
+        with _MetadataTypeDirectory._lock:
+            type_db = _MetadataTypeDirectory._type_db
+            return {
+                "hits": _MetadataTypeDirectory._hits,
+                "misses": _MetadataTypeDirectory._misses,
+                "size": len(type_db),
+                "unknown": sum(1 for x in type_db.values() if x is None),
+            }
+
+    @staticmethod
+    def _load_type_db() -> None:
+        path = Configuration._metadata_type_db_path
+        if path is None or path == _MetadataTypeDirectory._type_db_path:
+            return
+        _MetadataTypeDirectory._type_db_path = path
+        type_db = _MetadataTypeDirectory._type_db
+        for attribute_name, (value_type, value_restriction) in _MetadataTypeDirectory._read_type_db(path).items():
+            if attribute_name not in type_db:
+                type_db[attribute_name] = _MetadataType(
+                    MetadataAttributeType(value_type),
+                    MetadataAttributeTypeRestriction(value_restriction) if value_restriction is not None else None,
+                )
+
+    @staticmethod
+    def _save_type_db() -> None:
+        path = Configuration._metadata_type_db_path
+        if path is None:
+            return
+        # Merge with the file, it can have been updated by another process
+        data = _MetadataTypeDirectory._read_type_db(path)
+        for attribute_name, type_info in _MetadataTypeDirectory._type_db.items():
+            if type_info is not None:
+                data[attribute_name] = (type_info.value_type, type_info.value_restriction)
+        temp_path = path + "." + str(os.getpid()) + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json_dump(data, f)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _read_type_db(path: str) -> Dict[str, Tuple[int, Optional[int]]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json_load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
     def close(self) -> None:
         self.session = None
@@ -0,0 +1,36 @@
+from datetime import timezone
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601_many
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy.typing import NDArray
+    from numpy import float64, datetime64
+
+
+def _has_time_zone(date: str) -> bool:
+    return len(date) > 10 and (date[-1] == "Z" or date.find("+", 10) != -1 or date.find("-", 10) != -1)
+
+
+def _values_to_array(values: List[Optional[float]]) -> "NDArray[float64]":
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    # None is converted to NaN by numpy when the dtype is float64
+    return numpy.array(values, dtype=numpy.float64)
+
+
+def _dates_to_array(dates: List[str]) -> "NDArray[datetime64]":
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    if not any(_has_time_zone(x) for x in dates):
+        try:
+            return numpy.array(dates, dtype="datetime64[ns]")
+        except ValueError:
+            ...
+
+    # datetime64 has no time zone, so convert to UTC
+    parsed: List[Any] = [
+        x.astimezone(timezone.utc).replace(tzinfo=None) if x.tzinfo is not None else x
+        for x in _parse_iso8601_many(dates)
+    ]
+    return numpy.array(parsed, dtype="datetime64[ns]")
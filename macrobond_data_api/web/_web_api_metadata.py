@@ -12,6 +12,20 @@ from .session import ProblemDetailsException
 
 if TYPE_CHECKING:  # pragma: no cover
     from .web_api import WebApi
+    from .web_types.metadata import MetadataAttributeInformationResponse
+
+
+def _create_attribute_information(x: "MetadataAttributeInformationResponse") -> MetadataAttributeInformation:
+    return MetadataAttributeInformation(
+        x["name"],
+        x["description"],
+        x.get("comment"),
+        x["valueType"],
+        x["usesValueList"],
+        x["canListValues"],
+        x["canHaveMultipleValues"],
+        x["isDatabaseEntity"],
+    )
 
 
 def metadata_list_values(self: "WebApi", name: str) -> MetadataValueInformation:
@@ -26,19 +40,7 @@ def metadata_list_values(self: "WebApi", name: str) -> MetadataValueInformation:
 
 def metadata_get_attribute_information(self: "WebApi", *name: str) -> Sequence[MetadataAttributeInformation]:
     return _ReprHtmlSequence(
-        [
-            MetadataAttributeInformation(
-                x["name"],
-                x["description"],
-                x.get("comment"),
-                x["valueType"],
-                x["usesValueList"],
-                x["canListValues"],
-                x["canHaveMultipleValues"],
-                x["isDatabaseEntity"],
-            )
-            for x in self.session.metadata.get_attribute_information(*name)
-        ]
+        [_create_attribute_information(x) for x in self.session.metadata.get_attribute_information(*name)]
     )
 
 
@@ -1,7 +1,6 @@
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, cast
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Union, cast
 
-import ijson
 
 from macrobond_data_api.common.types import (
     RevisionInfo,
@@ -16,9 +15,11 @@ from macrobond_data_api.common.types import (
     ValuesMetadata,
 )
 from macrobond_data_api.common.enums import StatusCode
-from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+from macrobond_data_api.common.types._parse_iso8601 import _Iso8601Memo, _parse_iso8601_fast, _parse_iso8601_many
 from macrobond_data_api.common.types._repr_html_sequence import _ReprHtmlSequence
+from ._map_chunks import map_chunk_streams
 from ._split_in_to_chunks import split_in_to_chunks
+from ._numpy_arrays import _dates_to_array, _values_to_array
 
 from .session import ProblemDetailsException, Session
 
@@ -31,43 +32,48 @@ if TYPE_CHECKING:  # pragma: no cover
         RevisionHistoryRequest as WebRevisionHistoryRequest,
         SeriesWithTimesOfChangeResponse,
         VintageValuesResponse,
+        SeriesObservationHistoryResponse,
     )
+    from .async_session import AsyncSession
+
+    _AnySession = Union[Session, AsyncSession]
 
 
 def _optional_str_to_datetime(datetime_str: Optional[str]) -> Optional[datetime]:
-    return _parse_iso8601(datetime_str) if datetime_str else None
+    return _parse_iso8601_fast(datetime_str) if datetime_str else None
 
 
-def get_revision_info(self: "WebApi", *series_names: str, raise_error: Optional[bool] = None) -> Sequence[RevisionInfo]:
-    def to_obj(name: str, serie: "SeriesWithRevisionsInfoResponse") -> RevisionInfo:
-        error_text = serie.get("errorText")
-        if error_text:
-            return RevisionInfo(name, error_text, False, False, None, None, [])
+def _create_revision_info(name: str, serie: "SeriesWithRevisionsInfoResponse") -> RevisionInfo:
+    error_text = serie.get("errorText")
+    if error_text:
+        return RevisionInfo(name, error_text, False, False, None, None, [])
 
-        time_stamp_of_first_revision = _optional_str_to_datetime(serie.get("timeStampOfFirstRevision"))
+    time_stamp_of_first_revision = _optional_str_to_datetime(serie.get("timeStampOfFirstRevision"))
 
-        time_stamp_of_last_revision = _optional_str_to_datetime(serie.get("timeStampOfLastRevision"))
+    time_stamp_of_last_revision = _optional_str_to_datetime(serie.get("timeStampOfLastRevision"))
 
-        stores_revisions = serie["storesRevisions"]
+    stores_revisions = serie["storesRevisions"]
 
-        vintage_time_stamps = [_parse_iso8601(x) for x in serie["vintageTimeStamps"]] if stores_revisions else []
+    vintage_time_stamps = _parse_iso8601_many(serie["vintageTimeStamps"]) if stores_revisions else []
+
+    return RevisionInfo(
+        name,
+        "",
+        stores_revisions,
+        serie["hasRevisions"],
+        time_stamp_of_first_revision,
+        time_stamp_of_last_revision,
+        vintage_time_stamps,
+    )
 
-        return RevisionInfo(
-            name,
-            "",
-            stores_revisions,
-            serie["hasRevisions"],
-            time_stamp_of_first_revision,
-            time_stamp_of_last_revision,
-            vintage_time_stamps,
-        )
 
+def get_revision_info(self: "WebApi", *series_names: str, raise_error: Optional[bool] = None) -> Sequence[RevisionInfo]:
     response = self.session.series.get_revision_info(*series_names)
 
     if self.raise_error if raise_error is None else raise_error:
         GetEntitiesError._raise_if([(x, y.get("errorText")) for x, y in zip(series_names, response)])
 
-    return _ReprHtmlSequence([to_obj(x, y) for x, y in zip(series_names, response)])
+    return _ReprHtmlSequence([_create_revision_info(x, y) for x, y in zip(series_names, response)])
 
 
 def get_one_vintage_series(
@@ -82,49 +88,62 @@ def get_one_vintage_series(
     )[0]
 
 
-def get_vintage_series(
-    self: "WebApi",
-    time: datetime,
-    series_names: Sequence[str],
-    include_times_of_change: bool = False,
-    raise_error: Optional[bool] = None,
-) -> Sequence[VintageSeries]:
-    def to_obj(response: "VintageSeriesResponse", series_name: str) -> VintageSeries:
-        error_message = response.get("errorText")
-        if error_message:
-            return VintageSeries(
-                series_name, error_message, StatusCode(cast(int, response["errorCode"])), None, None, None, None, None
-            )
+def _create_vintage_series(
+    response: "VintageSeriesResponse",
+    series_name: str,
+    session: "_AnySession",
+    include_times_of_change: bool,
+    use_numpy_arrays: bool,
+) -> VintageSeries:
+    error_message = response.get("errorText")
+    if error_message:
+        return VintageSeries(
+            series_name, error_message, StatusCode(cast(int, response["errorCode"])), None, None, None, None, None
+        )
 
-        metadata = self.session._create_metadata(response["metadata"])
+    metadata = session._create_metadata(response["metadata"])
 
+    if use_numpy_arrays:
+        values = cast(List[Optional[float]], _values_to_array(cast(List[Optional[float]], response["values"])))
+        dates = cast(List[datetime], _dates_to_array(cast(List[str], response["dates"])))
+    else:
         values = [float(x) if x is not None else x for x in cast(List[Optional[int]], response["values"])]
-        dates = [_parse_iso8601(x) for x in cast(List[str], response["dates"])]
-
-        if include_times_of_change:
-            times_of_change = response.get("timesOfChange")
-            if times_of_change:
-                values_metadata = [
-                    {"RevisionTimeStamp": _optional_str_to_datetime(x)} for x in cast(List[str], times_of_change)
-                ]
-            else:
-                values_metadata = [{}] * len(values)
+        dates = _parse_iso8601_many(cast(List[str], response["dates"]))
+
+    if include_times_of_change:
+        times_of_change = response.get("timesOfChange")
+        if times_of_change:
+            memo = _Iso8601Memo()
+            values_metadata = [
+                {"RevisionTimeStamp": memo.parse(x) if x else None} for x in cast(List[str], times_of_change)
+            ]
         else:
-            values_metadata = None
+            values_metadata = [{}] * len(values)
+    else:
+        values_metadata = None
 
-        vintage_time_stamp = (
-            _parse_iso8601(cast(str, response["vintageTimeStamp"])) if "vintageTimeStamp" in response else None
-        )
+    vintage_time_stamp = (
+        _parse_iso8601_fast(cast(str, response["vintageTimeStamp"])) if "vintageTimeStamp" in response else None
+    )
+
+    return VintageSeries(series_name, None, StatusCode.OK, metadata, values_metadata, values, dates, vintage_time_stamp)
 
-        return VintageSeries(
-            series_name, None, StatusCode.OK, metadata, values_metadata, values, dates, vintage_time_stamp
-        )
 
+def get_vintage_series(
+    self: "WebApi",
+    time: datetime,
+    series_names: Sequence[str],
+    include_times_of_change: bool = False,
+    raise_error: Optional[bool] = None,
+) -> Sequence[VintageSeries]:
     response = self.session.series.fetch_vintage_series(
         time, *series_names, get_times_of_change=include_times_of_change
     )
 
-    series = [to_obj(x, y) for x, y in zip(response, series_names)]
+    series = [
+        _create_vintage_series(x, y, self.session, include_times_of_change, self.use_numpy_arrays)
+        for x, y in zip(response, series_names)
+    ]
 
     if self.raise_error if raise_error is None else raise_error:
         GetEntitiesError._raise_if([(x, y.error_message) for x, y in zip(series_names, series)])
@@ -144,6 +163,40 @@ def get_one_nth_release(
     )[0]
 
 
+def _create_nth_release(
+    response: "SeriesWithTimesOfChangeResponse",
+    name: str,
+    session: "_AnySession",
+    include_times_of_change: bool,
+    use_numpy_arrays: bool,
+) -> Series:
+    error_text = response.get("errorText")
+
+    if error_text:
+        return Series(name, error_text, StatusCode(cast(int, response["errorCode"])), None, None, None, None)
+
+    if use_numpy_arrays:
+        dates = cast(List[datetime], _dates_to_array(cast(List[str], response["dates"])))
+        values = cast(List[Optional[float]], _values_to_array(cast(List[Optional[float]], response["values"])))
+    else:
+        dates = _parse_iso8601_many(cast(List[str], response["dates"]))
+        values = [float(x) if x is not None else x for x in cast(List[Optional[int]], response["values"])]
+    metadata = session._create_metadata(response["metadata"])
+    if include_times_of_change:
+        times_of_change = response.get("timesOfChange")
+        if not times_of_change or (len(values) != 0 and _optional_str_to_datetime(times_of_change[0]) is None):
+            values_metadata: Optional[ValuesMetadata] = [{}] * len(values)
+        else:
+            memo = _Iso8601Memo()
+            values_metadata = [
+                {"RevisionTimeStamp": memo.parse(x)} if x else {} for x in cast(List[str], times_of_change)
+            ]
+    else:
+        values_metadata = None
+
+    return Series(name, "", StatusCode.OK, cast(Dict[str, Any], metadata), values_metadata, values, dates)
+
+
 def get_nth_release(
     self: "WebApi",
     nth: int,
@@ -151,28 +204,6 @@ def get_nth_release(
     include_times_of_change: bool = False,
     raise_error: Optional[bool] = None,
 ) -> Sequence[Series]:
-    def to_obj(response: "SeriesWithTimesOfChangeResponse", name: str, session: Session) -> Series:
-        error_text = response.get("errorText")
-
-        if error_text:
-            return Series(name, error_text, StatusCode(cast(int, response["errorCode"])), None, None, None, None)
-
-        dates = [_parse_iso8601(x) for x in cast(List[str], response["dates"])]
-        values = [float(x) if x is not None else x for x in cast(List[Optional[int]], response["values"])]
-        metadata = session._create_metadata(response["metadata"])
-        if include_times_of_change:
-            times_of_change = response.get("timesOfChange")
-            if not times_of_change or (len(values) != 0 and _optional_str_to_datetime(times_of_change[0]) is None):
-                values_metadata: Optional[ValuesMetadata] = [{}] * len(values)
-            else:
-                values_metadata = [
-                    {"RevisionTimeStamp": _parse_iso8601(x)} if x else {} for x in cast(List[str], times_of_change)
-                ]
-        else:
-            values_metadata = None
-
-        return Series(name, "", StatusCode.OK, cast(Dict[str, Any], metadata), values_metadata, values, dates)
-
     if len(series_names) == 0:
         raise ValueError("No series names")
 
@@ -180,7 +211,10 @@ def get_nth_release(
         nth, *series_names, get_times_of_change=include_times_of_change
     )
 
-    series = [to_obj(x, y, self.session) for x, y in zip(response, series_names)]
+    series = [
+        _create_nth_release(x, y, self.session, include_times_of_change, self.use_numpy_arrays)
+        for x, y in zip(response, series_names)
+    ]
 
     if self.raise_error if raise_error is None else raise_error:
         GetEntitiesError._raise_if([(x, y.error_message) for x, y in zip(series_names, series)])
@@ -188,24 +222,27 @@ def get_nth_release(
     return _ReprHtmlSequence(series)
 
 
-def get_all_vintage_series(self: "WebApi", series_name: str) -> GetAllVintageSeriesResult:
-    def to_obj(response: "VintageSeriesResponse", series_name: str) -> VintageSeries:
-        error_message = response.get("errorText")
-        if error_message:
-            return VintageSeries(
-                series_name, error_message, StatusCode(cast(int, response["errorCode"])), None, None, None, None, None
-            )
-
-        metadata = self.session._create_metadata(response["metadata"])
-        values = [float(x) if x is not None else x for x in cast(List[Optional[int]], response["values"])]
-        dates = [_parse_iso8601(x) for x in cast(List[str], response["dates"])]
-
-        vintage_time_stamp = (
-            _parse_iso8601(cast(str, response["vintageTimeStamp"])) if "vintageTimeStamp" in response else None
+def _create_all_vintage_series(
+    response: "VintageSeriesResponse", series_name: str, session: "_AnySession"
+) -> VintageSeries:
+    error_message = response.get("errorText")
+    if error_message:
+        return VintageSeries(
+            series_name, error_message, StatusCode(cast(int, response["errorCode"])), None, None, None, None, None
         )
 
-        return VintageSeries(series_name, None, StatusCode.OK, metadata, None, values, dates, vintage_time_stamp)
+    metadata = session._create_metadata(response["metadata"])
+    values = [float(x) if x is not None else x for x in cast(List[Optional[int]], response["values"])]
+    dates = _parse_iso8601_many(cast(List[str], response["dates"]))
 
+    vintage_time_stamp = (
+        _parse_iso8601_fast(cast(str, response["vintageTimeStamp"])) if "vintageTimeStamp" in response else None
+    )
+
+    return VintageSeries(series_name, None, StatusCode.OK, metadata, None, values, dates, vintage_time_stamp)
+
+
+def get_all_vintage_series(self: "WebApi", series_name: str) -> GetAllVintageSeriesResult:
     try:
         response = self.session.series.get_fetch_all_vintage_series(series_name)
     except ProblemDetailsException as ex:
@@ -213,7 +250,17 @@ def get_all_vintage_series(self: "WebApi", series_name: str) -> GetAllVintageSer
             raise ValueError("Series not found: " + series_name) from ex
         raise ex
 
-    return GetAllVintageSeriesResult([to_obj(x, series_name) for x in response], series_name)
+    return GetAllVintageSeriesResult(
+        [_create_all_vintage_series(x, series_name, self.session) for x in response], series_name
+    )
+
+
+def _create_observation_history(response: "SeriesObservationHistoryResponse") -> SeriesObservationHistory:
+    return SeriesObservationHistory(
+        _parse_iso8601_fast(response["observationDate"]),
+        [float(y) if y is not None else y for y in response["values"]],
+        [_optional_str_to_datetime(y) for y in response["timeStamps"]],
+    )
 
 
 def get_observation_history(self: "WebApi", series_name: str, *times: datetime) -> Sequence[SeriesObservationHistory]:
@@ -224,21 +271,12 @@ def get_observation_history(self: "WebApi", series_name: str, *times: datetime)
             raise Exception(ex.detail) from ex
         raise ex
 
-    return _ReprHtmlSequence(
-        [
-            SeriesObservationHistory(
-                _parse_iso8601(x["observationDate"]),
-                [float(y) if y is not None else y for y in x["values"]],
-                [_optional_str_to_datetime(y) for y in x["timeStamps"]],
-            )
-            for x in response
-        ]
-    )
+    return _ReprHtmlSequence([_create_observation_history(x) for x in response])
 
 
 def _create_vintage_values(vintage_values: "VintageValuesResponse") -> VintageValues:
     _vintage_time_stamp = vintage_values.get("vintageTimeStamp")
-    vintage_time_stamp = _parse_iso8601(_vintage_time_stamp) if _vintage_time_stamp else None
+    vintage_time_stamp = _parse_iso8601_fast(_vintage_time_stamp) if _vintage_time_stamp else None
 
     dates = [datetime(int(x[0:4]), int(x[5:7]), int(x[8:10])) for x in vintage_values["dates"]]
 
@@ -247,6 +285,18 @@ def _create_vintage_values(vintage_values: "VintageValuesResponse") -> VintageVa
     return VintageValues(vintage_time_stamp, dates, values)
 
 
+def _create_series_with_vintages(
+    item: "SeriesWithVintagesResponse", status_code: StatusCode, session: "_AnySession"
+) -> SeriesWithVintages:
+    _metadata = item.get("metadata")
+    metadata = session._create_metadata(_metadata) if _metadata else None
+
+    _vintages = item.get("vintages")
+    vintages = [_create_vintage_values(x) for x in _vintages] if _vintages else []
+
+    return SeriesWithVintages(item.get("errorText"), status_code, metadata, vintages)
+
+
 def _create_web_revision_h_request(requests: Sequence[RevisionHistoryRequest]) -> List["WebRevisionHistoryRequest"]:
     return [
         {
@@ -262,28 +312,56 @@ def _create_web_revision_h_request(requests: Sequence[RevisionHistoryRequest]) -
 
 
 def get_many_series_with_revisions(
-    self: "WebApi", requests: Sequence[RevisionHistoryRequest], include_not_modified: bool = False
+    self: "WebApi",
+    requests: Sequence[RevisionHistoryRequest],
+    include_not_modified: bool = False,
+    max_workers: int = 1,
+    preserve_order: bool = True,
+    buffer_size: int = 100,
 ) -> Generator[SeriesWithVintages, None, None]:
-    if len(requests) == 0:
-        yield from ()
-    for requests_chunkd in split_in_to_chunks(requests, 200):
-        with self.session.series.post_fetch_all_vintage_series(
-            _create_web_revision_h_request(requests_chunkd), stream=True
+    """
+    Download all revisions for one or more series. The series are requested in chunks of 200.
+
+    Parameters
+    ----------
+    requests: `Sequence[macrobond_data_api.common.types.revision_history_request.RevisionHistoryRequest]`
+        A sequence of series requests.
+    include_not_modified: `bool`
+        Set this value to True in order to include NotModified series.
+    max_workers: `int`
+        The maximum number of chunks downloaded at the same time.
+        The default value of 1 requests the chunks one after another.
+    preserve_order: `bool`
+        If True, the series are returned in the same order as in the request.
+        If False, the series are returned as soon as they are received from any of the chunks.
+        This has no effect when max_workers is 1.
+    buffer_size: `int`
+        The number of received series that are kept before the download waits for the series to be consumed.
+        If preserve_order is True, each of the max_workers chunks has a buffer of this size.
+        If preserve_order is False, all chunks share one buffer of this size.
+        This has no effect when max_workers is 1.
+
+    Returns
+    -------
+    `Generator[macrobond_data_api.common.types.series_with_vintages.SeriesWithVintages]`
+    """
+    session = self.session
+
+    def stream_chunk(chunk: Sequence[RevisionHistoryRequest]) -> Generator[SeriesWithVintages, None, None]:
+        with session.series.post_fetch_all_vintage_series(
+            _create_web_revision_h_request(chunk), stream=True
         ) as response:
-            self.session.raise_on_error(response)
-            ijson_items = ijson.items(self.session._response_to_file_object(response), "item")
+            session.raise_on_error(response)
             item: "SeriesWithVintagesResponse"
-            for item in ijson_items:
+            for item in session._ijson_items(response, "item"):
                 error_code = item.get("errorCode")
                 status_code = StatusCode(error_code) if error_code else StatusCode.OK
 
                 if not include_not_modified and status_code == StatusCode.NOT_MODIFIED:
                     continue
 
-                _metadata = item.get("metadata")
-                metadata = self.session._create_metadata(_metadata) if _metadata else None
+                yield _create_series_with_vintages(item, status_code, session)
 
-                _vintages = item.get("vintages")
-                vintages = [_create_vintage_values(x) for x in _vintages] if _vintages else []
-
-                yield SeriesWithVintages(item.get("errorText"), status_code, metadata, vintages)
+    yield from map_chunk_streams(
+        stream_chunk, split_in_to_chunks(requests, 200), max_workers, preserve_order, buffer_size
+    )
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from macrobond_data_api.common.types import SearchResult
 
@@ -13,9 +13,9 @@ __pdoc__ = {
 }
 
 
-def entity_search_multi_filter(
-    self: "WebApi", *filters: "SearchFilter", include_discontinued: bool = False, no_metadata: bool = False
-) -> SearchResult:
+def _create_search_request(
+    filters: Sequence["SearchFilter"], include_discontinued: bool, no_metadata: bool
+) -> "SearchRequest":
     def convert_filter_to_web_filter(_filter: "SearchFilter") -> "WebSearchFilter":
         return {
             "text": _filter.text,
@@ -26,12 +26,18 @@ def entity_search_multi_filter(
             "mustNotHaveAttributes": list(_filter.must_not_have_attributes),
         }
 
-    request: "SearchRequest" = {
+    return {
         "filters": [convert_filter_to_web_filter(x) for x in filters],
         "includeDiscontinued": include_discontinued,
         "noMetadata": no_metadata,
     }
 
+
+def entity_search_multi_filter(
+    self: "WebApi", *filters: "SearchFilter", include_discontinued: bool = False, no_metadata: bool = False
+) -> SearchResult:
+    request = _create_search_request(filters, include_discontinued, no_metadata)
+
     response = self.session.search.post_entities(request)
     results = [self.session._create_metadata(x) for x in response["results"]]
     return SearchResult(results, response.get("isTruncated") is True)
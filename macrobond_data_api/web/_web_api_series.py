@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Tuple, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, cast
+
+import ijson
 
 from macrobond_data_api.common.types._repr_html_sequence import _ReprHtmlSequence
-from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601_many
 
 from macrobond_data_api.common.enums import SeriesWeekdays, SeriesFrequency, CalendarMergeMode, StatusCode
 from macrobond_data_api.common.types import (
@@ -15,17 +17,24 @@ from macrobond_data_api.common.types import (
     SeriesEntry,
 )
 
-from .session import Session
 from ._split_in_to_chunks import split_in_to_chunks
+from ._map_chunks import map_chunks
+from ._numpy_arrays import _dates_to_array, _values_to_array
 
 if TYPE_CHECKING:  # pragma: no cover
+    from requests import Response
+
     from .web_api import WebApi
+    from .session import Session
+    from .async_session import AsyncSession
 
     from macrobond_data_api.common.types import StartOrEndPoint
 
     from .web_types import UnifiedSeriesRequest, UnifiedSeriesEntry, EntityRequest
 
-    from .web_types import SeriesResponse, EntityResponse
+    from .web_types import SeriesResponse, EntityResponse, UnifiedSeriesResponse, ValuesResponse
+
+    _AnySession = Union[Session, AsyncSession]
 
 
 __pdoc__ = {
@@ -33,7 +42,7 @@ __pdoc__ = {
 }
 
 
-def _create_entity(response: "EntityResponse", name: str, session: Session) -> Entity:
+def _create_entity(response: "EntityResponse", name: str, session: "_AnySession") -> Entity:
     error_text = response.get("errorText")
 
     if error_text:
@@ -44,15 +53,20 @@ def _create_entity(response: "EntityResponse", name: str, session: Session) -> E
     return Entity(name, None, StatusCode.OK, cast(Dict[str, Any], metadata))
 
 
-def _create_series(response: "SeriesResponse", name: str, session: Session) -> Series:
+def _create_series(
+    response: "SeriesResponse", name: str, session: "_AnySession", use_numpy_arrays: bool = False
+) -> Series:
     error_text = response.get("errorText")
 
     if error_text:
         return Series(name, error_text, StatusCode(cast(int, response["errorCode"])), None, None, None, None)
 
-    dates = [_parse_iso8601(x) for x in cast(List[str], response["dates"])]
-
-    values = [float(x) if x is not None else x for x in cast(List[Optional[float]], response["values"])]
+    if use_numpy_arrays:
+        dates = cast(List[datetime], _dates_to_array(cast(List[str], response["dates"])))
+        values = cast(List[Optional[float]], _values_to_array(cast(List[Optional[float]], response["values"])))
+    else:
+        dates = _parse_iso8601_many(cast(List[str], response["dates"]))
+        values = [float(x) if x is not None else x for x in cast(List[Optional[float]], response["values"])]
 
     metadata = session._create_metadata(response["metadata"])
 
@@ -64,9 +78,17 @@ def get_one_series(self: "WebApi", series_name: str, raise_error: Optional[bool]
     return self.get_series([series_name], raise_error=raise_error)[0]
 
 
+def _iter_items(session: "Session", response: "Response") -> Iterator[Any]:
+    """Decode the items of a JSON array one at a time as they are received."""
+    return session._ijson_items(response, "item", use_float=True)
+
+
 def get_series(self: "WebApi", series_names: Sequence[str], raise_error: Optional[bool] = None) -> Sequence[Series]:
-    response = self.session.series.get_fetch_series(*series_names)
-    series = [_create_series(x, y, self.session) for x, y in zip(response, series_names)]
+    with self.session.series.get_fetch_series_stream(*series_names) as response:
+        series = [
+            _create_series(x, y, self.session, self.use_numpy_arrays)
+            for x, y in zip(_iter_items(self.session, response), series_names)
+        ]
     if self.raise_error if raise_error is None else raise_error:
         GetEntitiesError._raise_if([(x, y.error_message) for x, y in zip(series_names, series)])
     return _ReprHtmlSequence(series)
@@ -84,42 +106,84 @@ def get_entities(self: "WebApi", entity_names: Sequence[str], raise_error: Optio
     return _ReprHtmlSequence(entitys)
 
 
+def _series_as_tuples(
+    series: Sequence[Union[str, Tuple[str, Optional[datetime]]]],
+) -> List[Tuple[str, Optional[datetime]]]:
+    series_as_tuple: List[Tuple[str, Optional[datetime]]] = [(x, None) if isinstance(x, str) else x for x in series]
+
+    names = {x[0] for x in series_as_tuple}
+    if len(names) != len(series_as_tuple):
+        raise ValueError("duplicate of series")
+
+    return series_as_tuple
+
+
+def _create_entity_requests(chunk: Sequence[Tuple[str, Optional[datetime]]]) -> List["EntityRequest"]:
+    return [{"name": x[0], "ifModifiedSince": x[1].isoformat() if x[1] else None} for x in chunk]
+
+
 def get_many_series(
-    self: "WebApi", series: Sequence[Union[str, Tuple[str, Optional[datetime]]]], include_not_modified: bool = False
+    self: "WebApi",
+    series: Sequence[Union[str, Tuple[str, Optional[datetime]]]],
+    include_not_modified: bool = False,
+    max_workers: int = 1,
+    preserve_order: bool = True,
 ) -> Generator[Series, None, None]:
+    """
+    Download one or more series. The series are requested in chunks of 200.
+
+    Parameters
+    ----------
+    series: `Sequence[Union[str, Tuple[str, Optional[datetime]]]]`
+        A sequence of series names or a sequence of name plus a timestamp for the last modification.
+    include_not_modified: `bool`
+        Set this value to True in order to include NotModified series.
+    max_workers: `int`
+        The maximum number of chunk requests in flight at the same time.
+        The default value of 1 requests the chunks one after another.
+    preserve_order: `bool`
+        If True, the series are returned in the same order as in the request.
+        If False, the series of a chunk are returned as soon as the chunk is downloaded.
+        This has no effect when max_workers is 1.
+
+    Returns
+    -------
+    `Generator[Optional[macrobond_data_api.common.types.series.Series]]`
+    """
     if len(series) == 0:
         yield from ()
 
-    series_as_tuple: List[Tuple[str, Optional[datetime]]] = [(x, None) if isinstance(x, str) else x for x in series]
+    series_as_tuple = _series_as_tuples(series)
 
-    names = {x[0] for x in series_as_tuple}
+    session = self.session
+    use_numpy_arrays = self.use_numpy_arrays
 
-    if len(names) != len(series_as_tuple):
-        raise ValueError("duplicate of series")
+    def stream_chunk(chunk: Sequence[Tuple[str, Optional[datetime]]]) -> Generator[Series, None, None]:
+        requests = _create_entity_requests(chunk)
+        with session.series.post_fetch_series_stream(*requests) as response:
+            for item, request in zip(_iter_items(session, response), requests):
+                yield _create_series(item, request["name"], session, use_numpy_arrays)
 
-    for chunk in split_in_to_chunks(series_as_tuple, 200):
-        requests: List["EntityRequest"] = [
-            {"name": x[0], "ifModifiedSince": x[1].isoformat() if x[1] else None} for x in chunk
-        ]
-        response_list = self.session.series.post_fetch_series(*requests)
-        for response, request in zip(response_list, requests):
-            ret = _create_series(response, request["name"], self.session)
+    def fetch_chunk(chunk: Sequence[Tuple[str, Optional[datetime]]]) -> Iterable[Series]:
+        # One chunk after another is decoded while it is received, workers have to read the whole chunk
+        return stream_chunk(chunk) if max_workers == 1 else list(stream_chunk(chunk))
+
+    for series_chunk in map_chunks(fetch_chunk, split_in_to_chunks(series_as_tuple, 200), max_workers, preserve_order):
+        for ret in series_chunk:
             if ret.status_code == StatusCode.NOT_MODIFIED and not include_not_modified:
                 continue
             yield ret
 
 
-def get_unified_series(
-    self: "WebApi",
-    *series_entries: Union[SeriesEntry, str],
-    frequency: SeriesFrequency = SeriesFrequency.HIGHEST,
-    weekdays: SeriesWeekdays = SeriesWeekdays.FULL_WEEK,
-    calendar_merge_mode: CalendarMergeMode = CalendarMergeMode.AVAILABLE_IN_ANY,
-    currency: str = "",
-    start_point: Optional["StartOrEndPoint"] = None,
-    end_point: Optional["StartOrEndPoint"] = None,
-    raise_error: Optional[bool] = None
-) -> UnifiedSeriesList:
+def _create_unified_series_request(
+    series_entries: Sequence[Union[SeriesEntry, str]],
+    frequency: SeriesFrequency,
+    weekdays: SeriesWeekdays,
+    calendar_merge_mode: CalendarMergeMode,
+    currency: str,
+    start_point: Optional["StartOrEndPoint"],
+    end_point: Optional["StartOrEndPoint"],
+) -> "UnifiedSeriesRequest":
     def convert_to_unified_series_entry(entry_or_name: Union[SeriesEntry, str]) -> "UnifiedSeriesEntry":
         if isinstance(entry_or_name, str):
             entry_or_name = SeriesEntry(entry_or_name)
@@ -151,31 +215,89 @@ def get_unified_series(
         request["endPoint"] = end_point.time
         request["endDateMode"] = end_point.mode
 
-    response = self.session.series.fetch_unified_series(request)
+    return request
 
-    str_dates = response.get("dates")
 
-    dates = [_parse_iso8601(x) for x in str_dates] if str_dates else []
+def _create_unified_series(one_series: "ValuesResponse", name: str, session: "_AnySession") -> UnifiedSeries:
+    error_text = one_series.get("errorText")
 
-    series: List[UnifiedSeries] = []
-    for i, one_series in enumerate(response["series"]):
-        name = request["seriesEntries"][i]["name"]
-        error_text = one_series.get("errorText")
+    if error_text:
+        return UnifiedSeries(name, error_text, {}, [])
 
-        if error_text:
-            series.append(UnifiedSeries(name, error_text, {}, []))
-        else:
-            values = [float(x) if x is not None else x for x in cast(List[Optional[float]], one_series["values"])]
+    values = [float(x) if x is not None else x for x in cast(List[Optional[float]], one_series["values"])]
 
-            metadata = self.session._create_metadata(one_series["metadata"])
+    metadata = session._create_metadata(one_series["metadata"])
 
-            series.append(UnifiedSeries(name, "", metadata, values))
+    return UnifiedSeries(name, "", metadata, values)
+
+
+def _to_unified_series_list(
+    series: List[UnifiedSeries], str_dates: Optional[List[str]], raise_error: bool
+) -> UnifiedSeriesList:
+    dates = _parse_iso8601_many(str_dates) if str_dates else []
 
     ret = UnifiedSeriesList(series, dates)
 
-    if self.raise_error if raise_error is None else raise_error:
+    if raise_error:
         errors = [EntityErrorInfo(x, y) for x, y in ret.get_errors().items()]
         if errors:
             raise GetEntitiesError(errors)
 
     return ret
+
+
+def _create_unified_series_list(
+    response: "UnifiedSeriesResponse", request: "UnifiedSeriesRequest", session: "_AnySession", raise_error: bool
+) -> UnifiedSeriesList:
+    series = [
+        _create_unified_series(x, request["seriesEntries"][i]["name"], session)
+        for i, x in enumerate(response["series"])
+    ]
+    return _to_unified_series_list(series, response.get("dates"), raise_error)
+
+
+def _read_unified_series_list(
+    response: "Response", request: "UnifiedSeriesRequest", session: "Session", raise_error: bool
+) -> UnifiedSeriesList:
+    """Decode the series of a unified series response one at a time as they are received."""
+    str_dates: Optional[List[str]] = None
+    series: List[UnifiedSeries] = []
+    builder: Optional[ijson.ObjectBuilder] = None
+
+    for prefix, event, value in session._ijson_parse(response, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "series.item" and event == "end_map":
+                name = request["seriesEntries"][len(series)]["name"]
+                series.append(_create_unified_series(builder.value, name, session))
+                builder = None
+        elif prefix == "series.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "dates" and event == "start_array":
+            str_dates = []
+        elif prefix == "dates.item" and str_dates is not None:
+            str_dates.append(value)
+
+    return _to_unified_series_list(series, str_dates, raise_error)
+
+
+def get_unified_series(
+    self: "WebApi",
+    *series_entries: Union[SeriesEntry, str],
+    frequency: SeriesFrequency = SeriesFrequency.HIGHEST,
+    weekdays: SeriesWeekdays = SeriesWeekdays.FULL_WEEK,
+    calendar_merge_mode: CalendarMergeMode = CalendarMergeMode.AVAILABLE_IN_ANY,
+    currency: str = "",
+    start_point: Optional["StartOrEndPoint"] = None,
+    end_point: Optional["StartOrEndPoint"] = None,
+    raise_error: Optional[bool] = None
+) -> UnifiedSeriesList:
+    request = _create_unified_series_request(
+        series_entries, frequency, weekdays, calendar_merge_mode, currency, start_point, end_point
+    )
+
+    with self.session.series.fetch_unified_series_stream(request) as response:
+        return _read_unified_series_list(
+            response, request, self.session, self.raise_error if raise_error is None else raise_error
+        )
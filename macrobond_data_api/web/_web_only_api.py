@@ -1,12 +1,11 @@
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, List, Optional, Callable, Tuple, Sequence, cast
 
-import ijson
 
 from macrobond_data_api.common.enums import StatusCode, ReleaseEventItemKind
 from macrobond_data_api.common.types import SearchResultLong, Release, ReleaseEvent, GetEntitiesError
 from macrobond_data_api.common.types._repr_html_sequence import _ReprHtmlSequence
-from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+from macrobond_data_api.common.types._parse_iso8601 import _Iso8601Memo, _parse_iso8601_fast
 
 from .web_types.data_package_list_context import DataPackageListContextManager
 from .web_types.data_package_list_state import DataPackageListState
@@ -41,11 +40,11 @@ def _get_data_package_list_iterative_pars_body(
         if prefix == "timeStampForIfModifiedSince":
             if event != "string":
                 raise Exception("bad format: timeStampForIfModifiedSince is not a string")
-            time_stamp_for_if_modified_since = _parse_iso8601(value)
+            time_stamp_for_if_modified_since = _parse_iso8601_fast(value)
         elif prefix == "downloadFullListOnOrAfter":
             if event != "string":
                 raise Exception("bad format: downloadFullListOnOrAfter is not a string")
-            download_full_list_on_or_after = _parse_iso8601(value)
+            download_full_list_on_or_after = _parse_iso8601_fast(value)
         elif prefix == "state":
             if event != "number":
                 raise Exception("bad format: state is not a number")
@@ -66,6 +65,7 @@ def _get_data_package_list_iterative_pars_items(
     name = ""
     modified: Optional[datetime] = None
     items: List[DataPackageListItem] = []
+    memo = _Iso8601Memo()
 
     for prefix, event, value in ijson_parse:
         if event == "end_map":
@@ -89,7 +89,7 @@ def _get_data_package_list_iterative_pars_items(
         elif prefix == "entities.item.modified":
             if event != "string":
                 raise Exception("bad format: entities.item.modified is not a string")
-            modified = _parse_iso8601(value)
+            modified = memo.parse(value)
 
     if len(items) != 0:
         return items_callback(body, items) is not False
@@ -166,7 +166,7 @@ def get_data_package_list_iterative(
         params["ifModifiedSince"] = if_modified_since.isoformat()
 
     with self._session.get_or_raise("v1/series/getdatapackagelist", params=params, stream=True) as response:
-        ijson_parse = ijson.parse(self.session._response_to_file_object(response))
+        ijson_parse = self.session._ijson_parse(response)
 
         (
             time_stamp_for_if_modified_since,
@@ -283,9 +283,9 @@ def subscription_list(self: "WebApi", last_modified: datetime, poll_interval: ti
 
 def _create_release_event(response: "ReleaseEventItem") -> ReleaseEvent:
     return ReleaseEvent(
-        _parse_iso8601(response["expectedReleaseTime"]),
-        _parse_iso8601(response["sourceReleaseTime"]),
-        _parse_iso8601(cast(str, response["referencePeriodDate"])) if "referencePeriodDate" in response else None,
+        _parse_iso8601_fast(response["expectedReleaseTime"]),
+        _parse_iso8601_fast(response["sourceReleaseTime"]),
+        _parse_iso8601_fast(cast(str, response["referencePeriodDate"])) if "referencePeriodDate" in response else None,
         response["comment"] if "comment" in response else None,
         ReleaseEventItemKind(response["kind"]),
     )
@@ -0,0 +1,349 @@
+import asyncio
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Type, TYPE_CHECKING, cast
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from macrobond_data_api.common.types import Metadata
+
+from .web_types import (
+    AsyncMetadataMethods,
+    AsyncSearchMethods,
+    AsyncSeriesMethods,
+    ProblemDetailsException,
+)
+
+from .scope import Scope
+from ._auth_client import _AuthClient
+from .auth_exceptions import AuthFetchTokenException
+from ._metadata_directory import _MetadataTypeDirectory
+from ._metadata import _Metadata
+from ._split_in_to_chunks import split_in_to_chunks
+from .async_transport import AsyncResponse, AsyncTransport
+from .configuration import Configuration
+from .session import _raise_on_error
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .web_types.metadata import MetadataAttributeInformationResponse
+
+__pdoc__ = {
+    "AsyncSession.__init__": False,
+}
+
+
+class _AsyncResponseAsFileObject:
+    def __init__(self, response: AsyncResponse) -> None:
+        self.data = response.iter_bytes()
+
+    async def read(self, n: int) -> bytes:
+        if n == 0:
+            return b""
+        return await anext(self.data, b"")
+
+
+def _to_response(method: str, url: str, response: AsyncResponse, content: bytes) -> Response:
+    ret = Response()
+    ret.status_code = response.status_code
+    ret.headers = CaseInsensitiveDict(response.headers)
+    ret.encoding = get_encoding_from_headers(ret.headers)
+    ret.url = url
+    ret._content = content
+    ret.request = PreparedRequest()
+    ret.request.prepare(method=method, url=url)
+    return ret
+
+
+def _without_none(params: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    return {x: y for x, y in params.items() if y is not None} if params else None
+
+
+class AsyncSession:
+    """
+    The asyncio version of `macrobond_data_api.web.session.Session`.
+
+    The HTTP requests are sent with an `macrobond_data_api.web.async_transport.AsyncTransport`.
+    By default this is a `macrobond_data_api.web.async_transport.HttpxTransport`, which requires httpx.
+
+    Parameters
+    ----------
+    username : str
+        The username of the API user.
+    password : str
+        The password of the API user.
+    *scopes : `macrobond_data_api.web.scope.Scope`
+        The scopes to request.
+    api_url : str
+        The URL of the API.
+    authorization_url : str
+        The URL of the authorization server.
+    transport : `macrobond_data_api.web.async_transport.AsyncTransport`
+        The transport used to send the requests.
+    use_access_token_cache : bool
+        If True, the access token is shared with other sessions using the same credentials.
+    access_token_cache_path : str
+        The path of a file where the access token is shared with other processes on the host.
+    """
+
+    configuration: Type[Configuration] = Configuration
+
+    @property
+    def metadata(self) -> AsyncMetadataMethods:
+        """Metadata operations"""
+        return self.__metadata
+
+    @property
+    def search(self) -> AsyncSearchMethods:
+        """Search for time series and other entites"""
+        return self.__search
+
+    @property
+    def series(self) -> AsyncSeriesMethods:
+        """Time series and entity operations"""
+        return self.__series
+
+    @property
+    def api_url(self) -> str:
+        return self.__api_url
+
+    @property
+    def authorization_url(self) -> str:
+        return self._auth_client.authorization_url
+
+    @property
+    def token_endpoint(self) -> Optional[str]:
+        return self._auth_client.token_endpoint
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        *scopes: Scope,
+        api_url: str = None,
+        authorization_url: str = None,
+        transport: AsyncTransport = None,
+        use_access_token_cache: bool = True,
+        access_token_cache_path: str = None,
+    ) -> None:
+        if api_url is None:
+            api_url = Configuration._default_api_url
+
+        if authorization_url is None:
+            authorization_url = Configuration._default_authorization_url
+
+        if not authorization_url.lower().startswith("https://"):
+            raise ValueError("authorization_url is not https")
+
+        if not api_url.lower().startswith("https://"):
+            raise ValueError("api_url is not https")
+
+        if not authorization_url.endswith("/"):
+            authorization_url = authorization_url + "/"
+
+        if not api_url.endswith("/"):
+            api_url = api_url + "/"
+        self.__api_url = api_url
+
+        if transport is None:
+            from .async_transport import HttpxTransport  # pylint: disable=import-outside-toplevel
+
+            transport = HttpxTransport()
+        self.transport = transport
+
+        self._auth_client = _AuthClient(
+            username, password, scopes, authorization_url, None, use_access_token_cache, access_token_cache_path
+        )
+        self._token_lock = asyncio.Lock()
+        self._renewal: "Optional[asyncio.Future[None]]" = None
+
+        self.__metadata = AsyncMetadataMethods(self)
+        self.__search = AsyncSearchMethods(self)
+        self.__series = AsyncSeriesMethods(self)
+
+        self._metadata_type_directory = _MetadataTypeDirectory(None)
+
+        self._is_open = True
+
+    async def close(self) -> None:
+        if not self._is_open:
+            return
+        self._is_open = False
+        if self._renewal is not None:
+            self._renewal.cancel()
+        await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncSession":
+        return self
+
+    async def __aexit__(self, exception_type: Any, exception_value: Any, traceback: Any) -> None:
+        await self.close()
+
+    async def get(self, url: str, params: Dict[str, Any] = None) -> Response:
+        return await self._request("GET", url, params, None)
+
+    async def get_or_raise(
+        self, url: str, params: Dict[str, Any] = None, non_error_status: Sequence[int] = None
+    ) -> Response:
+        return _raise_on_error(await self.get(url, params), non_error_status)
+
+    async def post(self, url: str, params: Dict[str, Any] = None, json: object = None) -> Response:
+        return await self._request("POST", url, params, json)
+
+    async def post_or_raise(
+        self, url: str, params: Dict[str, Any] = None, json: object = None, non_error_status: Sequence[int] = None
+    ) -> Response:
+        return _raise_on_error(await self.post(url, params, json), non_error_status)
+
+    async def post_stream_or_raise(self, url: str, params: Dict[str, Any] = None, json: object = None) -> AsyncResponse:
+        """
+        Send a POST request and return the response without reading the body.
+        The response must be closed by the caller.
+        """
+        response = await self._send("POST", url, params, json)
+        if response.status_code != 200:
+            try:
+                content = await response.read()
+            finally:
+                await response.close()
+            _raise_on_error(_to_response("POST", self.api_url + url, response, content))
+        return response
+
+    async def fetch_token_if_necessary(self) -> bool:
+        access_token, is_expired, should_renew = self._auth_client._token_state()
+        if not is_expired:
+            if should_renew and (self._renewal is None or self._renewal.done()):
+                self._renewal = asyncio.ensure_future(self._renew(access_token))
+            return False
+
+        async with self._token_lock:
+            if self._auth_client._cache._get().access_token != access_token:
+                return False
+            await self._fetch_token()
+            return True
+
+    async def fetch_token(self) -> None:
+        async with self._token_lock:
+            await self._fetch_token()
+
+    async def _fetch_token_if_current(self, access_token: Optional[str]) -> None:
+        async with self._token_lock:
+            if self._auth_client._cache._get().access_token == access_token:
+                await self._fetch_token()
+
+    async def _renew(self, access_token: Optional[str]) -> None:
+        try:
+            await self._fetch_token_if_current(access_token)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # The token is still valid. If it can not be renewed, the error is raised when it has expired.
+            ...
+
+    async def _fetch_token(self) -> None:
+        auth_client = self._auth_client
+
+        token_endpoint = auth_client.token_endpoint or auth_client._cache._get_token_endpoint(
+            auth_client.authorization_url
+        )
+        if token_endpoint is None:
+            url = auth_client.authorization_url + ".well-known/openid-configuration"
+            token_endpoint = auth_client._process_discovery_response(await self._auth_request("GET", url))
+            auth_client._cache._set_token_endpoint(
+                auth_client.authorization_url, token_endpoint, Configuration._discovery_cache_ttl
+            )
+        auth_client.token_endpoint = token_endpoint
+
+        try:
+            auth_client._process_token_response(
+                await self._auth_request(
+                    "POST",
+                    token_endpoint,
+                    data=auth_client._token_payload(),
+                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                )
+            )
+        except AuthFetchTokenException:
+            auth_client._forget_token_endpoint()
+            raise
+
+    async def _auth_request(
+        self, method: str, url: str, data: Dict[str, str] = None, headers: Dict[str, str] = None
+    ) -> Response:
+        response = await self.transport.request(method, url, data=data, headers=headers)
+        try:
+            return _to_response(method, url, response, await response.read())
+        finally:
+            await response.close()
+
+    async def _request(self, method: str, url: str, params: Optional[Dict[str, Any]], json: object) -> Response:
+        response = await self._send(method, url, params, json)
+        try:
+            return _to_response(method, self.api_url + url, response, await response.read())
+        finally:
+            await response.close()
+
+    async def _send(self, method: str, url: str, params: Optional[Dict[str, Any]], json: object) -> AsyncResponse:
+        if not self._is_open:
+            raise ValueError("Session is not open")
+
+        await self.fetch_token_if_necessary()
+        access_token = self._auth_client._cache._get().access_token
+
+        response = await self._send_with_token(method, url, params, json, access_token)
+
+        if response.status_code == 401:
+            await response.close()
+            await self._fetch_token_if_current(access_token)
+            access_token = self._auth_client._cache._get().access_token
+            response = await self._send_with_token(method, url, params, json, access_token)
+        return response
+
+    async def _send_with_token(
+        self, method: str, url: str, params: Optional[Dict[str, Any]], json: object, access_token: Optional[str]
+    ) -> AsyncResponse:
+        headers = {"Accept": "application/json"}
+        authorization = self._auth_client._authorization_header(access_token)
+        if authorization:
+            headers["Authorization"] = authorization
+        return await self.transport.request(
+            method, self.api_url + url, params=_without_none(params), json=json, headers=headers
+        )
+
+    async def _prefetch_metadata_types(self, metadata: Iterable[Optional[Dict[str, Any]]]) -> None:
+        """Get the types of all metadata attributes that are not yet known, in as few requests as possible."""
+        names = _MetadataTypeDirectory._unknown_names(x for y in metadata if y for x in y)
+        for chunk in split_in_to_chunks(names, 100):
+            try:
+                infos: List[Optional["MetadataAttributeInformationResponse"]] = list(
+                    await self.metadata.get_attribute_information(*chunk)
+                )
+            except ProblemDetailsException as ex:
+                if ex.status != 404:
+                    raise ex
+                # At least one of the attributes is unknown, so get them one by one
+                infos = [await self._get_one_attribute_information(x) for x in chunk] if len(chunk) > 1 else [None]
+
+            _MetadataTypeDirectory._add_many(zip(chunk, infos))
+
+    async def _get_one_attribute_information(
+        self, attribute_name: str
+    ) -> Optional["MetadataAttributeInformationResponse"]:
+        try:
+            return (await self.metadata.get_attribute_information(attribute_name))[0]
+        except ProblemDetailsException as ex:
+            if ex.status == 404:
+                return None
+            raise ex
+
+    def metadata_type_directory_stats(self) -> Dict[str, int]:
+        """
+        Get statistics of the cache of metadata attribute types, which is shared by all sessions in the process.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of lookups that were found in the cache ("hits") or not ("misses"),
+            the number of cached attributes ("size") and how many of those were not found by the server ("unknown").
+        """
+        return _MetadataTypeDirectory._stats()
+
+    def _create_metadata(self, data: Optional[Dict[str, Any]]) -> Metadata:
+        return cast(Metadata, _Metadata(data, self._metadata_type_directory)) if data else {}
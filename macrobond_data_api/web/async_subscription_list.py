@@ -0,0 +1,201 @@
+import asyncio
+import time
+from datetime import datetime, timezone, timedelta
+from typing import AsyncIterator, Dict, List, Sequence, Tuple
+
+from .async_session import AsyncSession
+from .subscription_list import (
+    _CHECK_FIRST_DELAY,
+    _CHECK_MAX_DELAY,
+    _CHECK_TIMEOUT,
+    _create_batches,
+    _parse_updates,
+    _still_pending,
+)
+
+__pdoc__ = {
+    "AsyncSubscriptionList.__init__": False,
+}
+
+
+class AsyncSubscriptionList:
+    """
+    The asyncio version of `macrobond_data_api.web.subscription_list.SubscriptionList`.
+
+    This class shouldn't be instantiated directly, but instead should be retrieved from an
+    `macrobond_data_api.web.async_web_api.AsyncWebApi` through `subscription_list`.
+
+    Examples
+    --------
+    ```python
+    async with AsyncWebApi(AsyncSession(username, password)) as api:
+        subscription_list = api.subscription_list(datetime.now(timezone.utc))
+        await subscription_list.set(['sek', 'nok'])
+        async for result in subscription_list.poll_until_no_more_changes():
+            for key, date in result.items():
+                print(f'Series "{key}", last updated "{date}"')
+    ```
+    """
+
+    def __init__(self, session: AsyncSession, last_modified: datetime, poll_interval: timedelta = None):
+        self._session = session
+
+        self.last_modified = last_modified - timedelta(seconds=5)
+        """
+        Stores the date for when the subscription list was last modified.
+        """
+
+        self.no_more_changes = False
+        """
+        An indicator that there are no changes at the moment.
+        """
+
+        if poll_interval is None:
+            poll_interval = timedelta(seconds=15)
+
+        self.poll_interval = poll_interval
+        """
+        Specifies the time interval between polls.
+        """
+
+        self.batch_size = 1000
+        """
+        The maximum number of series sent in each request when the list is changed.
+        """
+
+        self.max_workers = 4
+        """
+        The maximum number of batches that are checked at the same time when waiting for a change to be applied.
+        """
+
+        self._next_poll = datetime.now(timezone.utc)
+        self._lock = asyncio.Lock()
+
+    async def list(self) -> List[str]:
+        """
+        Lists series currently registered in the subscription list.
+
+        Returns
+        -------
+        `List[str]`
+        """
+        if not self._session._is_open:
+            raise ValueError("AsyncWebApi is not open")
+
+        return (await self._session.get_or_raise("v1/subscriptionlist/list")).json()
+
+    async def set(self, keys: Sequence[str]) -> None:
+        """
+        Set what series to include in the subscription list.
+        This will replace all previous series in the list.
+
+        Changes made at the same time are applied one at a time.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+        """
+        await self._change("v1/subscriptionlist/set", keys)
+
+    async def add(self, keys: Sequence[str]) -> None:
+        """
+        Add one or more series to the subscription list.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+        """
+        await self._change("v1/subscriptionlist/add", keys)
+
+    async def remove(self, keys: Sequence[str]) -> None:
+        """
+        Remove one or more series from the subscription list.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+        """
+        await self._change("v1/subscriptionlist/remove", keys)
+
+    async def poll(self) -> Dict[str, datetime]:
+        """
+        Polls for any changes on the series in the subscription list.
+        If there are no updates, the method will return an empty dict after the poll interval time.
+
+        Returns
+        -------
+        Dict[str, datetime]]
+            A dictionary of names of series that have been updated, and the corresponding last update date.
+        """
+        if not self._session._is_open:
+            raise ValueError("AsyncWebApi is not open")
+
+        interval = self._next_poll - datetime.now(timezone.utc)
+        if interval > timedelta():
+            await asyncio.sleep(interval.total_seconds())
+
+        data = (
+            await self._session.get_or_raise(
+                "v1/subscriptionlist/getupdates", params={"ifModifiedSince": self.last_modified.isoformat()}
+            )
+        ).json()
+
+        self.no_more_changes, self.last_modified, changes = _parse_updates(data)
+        if self.no_more_changes:
+            self._next_poll = datetime.now(timezone.utc) + self.poll_interval
+
+        return changes
+
+    async def poll_until_no_more_changes(self) -> AsyncIterator[Dict[str, datetime]]:
+        """
+        Polls for any changes on the series in the subscription list until there are no more changes.
+
+        Returns
+        -------
+        AsyncIterator[Dict[str, datetime]]]
+            An AsyncIterator of dictionaries with names of series that have been updated, and the corresponding last
+            update date.
+        """
+        while True:
+            changes = await self.poll()
+            if len(changes) > 0:
+                yield changes
+            if self.no_more_changes:
+                break
+
+    async def _change(self, endpoint: str, keys: Sequence[str]) -> None:
+        if not self._session._is_open:
+            raise ValueError("AsyncWebApi is not open")
+
+        batches = _create_batches(endpoint, keys, self.batch_size)
+        async with self._lock:
+            await self._apply(endpoint, batches)
+
+    async def _apply(self, endpoint: str, batches: List[Tuple[str, Sequence[str]]]) -> None:
+        for batch_endpoint, batch in batches:
+            await self._session.post_or_raise(batch_endpoint, json=batch)
+
+        timeout = time.monotonic() + _CHECK_TIMEOUT
+        semaphore = asyncio.Semaphore(max(1, self.max_workers))
+
+        async def wait_until_applied(keys: Sequence[str]) -> None:
+            async with semaphore:
+                await self._wait_until_applied(endpoint, keys, timeout)
+
+        await asyncio.gather(*(wait_until_applied(x) for _, x in batches if x))
+
+    async def _wait_until_applied(self, endpoint: str, keys: Sequence[str], timeout: float) -> None:
+        delay = _CHECK_FIRST_DELAY
+        while True:
+            not_included = (
+                await self._session.post_or_raise("v1/subscriptionlist/checkifnotincluded", json=keys)
+            ).json()
+            keys = _still_pending(endpoint, keys, not_included)
+            remaining = timeout - time.monotonic()
+            if not keys or remaining <= 0:
+                return
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, _CHECK_MAX_DELAY)
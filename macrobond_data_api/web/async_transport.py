@@ -0,0 +1,121 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Mapping, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+
+__pdoc__ = {
+    "HttpxTransport.__init__": False,
+}
+
+
+class AsyncResponse(ABC):
+    """A response returned by an `AsyncTransport`. The body is read with `read` or `iter_bytes`."""
+
+    @property
+    @abstractmethod
+    def status_code(self) -> int:
+        """The HTTP status code."""
+
+    @property
+    @abstractmethod
+    def headers(self) -> Mapping[str, str]:
+        """The response headers. The lookup of a header is case-insensitive."""
+
+    @abstractmethod
+    async def read(self) -> bytes:
+        """Read the whole body."""
+
+    @abstractmethod
+    def iter_bytes(self) -> AsyncIterator[bytes]:
+        """Iterate over the body in chunks as it is received."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the connection."""
+
+
+class AsyncTransport(ABC):
+    """
+    The transport used by `macrobond_data_api.web.async_session.AsyncSession` to send HTTP requests.
+    Implement this to use another HTTP library or to test against a local stub.
+    """
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        json: object = None,
+        data: Optional[Mapping[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> AsyncResponse:
+        """
+        Send a request and return the response once the headers are received.
+        The caller must close the response.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the transport and release its connections."""
+
+
+class _HttpxResponse(AsyncResponse):
+    def __init__(self, response: "httpx.Response") -> None:
+        self._response = response
+
+    @property
+    def status_code(self) -> int:
+        return self._response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._response.headers
+
+    async def read(self) -> bytes:
+        return await self._response.aread()
+
+    def iter_bytes(self) -> AsyncIterator[bytes]:
+        return self._response.aiter_bytes()
+
+    async def close(self) -> None:
+        await self._response.aclose()
+
+
+class HttpxTransport(AsyncTransport):
+    """
+    An `AsyncTransport` that uses httpx.
+
+    This requires httpx to be installed, for example with `pip install macrobond-data-api[async]`.
+
+    Parameters
+    ----------
+    proxy : str
+        The proxy to use, if any.
+    timeout : float
+        The timeout in seconds.
+    """
+
+    def __init__(self, proxy: Optional[str] = None, timeout: Optional[float] = 60) -> None:
+        import httpx  # pylint: disable=import-outside-toplevel
+
+        self._client = httpx.AsyncClient(proxy=proxy, timeout=timeout)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        json: object = None,
+        data: Optional[Mapping[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> AsyncResponse:
+        kwargs: Dict[str, Any] = {"params": params, "data": data, "headers": headers}
+        if json is not None:
+            kwargs["json"] = json
+        request = self._client.build_request(method, url, **kwargs)
+        return _HttpxResponse(await self._client.send(request, stream=True))
+
+    async def close(self) -> None:
+        await self._client.aclose()
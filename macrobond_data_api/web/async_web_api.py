@@ -0,0 +1,400 @@
+import asyncio
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING, cast
+
+import ijson
+
+from macrobond_data_api.common.enums import SeriesWeekdays, SeriesFrequency, CalendarMergeMode, StatusCode
+from macrobond_data_api.common.types import (
+    Entity,
+    GetAllVintageSeriesResult,
+    GetEntitiesError,
+    MetadataAttributeInformation,
+    MetadataValueInformation,
+    MetadataValueInformationItem,
+    RevisionHistoryRequest,
+    RevisionInfo,
+    SearchResult,
+    Series,
+    SeriesEntry,
+    SeriesObservationHistory,
+    SeriesWithVintages,
+    UnifiedSeriesList,
+    VintageSeries,
+)
+from macrobond_data_api.common.types._repr_html_sequence import _ReprHtmlSequence
+
+from .async_session import AsyncSession, _AsyncResponseAsFileObject
+from .async_subscription_list import AsyncSubscriptionList
+from .session import ProblemDetailsException
+from ._split_in_to_chunks import split_in_to_chunks
+from ._web_api_metadata import _create_attribute_information
+from ._web_api_revision import (
+    _create_all_vintage_series,
+    _create_nth_release,
+    _create_observation_history,
+    _create_revision_info,
+    _create_series_with_vintages,
+    _create_vintage_series,
+    _create_web_revision_h_request,
+)
+from ._web_api_search import _create_search_request
+from ._web_api_series import (
+    _create_entity,
+    _create_entity_requests,
+    _create_series,
+    _create_unified_series_list,
+    _create_unified_series_request,
+    _series_as_tuples,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from macrobond_data_api.common.types import SearchFilter, StartOrEndPoint
+
+    from .web_types import EntityRequest, SeriesResponse, SeriesWithVintagesResponse
+
+__pdoc__ = {
+    "AsyncWebApi.__init__": False,
+}
+
+
+class AsyncWebApi:
+    """
+    The asyncio version of `macrobond_data_api.web.web_api.WebApi`.
+    The methods are coroutines with the same parameters and results as the methods of `WebApi`,
+    except `get_many_series` and `get_many_series_with_revisions` that are async generators.
+
+    Examples
+    -------
+    ```python
+    async with AsyncWebApi(AsyncSession(username, password)) as api:
+        async for series in api.get_many_series(["usgdp", "segdp"]):
+            print(series.name, series.values[-1])
+    ```
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+        self.raise_error = True
+        """
+        Controls the default value of the parameter called raise_error, which is used in many
+        API calls. The default value is "True".
+        """
+
+        self.use_numpy_arrays = False
+        """
+        If True, `values` and `dates` of the series are numpy arrays instead of lists.
+        See `macrobond_data_api.web.web_api.WebApi.use_numpy_arrays`.
+        """
+
+    @property
+    def session(self) -> AsyncSession:
+        if not self._session._is_open:
+            raise ValueError("AsyncWebApi is not open")
+        return self._session
+
+    async def close(self) -> None:
+        await self._session.close()
+
+    async def __aenter__(self) -> "AsyncWebApi":
+        return self
+
+    async def __aexit__(self, exception_type: Any, exception_value: Any, traceback: Any) -> None:
+        await self.close()
+
+    # metadata
+
+    async def metadata_list_values(self, name: str) -> MetadataValueInformation:
+        response = await self.session.metadata.list_attribute_values(name)
+        return MetadataValueInformation(
+            [MetadataValueInformationItem(name, x["value"], x["description"], x.get("comment")) for x in response],
+            name,
+        )
+
+    async def metadata_get_attribute_information(self, *name: str) -> Sequence[MetadataAttributeInformation]:
+        response = await self.session.metadata.get_attribute_information(*name)
+        return _ReprHtmlSequence([_create_attribute_information(x) for x in response])
+
+    async def metadata_get_value_information(
+        self, *name_val: Tuple[str, str]
+    ) -> Sequence[MetadataValueInformationItem]:
+        try:
+            response = await self.session.metadata.get_value_information(*name_val)
+        except ProblemDetailsException as ex:
+            if ex.status == 404:
+                raise ValueError(ex.detail) from ex
+            raise ex
+        return _ReprHtmlSequence(
+            [
+                MetadataValueInformationItem(x["attributeName"], x["value"], x["description"], x.get("comment"))
+                for x in response
+            ]
+        )
+
+    # revision
+
+    async def get_revision_info(self, *series_names: str, raise_error: Optional[bool] = None) -> Sequence[RevisionInfo]:
+        response = await self.session.series.get_revision_info(*series_names)
+
+        if self.raise_error if raise_error is None else raise_error:
+            GetEntitiesError._raise_if([(x, y.get("errorText")) for x, y in zip(series_names, response)])
+
+        return _ReprHtmlSequence([_create_revision_info(x, y) for x, y in zip(series_names, response)])
+
+    async def get_one_vintage_series(
+        self,
+        time: datetime,
+        series_name: str,
+        include_times_of_change: bool = False,
+        raise_error: Optional[bool] = None,
+    ) -> VintageSeries:
+        return (
+            await self.get_vintage_series(
+                time, [series_name], include_times_of_change=include_times_of_change, raise_error=raise_error
+            )
+        )[0]
+
+    async def get_vintage_series(
+        self,
+        time: datetime,
+        series_names: Sequence[str],
+        include_times_of_change: bool = False,
+        raise_error: Optional[bool] = None,
+    ) -> Sequence[VintageSeries]:
+        session = self.session
+        response = await session.series.fetch_vintage_series(
+            time, *series_names, get_times_of_change=include_times_of_change
+        )
+        await session._prefetch_metadata_types(x.get("metadata") for x in response)
+
+        series = [
+            _create_vintage_series(x, y, session, include_times_of_change, self.use_numpy_arrays)
+            for x, y in zip(response, series_names)
+        ]
+
+        if self.raise_error if raise_error is None else raise_error:
+            GetEntitiesError._raise_if([(x, y.error_message) for x, y in zip(series_names, series)])
+
+        return _ReprHtmlSequence(series)
+
+    async def get_one_nth_release(
+        self,
+        nth: int,
+        series_name: str,
+        include_times_of_change: bool = False,
+        raise_error: Optional[bool] = None,
+    ) -> Series:
+        return (
+            await self.get_nth_release(
+                nth, [series_name], include_times_of_change=include_times_of_change, raise_error=raise_error
+            )
+        )[0]
+
+    async def get_nth_release(
+        self,
+        nth: int,
+        series_names: Sequence[str],
+        include_times_of_change: bool = False,
+        raise_error: Optional[bool] = None,
+    ) -> Sequence[Series]:
+        if len(series_names) == 0:
+            raise ValueError("No series names")
+
+        session = self.session
+        response = await session.series.fetch_nth_release_series(
+            nth, *series_names, get_times_of_change=include_times_of_change
+        )
+        await session._prefetch_metadata_types(x.get("metadata") for x in response)
+
+        series = [
+            _create_nth_release(x, y, session, include_times_of_change, self.use_numpy_arrays)
+            for x, y in zip(response, series_names)
+        ]
+
+        if self.raise_error if raise_error is None else raise_error:
+            GetEntitiesError._raise_if([(x, y.error_message) for x, y in zip(series_names, series)])
+
+        return _ReprHtmlSequence(series)
+
+    async def get_all_vintage_series(self, series_name: str) -> GetAllVintageSeriesResult:
+        session = self.session
+        try:
+            response = await session.series.get_fetch_all_vintage_series(series_name)
+        except ProblemDetailsException as ex:
+            if ex.status == 404:
+                raise ValueError("Series not found: " + series_name) from ex
+            raise ex
+        await session._prefetch_metadata_types(x.get("metadata") for x in response)
+
+        return GetAllVintageSeriesResult(
+            [_create_all_vintage_series(x, series_name, session) for x in response], series_name
+        )
+
+    async def get_observation_history(self, series_name: str, *times: datetime) -> Sequence[SeriesObservationHistory]:
+        try:
+            response = await self.session.series.fetch_observation_history(series_name, list(times))
+        except ProblemDetailsException as ex:
+            if ex.status == 404:
+                raise Exception(ex.detail) from ex
+            raise ex
+
+        return _ReprHtmlSequence([_create_observation_history(x) for x in response])
+
+    async def get_many_series_with_revisions(
+        self, requests: Sequence[RevisionHistoryRequest], include_not_modified: bool = False
+    ) -> AsyncGenerator[SeriesWithVintages, None]:
+        """
+        Download all revisions for one or more series.
+        The series are requested in chunks of 200 and each chunk is parsed as it is received.
+
+        See `macrobond_data_api.web.web_api.WebApi.get_many_series_with_revisions`
+        """
+        session = self.session
+        for requests_chunkd in split_in_to_chunks(requests, 200):
+            response = await session.series.post_fetch_all_vintage_series(
+                _create_web_revision_h_request(requests_chunkd)
+            )
+            try:
+                item: "SeriesWithVintagesResponse"
+                async for item in ijson.items(_AsyncResponseAsFileObject(response), "item"):
+                    error_code = item.get("errorCode")
+                    status_code = StatusCode(error_code) if error_code else StatusCode.OK
+
+                    if not include_not_modified and status_code == StatusCode.NOT_MODIFIED:
+                        continue
+
+                    await session._prefetch_metadata_types([item.get("metadata")])
+                    yield _create_series_with_vintages(item, status_code, session)
+            finally:
+                await response.close()
+
+    # Search
+
+    async def entity_search_multi_filter(
+        self, *filters: "SearchFilter", include_discontinued: bool = False, no_metadata: bool = False
+    ) -> SearchResult:
+        session = self.session
+        response = await session.search.post_entities(
+            _create_search_request(filters, include_discontinued, no_metadata)
+        )
+        await session._prefetch_metadata_types(response["results"])
+        results = [session._create_metadata(x) for x in response["results"]]
+        return SearchResult(results, response.get("isTruncated") is True)
+
+    # Series
+
+    async def get_one_series(self, series_name: str, raise_error: Optional[bool] = None) -> Series:
+        return (await self.get_series([series_name], raise_error=raise_error))[0]
+
+    async def get_series(self, series_names: Sequence[str], raise_error: Optional[bool] = None) -> Sequence[Series]:
+        session = self.session
+        response = await session.series.get_fetch_series(*series_names)
+        await session._prefetch_metadata_types(x.get("metadata") for x in response)
+        series = [_create_series(x, y, session, self.use_numpy_arrays) for x, y in zip(response, series_names)]
+        if self.raise_error if raise_error is None else raise_error:
+            GetEntitiesError._raise_if([(x, y.error_message) for x, y in zip(series_names, series)])
+        return _ReprHtmlSequence(series)
+
+    async def get_one_entity(self, entity_name: str, raise_error: Optional[bool] = None) -> Entity:
+        return (await self.get_entities([entity_name], raise_error=raise_error))[0]
+
+    async def get_entities(self, entity_names: Sequence[str], raise_error: Optional[bool] = None) -> Sequence[Entity]:
+        session = self.session
+        response = await session.series.fetch_entities(*entity_names)
+        await session._prefetch_metadata_types(x.get("metadata") for x in response)
+        entitys = [_create_entity(x, y, session) for x, y in zip(response, entity_names)]
+        if self.raise_error if raise_error is None else raise_error:
+            GetEntitiesError._raise_if([(x, y.error_message) for x, y in zip(entity_names, entitys)])
+        return _ReprHtmlSequence(entitys)
+
+    async def get_many_series(
+        self,
+        series: Sequence[Union[str, Tuple[str, Optional[datetime]]]],
+        include_not_modified: bool = False,
+        max_workers: int = 1,
+    ) -> AsyncGenerator[Series, None]:
+        """
+        Download one or more series. The series are requested in chunks of 200
+        and returned in the same order as in the request.
+
+        Parameters
+        ----------
+        series: `Sequence[Union[str, Tuple[str, Optional[datetime]]]]`
+            A sequence of series names or a sequence of name plus a timestamp for the last modification.
+        include_not_modified: `bool`
+            Set this value to True in order to include NotModified series.
+        max_workers: `int`
+            The maximum number of chunk requests in flight at the same time.
+
+        Returns
+        -------
+        `AsyncGenerator[macrobond_data_api.common.types.series.Series]`
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be 1 or greater")
+
+        session = self.session
+
+        async def fetch_chunk(
+            chunk: Sequence[Tuple[str, Optional[datetime]]],
+        ) -> Tuple[List["EntityRequest"], List["SeriesResponse"]]:
+            requests = _create_entity_requests(chunk)
+            response = await session.series.post_fetch_series(*requests)
+            await session._prefetch_metadata_types(cast(Optional[Dict[str, Any]], x.get("metadata")) for x in response)
+            return requests, response
+
+        chunks = iter(split_in_to_chunks(_series_as_tuples(series), 200))
+        in_flight: Deque["asyncio.Task[Tuple[List[EntityRequest], List[SeriesResponse]]]"] = deque()
+        try:
+            while True:
+                while len(in_flight) < max_workers:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    in_flight.append(asyncio.ensure_future(fetch_chunk(chunk)))
+
+                if not in_flight:
+                    return
+
+                requests, response_list = await in_flight.popleft()
+                for response, request in zip(response_list, requests):
+                    ret = _create_series(response, request["name"], session, self.use_numpy_arrays)
+                    if ret.status_code == StatusCode.NOT_MODIFIED and not include_not_modified:
+                        continue
+                    yield ret
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def get_unified_series(
+        self,
+        *series_entries: Union[SeriesEntry, str],
+        frequency: SeriesFrequency = SeriesFrequency.HIGHEST,
+        weekdays: SeriesWeekdays = SeriesWeekdays.FULL_WEEK,
+        calendar_merge_mode: CalendarMergeMode = CalendarMergeMode.AVAILABLE_IN_ANY,
+        currency: str = "",
+        start_point: Optional["StartOrEndPoint"] = None,
+        end_point: Optional["StartOrEndPoint"] = None,
+        raise_error: Optional[bool] = None,
+    ) -> UnifiedSeriesList:
+        session = self.session
+        request = _create_unified_series_request(
+            series_entries, frequency, weekdays, calendar_merge_mode, currency, start_point, end_point
+        )
+
+        response = await session.series.fetch_unified_series(request)
+        await session._prefetch_metadata_types(x.get("metadata") for x in response["series"])
+
+        return _create_unified_series_list(
+            response, request, session, self.raise_error if raise_error is None else raise_error
+        )
+
+    # subscription list
+
+    def subscription_list(self, last_modified: datetime, poll_interval: timedelta = None) -> AsyncSubscriptionList:
+        """
+        Retrieves the subscription list with the specified date since last update.
+        """
+        return AsyncSubscriptionList(self.session, last_modified, poll_interval)
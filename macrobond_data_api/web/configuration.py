@@ -1,4 +1,4 @@
-from typing import Type
+from typing import Optional, Type
 
 __pdoc__ = {
     "Configuration.__init__": False,
@@ -19,6 +19,11 @@ class Configuration:
     # Session
     _default_api_url = "https://api.macrobondfinancial.com/"
     _default_authorization_url = "https://apiauth.macrobondfinancial.com/mbauth/"
+    _discovery_cache_ttl: float = 86400
+    _metadata_type_db_path: Optional[str] = None
+    _metadata_unknown_type_ttl: float = 3600
+    _metadata_type_directory_max_size = 10000
+    _stream_buffer_size = 65536
 
     @classmethod
     def set_default_api_url(cls, val: str) -> Type["Configuration"]:
@@ -36,6 +41,54 @@ class Configuration:
         cls._default_authorization_url = val
         return cls
 
+    @classmethod
+    def set_discovery_cache_ttl(cls, val: float) -> Type["Configuration"]:
+        """
+        Set the number of seconds the token endpoint from the OpenID discovery document
+        is cached for each authorization URL.
+        .. Warning:: This is only recommended for advanced users.
+        """
+        cls._discovery_cache_ttl = val
+        return cls
+
+    @classmethod
+    def set_metadata_type_db_path(cls, val: Optional[str]) -> Type["Configuration"]:
+        """
+        Set the path of a file where the types of the metadata attributes are stored,
+        so that they do not have to be fetched again when a new process is started.
+        .. Warning:: This is only recommended for advanced users.
+        """
+        cls._metadata_type_db_path = val
+        return cls
+
+    @classmethod
+    def set_metadata_unknown_type_ttl(cls, val: float) -> Type["Configuration"]:
+        """
+        Set the number of seconds a metadata attribute that was not found is remembered
+        before its type is requested again.
+        .. Warning:: This is only recommended for advanced users.
+        """
+        cls._metadata_unknown_type_ttl = val
+        return cls
+
+    @classmethod
+    def set_metadata_type_directory_max_size(cls, val: int) -> Type["Configuration"]:
+        """
+        Set the maximum number of metadata attribute types kept in memory.
+        .. Warning:: This is only recommended for advanced users.
+        """
+        cls._metadata_type_directory_max_size = val
+        return cls
+
+    @classmethod
+    def set_stream_buffer_size(cls, val: int) -> Type["Configuration"]:
+        """
+        Set the number of bytes read at a time when a response is decoded while it is received.
+        .. Warning:: This is only recommended for advanced users.
+        """
+        cls._stream_buffer_size = val
+        return cls
+
     @classmethod
     def set_default_service_name(cls, val: str) -> Type["Configuration"]:
         """_summary_
@@ -0,0 +1,131 @@
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from ._split_in_to_chunks import split_in_to_chunks
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .web_types import DataPackageListItem
+
+__pdoc__ = {
+    "SqliteDataPackageListCheckpointStore.__init__": False,
+}
+
+
+class DataPackageListCheckpointStore(ABC):
+    """
+    Records the progress of a `macrobond_data_api.web.data_package_list_poller.DataPackageListPoller`,
+    so that a restarted poller can continue where it stopped.
+
+    The items are marked as processed when they have been handled. When a listing is completed, its state is saved
+    and the processed items are forgotten.
+    """
+
+    @abstractmethod
+    def load(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Get the saved `download_full_list_on_or_after` and `time_stamp_for_if_modified_since`.
+        Both are `None` if nothing has been saved.
+        """
+
+    @abstractmethod
+    def save(
+        self, download_full_list_on_or_after: Optional[datetime], time_stamp_for_if_modified_since: datetime
+    ) -> None:
+        """Save the state after a completed listing and forget the processed items."""
+
+    @abstractmethod
+    def get_unprocessed(self, items: Sequence["DataPackageListItem"]) -> List["DataPackageListItem"]:
+        """Get the items that have not been processed since they were last modified."""
+
+    @abstractmethod
+    def set_processed(self, items: Sequence["DataPackageListItem"]) -> None:
+        """Mark items as processed."""
+
+
+class SqliteDataPackageListCheckpointStore(DataPackageListCheckpointStore):
+    """
+    A `DataPackageListCheckpointStore` stored in a SQLite database file.
+    Each call is committed, so the progress is kept if the process stops.
+
+    Parameters
+    ----------
+    path : str
+        The path of the database file. It is created if it does not exist.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._lock = Lock()
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS processed (name TEXT PRIMARY KEY, modified TEXT)")
+        self._connection.commit()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise ValueError("SqliteDataPackageListCheckpointStore is closed")
+        return self._connection
+
+    def load(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        with self._lock:
+            state: Dict[str, Optional[str]] = dict(self._db.execute("SELECT key, value FROM state").fetchall())
+        download_full_list_on_or_after = state.get("download_full_list_on_or_after")
+        time_stamp_for_if_modified_since = state.get("time_stamp_for_if_modified_since")
+        return (
+            datetime.fromisoformat(download_full_list_on_or_after) if download_full_list_on_or_after else None,
+            datetime.fromisoformat(time_stamp_for_if_modified_since) if time_stamp_for_if_modified_since else None,
+        )
+
+    def save(
+        self, download_full_list_on_or_after: Optional[datetime], time_stamp_for_if_modified_since: datetime
+    ) -> None:
+        with self._lock:
+            db = self._db
+            db.executemany(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                [
+                    (
+                        "download_full_list_on_or_after",
+                        download_full_list_on_or_after.isoformat() if download_full_list_on_or_after else None,
+                    ),
+                    ("time_stamp_for_if_modified_since", time_stamp_for_if_modified_since.isoformat()),
+                ],
+            )
+            db.execute("DELETE FROM processed")
+            db.commit()
+
+    def get_unprocessed(self, items: Sequence["DataPackageListItem"]) -> List["DataPackageListItem"]:
+        processed: Dict[str, str] = {}
+        with self._lock:
+            for chunk in split_in_to_chunks(items, 500):
+                processed.update(
+                    self._db.execute(
+                        f"SELECT name, modified FROM processed WHERE name IN ({','.join('?' * len(chunk))})",
+                        [x.name for x in chunk],
+                    ).fetchall()
+                )
+        return [x for x in items if x.name not in processed or datetime.fromisoformat(processed[x.name]) < x.modified]
+
+    def set_processed(self, items: Sequence["DataPackageListItem"]) -> None:
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO processed (name, modified) VALUES (?, ?)",
+                ((x.name, x.modified.isoformat()) for x in items),
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the database file."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __enter__(self) -> "SqliteDataPackageListCheckpointStore":
+        return self
+
+    def __exit__(self, exception_type: Any, exception_value: Any, traceback: Any) -> None:
+        self.close()
@@ -1,14 +1,18 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from itertools import count
+from queue import Full, Queue
+from threading import Thread
 
 import time
-from typing import List, Optional, cast, TYPE_CHECKING, Callable
+from typing import List, Optional, Tuple, cast, TYPE_CHECKING, Callable
 
 from .web_api import WebApi
+from .data_package_list_checkpoint_store import DataPackageListCheckpointStore
 from .web_types.data_package_list_state import DataPackageListState
 
 if TYPE_CHECKING:  # pragma: no cover
+    from macrobond_data_api.common.types import Series
     from .web_types import DataPackageBody, DataPackageListItem
 
 
@@ -16,6 +20,75 @@ class _AbortException(Exception):
     pass
 
 
+class _SeriesPipeline:
+    """
+    Downloads the series of the listed items on worker threads while the list is downloaded.
+    The queue is bounded, so the list download waits when the workers can not keep up.
+    """
+
+    def __init__(
+        self,
+        process: Callable[["DataPackageBody", List["DataPackageListItem"]], None],
+        workers: int,
+        queue_size: int,
+    ) -> None:
+        self._process = process
+        self._queue: "Queue[Optional[Tuple[DataPackageBody, List[DataPackageListItem]]]]" = Queue(queue_size)
+        self._exception: Optional[Exception] = None
+        self._is_aborted = False
+        self._threads = [Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def put(
+        self, subscription: "DataPackageBody", items: List["DataPackageListItem"], is_aborted: Callable[[], bool]
+    ) -> None:
+        while not is_aborted():
+            self._raise_if_failed()
+            try:
+                self._queue.put((subscription, items), timeout=0.1)
+                return
+            except Full:
+                ...
+
+    def wait(self) -> None:
+        """Wait until all queued items are processed."""
+        self._queue.join()
+        self._raise_if_failed()
+
+    def cancel(self) -> None:
+        """Drop the queued items and wait for the items being processed."""
+        self._is_aborted = True
+        self._queue.join()
+        self._is_aborted = False
+        self._exception = None
+
+    def close(self) -> None:
+        self._is_aborted = True
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _raise_if_failed(self) -> None:
+        if self._exception is not None:
+            raise self._exception
+
+    def _work(self) -> None:
+        while True:
+            work = self._queue.get()
+            try:
+                if work is None:
+                    return
+                if self._is_aborted or self._exception is not None:
+                    continue
+                self._process(*work)
+            except Exception as ex:  # pylint: disable=broad-except
+                self._exception = ex
+            finally:
+                self._queue.task_done()
+
+
 class DataPackageListPoller(ABC):
     """
     This is work in progress and might change soon.
@@ -23,6 +96,9 @@ class DataPackageListPoller(ABC):
     Derive from this class and override `on_full_listing_start`, `on_full_listing_items`, `on_full_listing_stop`,
     `on_incremental_start`, `on_incremental_items` and `on_incremental_stop`.
 
+    Set `series_workers` to download the changed series on worker threads while the list is downloaded.
+    The series are then passed to `on_series`.
+
     Parameters
     ----------
     api : WebApi
@@ -31,6 +107,10 @@ class DataPackageListPoller(ABC):
         The saved value of `download_full_list_on_or_after` from the previous run. `None` on first run.
     time_stamp_for_if_modified_since: datetime
         The saved value of `time_stamp_for_if_modified_since` from the previous run. `None`on first run.
+    checkpoint_store: DataPackageListCheckpointStore
+        If specified, the progress is saved after each batch of processed items.
+        When both of the values above are `None`, they are loaded from the store.
+        Items that were processed before a restart are not passed to the overrides again.
     """
 
     def __init__(
@@ -38,15 +118,27 @@ class DataPackageListPoller(ABC):
         api: WebApi,
         download_full_list_on_or_after: Optional[datetime] = None,
         time_stamp_for_if_modified_since: Optional[datetime] = None,
+        checkpoint_store: Optional[DataPackageListCheckpointStore] = None,
         _sleep: Callable[[int], None] = time.sleep,
     ) -> None:
+        if checkpoint_store and download_full_list_on_or_after is None and time_stamp_for_if_modified_since is None:
+            download_full_list_on_or_after, time_stamp_for_if_modified_since = checkpoint_store.load()
         self.up_to_date_delay = 15 * 60
         """ The time to wait, in seconds, between polls. """
         self.incomplete_delay = 15
         """ The time to wait, in seconds, between continuing partial updates. """
         self.on_error_delay = 30
         """ The time to wait, in seconds, before retrying after an error. """
+        self.series_workers = 0
+        """
+        The number of threads that download the listed series while the list is downloaded.
+        When this is greater than 0, `on_series` is called with the downloaded series.
+        """
+        self.series_queue_size = 4
+        """ The maximum number of item batches waiting to be downloaded before the list download waits. """
         self._api = api
+        self._pipeline: Optional[_SeriesPipeline] = None
+        self._checkpoint_store = checkpoint_store
         self._sleep = _sleep
         self._abort = False
         self._download_full_list_on_or_after = download_full_list_on_or_after
@@ -74,8 +166,20 @@ class DataPackageListPoller(ABC):
 
     def start(self) -> None:
         """Start processing. It will continue to run until `abort` is called."""
+        if self.series_workers > 0 and type(self).on_series is DataPackageListPoller.on_series:
+            raise ValueError("on_series must be overridden when series_workers is greater than 0")
         self._test_access()
         self._abort = False
+        if self.series_workers > 0:
+            self._pipeline = _SeriesPipeline(self._process_series, self.series_workers, self.series_queue_size)
+        try:
+            self._poll()
+        finally:
+            if self._pipeline is not None:
+                self._pipeline.close()
+                self._pipeline = None
+
+    def _poll(self) -> None:
         while not self._abort:
             if not self._time_stamp_for_if_modified_since or (
                 self._download_full_list_on_or_after
@@ -85,10 +189,12 @@ class DataPackageListPoller(ABC):
                 if sub:
                     self._download_full_list_on_or_after = sub.download_full_list_on_or_after
                     self._time_stamp_for_if_modified_since = sub.time_stamp_for_if_modified_since
+                    self._save_checkpoint()
             else:
                 sub = self._run_listing(self._time_stamp_for_if_modified_since)
                 if sub:
                     self._time_stamp_for_if_modified_since = sub.time_stamp_for_if_modified_since
+                    self._save_checkpoint()
 
             if self._abort:
                 return
@@ -114,24 +220,28 @@ class DataPackageListPoller(ABC):
                 try:
                     sub = self._api.get_data_package_list_iterative(
                         _body_callback,
-                        self.on_full_listing_items,
+                        self._items_callback(self.on_full_listing_items),
                         None,
                     )
                     if not sub:
                         raise ValueError("subscription is None")
 
+                    self._wait_for_series()
                     self.on_full_listing_stop(False, None)
                     return sub
                 except Exception as ex:  # pylint: disable=broad-except
+                    self._cancel_series()
                     if self._abort:
                         raise _AbortException() from ex
                     if attempt >= max_attempts:
                         raise ex
                     self._sleep(self.on_error_delay)
         except _AbortException as ex:
+            self._cancel_series()
             if is_stated:
                 self.on_full_listing_stop(True, cast(Exception, ex.__cause__))
         except Exception as ex:  # pylint: disable=broad-except
+            self._cancel_series()
             if is_stated:
                 self.on_full_listing_stop(False, ex)
         return None
@@ -147,23 +257,25 @@ class DataPackageListPoller(ABC):
         try:
             for attempt in range(1, max_attempts + 1):
                 try:
-                    sub = self._api.get_data_package_list_iterative(
+                    result = self._api.get_data_package_list_iterative(
                         _body_callback,
-                        self.on_incremental_items,
+                        self._items_callback(self.on_incremental_items),
                         if_modified_since,
                     )
+                    if not result:
+                        raise ValueError("subscription is None")
+                    sub = result
                     break
                 except Exception as ex:  # pylint: disable=broad-except
+                    self._cancel_series()
                     if self._abort:
                         raise _AbortException() from ex
                     if attempt >= max_attempts:
                         raise
                     self._sleep(self.on_error_delay)
 
-            if not sub:
-                raise ValueError("subscription is None")
-
             if sub.state == DataPackageListState.UP_TO_DATE:
+                self._wait_for_series()
                 self.on_incremental_stop(False, None)
                 return sub
 
@@ -171,9 +283,11 @@ class DataPackageListPoller(ABC):
 
             return self._run_listing_incomplete(sub.time_stamp_for_if_modified_since, is_stated, max_attempts)
         except _AbortException as ex:
+            self._cancel_series()
             if is_stated:
                 self.on_incremental_stop(True, cast(Exception, ex.__cause__))
         except Exception as ex:  # pylint: disable=broad-except
+            self._cancel_series()
             if is_stated:
                 self.on_incremental_stop(False, ex)
         return None
@@ -187,7 +301,7 @@ class DataPackageListPoller(ABC):
                     try:
                         sub = self._api.get_data_package_list_iterative(
                             lambda _: None,
-                            self.on_incremental_items,
+                            self._items_callback(self.on_incremental_items),
                             if_modified_since,
                         )
 
@@ -195,6 +309,7 @@ class DataPackageListPoller(ABC):
                             raise ValueError("subscription is None")
 
                         if sub.state == DataPackageListState.UP_TO_DATE:
+                            self._wait_for_series()
                             self.on_incremental_stop(False, None)
                             return sub
 
@@ -202,19 +317,58 @@ class DataPackageListPoller(ABC):
 
                         if_modified_since = sub.time_stamp_for_if_modified_since
                     except Exception as ex2:  # pylint: disable=broad-except
+                        self._cancel_series()
                         if self._abort:
                             raise _AbortException() from ex2
                         if attempt >= max_attempts:
                             raise
                         self._sleep(self.on_error_delay)
         except _AbortException as ex:
+            self._cancel_series()
             if is_stated:
                 self.on_incremental_stop(True, cast(Exception, ex.__cause__))
         except Exception as ex:  # pylint: disable=broad-except
+            self._cancel_series()
             if is_stated:
                 self.on_incremental_stop(False, ex)
         return None
 
+    def _items_callback(
+        self, callback: Callable[["DataPackageBody", List["DataPackageListItem"]], None]
+    ) -> Callable[["DataPackageBody", List["DataPackageListItem"]], bool]:
+        def items_callback(subscription: "DataPackageBody", items: List["DataPackageListItem"]) -> bool:
+            if self._abort:
+                return False
+            if self._checkpoint_store is not None:
+                items = self._checkpoint_store.get_unprocessed(items)
+                if not items:
+                    return True
+            callback(subscription, items)
+            if self._pipeline is not None:
+                self._pipeline.put(subscription, items, lambda: self._abort)
+            elif self._checkpoint_store is not None:
+                self._checkpoint_store.set_processed(items)
+            return not self._abort
+
+        return items_callback
+
+    def _process_series(self, subscription: "DataPackageBody", items: List["DataPackageListItem"]) -> None:
+        self.on_series(subscription, list(self._api.get_many_series([x.name for x in items])))
+        if self._checkpoint_store is not None:
+            self._checkpoint_store.set_processed(items)
+
+    def _save_checkpoint(self) -> None:
+        if self._checkpoint_store is not None and self._time_stamp_for_if_modified_since is not None:
+            self._checkpoint_store.save(self._download_full_list_on_or_after, self._time_stamp_for_if_modified_since)
+
+    def _wait_for_series(self) -> None:
+        if self._pipeline is not None:
+            self._pipeline.wait()
+
+    def _cancel_series(self) -> None:
+        if self._pipeline is not None:
+            self._pipeline.cancel()
+
     # full_listing
 
     @abstractmethod
@@ -259,6 +413,15 @@ class DataPackageListPoller(ABC):
             If not None, there was an exception.
         """
 
+    # series
+
+    def on_series(self, subscription: "DataPackageBody", series: List["Series"]) -> None:
+        """
+        This override is called on a worker thread with the downloaded series of a batch of listed items
+        when `series_workers` is greater than 0.
+        The listing is not stopped until all batches are processed.
+        """
+
     def abort(self) -> None:
         """Call this method to stop processing."""
         self._abort = True
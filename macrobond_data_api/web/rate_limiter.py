@@ -0,0 +1,151 @@
+import time
+from threading import BoundedSemaphore, Lock
+from typing import Callable, Dict, Optional
+
+__pdoc__ = {
+    "RateLimiter.__init__": False,
+}
+
+
+class RateLimiter:
+    """
+    Limits the rate and the number of concurrent requests that a `macrobond_data_api.web.session.Session` sends to the
+    API. The limiter is thread-safe and can be shared by several sessions.
+
+    The rate is limited with a token bucket that holds up to `burst` requests and is refilled with `requests_per_second`.
+
+    With `adaptive`, the rate is halved each time the server responds with 429 (Too Many Requests), but not below
+    `min_requests_per_second`. After each successful response, the rate is increased by `increase` requests per second
+    until it is back at `requests_per_second`.
+
+    A streamed response keeps its place among the `max_concurrent` requests until it is closed, so that the download
+    of the body is limited too. Close streamed responses, for example with a `with` statement.
+
+    Parameters
+    ----------
+    requests_per_second : float, optional
+        The maximum number of requests per second, or None to not limit the rate.
+    max_concurrent : int, optional
+        The maximum number of requests that are sent at the same time, or None to not limit it.
+    burst : int
+        The number of requests that can be sent at once after a period without requests.
+    adaptive : bool
+        If True, the rate is lowered when the server responds with 429. This requires `requests_per_second`.
+    min_requests_per_second : float
+        The lowest rate used by `adaptive`.
+    increase : float
+        The number of requests per second that the rate is increased with after each successful response.
+
+    Examples
+    --------
+    ```python
+    with WebClient(rate_limiter=RateLimiter(requests_per_second=20, max_concurrent=8, adaptive=True)) as api:
+        ...
+    ```
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        burst: int = 1,
+        adaptive: bool = False,
+        min_requests_per_second: float = 1,
+        increase: float = 0.1,
+        _time: Callable[[], float] = time.monotonic,
+        _sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be 1 or greater")
+        if burst < 1:
+            raise ValueError("burst must be 1 or greater")
+
+        self.requests_per_second = requests_per_second
+        self.max_concurrent = max_concurrent
+        self.burst = burst
+        self.adaptive = adaptive
+        self.min_requests_per_second = min_requests_per_second
+        self.increase = increase
+
+        self._time = _time
+        self._sleep = _sleep
+        self._lock = Lock()
+        self._semaphore = BoundedSemaphore(max_concurrent) if max_concurrent is not None else None
+        self._rate = requests_per_second
+        self._tokens = float(burst)
+        self._updated = _time()
+        self._requests = 0
+        self._delayed = 0
+        self._throttled = 0
+
+    @property
+    def current_requests_per_second(self) -> Optional[float]:
+        """The rate that is used now, which is lower than `requests_per_second` after 429 responses."""
+        return self._rate
+
+    def acquire(self) -> None:
+        """Wait until a request can be sent. Each call must be followed by a call to `release`."""
+        if self._semaphore is not None:
+            self._semaphore.acquire()  # pylint: disable=consider-using-with
+        delay = 0.0
+        with self._lock:
+            self._requests += 1
+            if self._rate is not None:
+                now = self._time()
+                self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                # Reserve a token, so that waiting threads are served in order
+                self._tokens -= 1
+                if self._tokens < 0:
+                    delay = -self._tokens / self._rate
+                    self._delayed += 1
+        if delay > 0:
+            self._sleep(delay)
+
+    def release(self, status_code: Optional[int] = None) -> None:
+        """
+        Release a request that was started with `acquire`.
+
+        Parameters
+        ----------
+        status_code : int, optional
+            The status code of the response, or None if no response was received.
+        """
+        self._release_slot()
+        self._record_status(status_code)
+
+    def _release_slot(self) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def _record_status(self, status_code: Optional[int]) -> None:
+        if status_code is None:
+            return
+        with self._lock:
+            if status_code == 429:
+                self._throttled += 1
+                if self.adaptive and self._rate is not None:
+                    self._rate = max(self.min_requests_per_second, self._rate / 2)
+            elif self.adaptive and self._rate is not None and self.requests_per_second is not None:
+                self._rate = min(self.requests_per_second, self._rate + self.increase)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get statistics of the limiter.
+
+        Returns
+        -------
+        Dict[str, float]
+            The number of requests ("requests"), how many of those had to wait for the rate limit ("delayed"),
+            the number of 429 responses ("throttled") and the current rate limit ("requests_per_second", 0 if the
+            rate is not limited).
+        """
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "delayed": self._delayed,
+                "throttled": self._throttled,
+                "requests_per_second": self._rate or 0,
+            }
@@ -0,0 +1,129 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, FrozenSet, Optional
+
+__pdoc__ = {
+    "RetryPolicy.__init__": False,
+}
+
+_IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+DEFAULT_IDEMPOTENT_POST_ENDPOINTS = frozenset(
+    [
+        "v1/series/fetchseries",
+        "v1/series/fetchentities",
+        "v1/series/fetchunifiedseries",
+        "v1/series/fetchvintageseries",
+        "v1/series/fetchallvintageseries",
+        "v1/series/fetchnthreleaseseries",
+        "v1/series/fetchobservationhistory",
+        "v1/search/entities",
+        "v1/search/entitiesfordisplay",
+        "v1/release/upcomingreleases",
+        "v1/subscriptionlist/checkifnotincluded",
+        "v1/subscriptionlist/set",
+        "v1/subscriptionlist/add",
+        "v1/subscriptionlist/remove",
+    ]
+)
+"""The POST endpoints that only read data, or that give the same result when they are sent again."""
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Controls how requests to the API are retried when the server is busy or the connection fails.
+
+    The delay before each retry is `backoff_factor * 2 ** retry`, at most `max_delay` seconds. With `jitter`, a random
+    delay between zero and that value is used, so that many clients do not retry at the same time. If the response has
+    a Retry-After header, that delay is used instead, unless it is longer than `max_delay` and the response is returned.
+
+    Only requests that can be sent again without side effects are retried: GET, PUT and DELETE requests, and POST
+    requests to `idempotent_post_endpoints`. Responses with status 429 mean that the request was not processed,
+    so those are retried for all requests.
+
+    Parameters
+    ----------
+    max_retries : int
+        The maximum number of retries of a request. Use 0 to turn retries off.
+    backoff_factor : float
+        The delay in seconds before the first retry.
+    max_delay : float
+        The longest delay in seconds before a retry.
+    jitter : bool
+        If True, a random part of the delay is used.
+    status_codes : Collection[int]
+        The HTTP status codes that are retried.
+    idempotent_post_endpoints : Collection[str]
+        The POST endpoints that can be retried.
+
+    Examples
+    --------
+    ```python
+    with WebClient(retry_policy=RetryPolicy(max_retries=5, max_delay=120)) as api:
+        ...
+    ```
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_delay: float = 30,
+        jitter: bool = True,
+        status_codes: Collection[int] = (429, 502, 503, 504),
+        idempotent_post_endpoints: Collection[str] = DEFAULT_IDEMPOTENT_POST_ENDPOINTS,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries must be 0 or greater")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.status_codes: FrozenSet[int] = frozenset(status_codes)
+        self.idempotent_post_endpoints: FrozenSet[str] = frozenset(idempotent_post_endpoints)
+
+    def is_idempotent(self, method: str, endpoint: str) -> bool:
+        """True if the request can be sent again without side effects."""
+        method = method.upper()
+        return method in _IDEMPOTENT_METHODS or (method == "POST" and endpoint in self.idempotent_post_endpoints)
+
+    def get_delay(self, retry: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Get the number of seconds to wait before a retry, or None if the request should not be retried.
+
+        Parameters
+        ----------
+        retry : int
+            The number of retries that have been made of the request.
+        retry_after : str
+            The Retry-After header of the response.
+        """
+        if retry >= self.max_retries:
+            return None
+        server_delay = _parse_retry_after(retry_after)
+        if server_delay is not None:
+            return server_delay if server_delay <= self.max_delay else None
+        delay = min(self.max_delay, self.backoff_factor * 2**retry)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def should_retry_status(self, method: str, endpoint: str, status_code: int) -> bool:
+        """True if a response with this status should be retried."""
+        if status_code not in self.status_codes:
+            return False
+        return status_code == 429 or self.is_idempotent(method, endpoint)
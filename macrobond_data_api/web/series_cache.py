@@ -0,0 +1,173 @@
+import json
+import sqlite3
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Tuple, cast
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import Series
+
+from ._map_chunks import map_chunks
+from ._split_in_to_chunks import split_in_to_chunks
+from ._web_api_series import _create_series
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .web_api import WebApi
+    from .web_types import EntityRequest, SeriesResponse
+
+__pdoc__ = {
+    "SeriesCache.__init__": False,
+}
+
+
+class SeriesCache:
+    """
+    A local cache of series stored in a SQLite database file.
+
+    When a series is requested, the value of the metadata LastModifiedTimeStamp of the cached copy is sent as
+    ifModifiedSince. If the series has not been modified, the cached copy is returned without downloading it again.
+
+    Parameters
+    ----------
+    api : WebApi
+        The API instance to use.
+    path : str
+        The path of the database file. It is created if it does not exist.
+
+    Examples
+    -------
+    ```python
+    with WebClient() as api, SeriesCache(api, "series_cache.db") as cache:
+        for series in cache.get_many_series(["usgdp", "segdp"]):
+            print(series.name, series.values[-1])
+    ```
+    """
+
+    def __init__(self, api: "WebApi", path: str) -> None:
+        self._api = api
+        self._lock = Lock()
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS series (name TEXT PRIMARY KEY, last_modified TEXT, response TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+        self.hits = 0
+        """The number of series that were not modified and returned from the cache."""
+        self.misses = 0
+        """The number of series that were downloaded."""
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise ValueError("SeriesCache is closed")
+        return self._connection
+
+    def get_one_series(self, series_name: str) -> Series:
+        """
+        Get a series, from the cache if it has not been modified.
+
+        Parameters
+        ----------
+        series_name : str
+            The name of the series.
+
+        Returns
+        -------
+        `macrobond_data_api.common.types.series.Series`
+        """
+        return next(self.get_many_series([series_name]))
+
+    def get_many_series(self, series_names: Sequence[str], max_workers: int = 1) -> Generator[Series, None, None]:
+        """
+        Get one or more series, from the cache if they have not been modified.
+        The series are returned in the same order as in the request.
+
+        Parameters
+        ----------
+        series_names : Sequence[str]
+            The names of the series.
+        max_workers : int
+            The maximum number of chunk requests in flight at the same time.
+
+        Returns
+        -------
+        `Generator[macrobond_data_api.common.types.series.Series]`
+        """
+        if len(set(series_names)) != len(series_names):
+            raise ValueError("duplicate of series")
+
+        session = self._api.session
+
+        def fetch_chunk(requests: List["EntityRequest"]) -> Tuple[List["EntityRequest"], List["SeriesResponse"]]:
+            return requests, session.series.post_fetch_series(*requests)
+
+        requests_chunks = (self._create_requests(x) for x in split_in_to_chunks(series_names, 200))
+
+        for requests, response_list in map_chunks(fetch_chunk, requests_chunks, max_workers):
+            series: List[Series] = []
+            with self._lock:
+                db = self._db
+                for response, request in zip(response_list, requests):
+                    name = request["name"]
+                    error_code = response.get("errorCode")
+                    if error_code == StatusCode.NOT_MODIFIED:
+                        cached = self._load(name)
+                        if cached is not None:
+                            self.hits += 1
+                            response = cached
+                    elif not response.get("errorText"):
+                        self.misses += 1
+                        last_modified = cast(Dict[str, Any], response["metadata"]).get("LastModifiedTimeStamp")
+                        db.execute(
+                            "INSERT OR REPLACE INTO series (name, last_modified, response) VALUES (?, ?, ?)",
+                            (name, last_modified if isinstance(last_modified, str) else None, json.dumps(response)),
+                        )
+                    series.append(_create_series(response, name, session, self._api.use_numpy_arrays))
+                db.commit()
+            yield from series
+
+    def remove(self, series_names: Sequence[str]) -> None:
+        """
+        Remove one or more series from the cache.
+
+        Parameters
+        ----------
+        series_names : Sequence[str]
+            The names of the series.
+        """
+        with self._lock:
+            self._db.executemany("DELETE FROM series WHERE name = ?", ((x,) for x in series_names))
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all series from the cache."""
+        with self._lock:
+            self._db.execute("DELETE FROM series")
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the database file."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _create_requests(self, series_names: Sequence[str]) -> List["EntityRequest"]:
+        with self._lock:
+            last_modified: Dict[str, Optional[str]] = dict(
+                self._db.execute(
+                    f"SELECT name, last_modified FROM series WHERE name IN ({','.join('?' * len(series_names))})",
+                    list(series_names),
+                ).fetchall()
+            )
+        return [{"name": x, "ifModifiedSince": last_modified.get(x)} for x in series_names]
+
+    def _load(self, series_name: str) -> Optional["SeriesResponse"]:
+        row = self._db.execute("SELECT response FROM series WHERE name = ?", (series_name,)).fetchone()
+        return cast("SeriesResponse", json.loads(row[0])) if row else None
+
+    def __enter__(self) -> "SeriesCache":
+        return self
+
+    def __exit__(self, exception_type: Any, exception_value: Any, traceback: Any) -> None:
+        self.close()
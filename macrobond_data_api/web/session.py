@@ -1,6 +1,13 @@
-from typing import Dict, Optional, Any, TYPE_CHECKING, Sequence, Type, cast
-
+import time
+from io import RawIOBase
+from threading import Lock
+from typing import Callable, Dict, Iterator, Optional, Any, TYPE_CHECKING, Sequence, Tuple, Type, Union, cast
+
+import ijson
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout as RequestsTimeout
 from requests.sessions import Session as RequestsSession
+from urllib3.util.request import ACCEPT_ENCODING
 from macrobond_data_api.common.types import Metadata
 from macrobond_data_api.web._auth_client import _AuthClient
 
@@ -19,6 +26,8 @@ from .scope import Scope
 from ._metadata_directory import _MetadataTypeDirectory
 from ._metadata import _Metadata
 from .configuration import Configuration
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
 
 if TYPE_CHECKING:  # pragma: no cover
     from requests import Response
@@ -28,14 +37,103 @@ __pdoc__ = {
 }
 
 
-class _ResponseAsFileObject:
-    def __init__(self, response: "Response", chunk_size: int = 65536) -> None:
-        self.data = response.iter_content(chunk_size=chunk_size)
+def _raise_on_error(response: "Response", non_error_status: Optional[Sequence[int]] = None) -> "Response":
+    if non_error_status is None:
+        non_error_status = [200]
+
+    if response.status_code in non_error_status:
+        return response
+
+    content_type = response.headers.get("Content-Type")
+
+    if content_type in ["application/json; charset=utf-8", "application/json"]:
+        raise ProblemDetailsException.create_from_response(response)
+
+    macrobond_status = response.headers.get("X-Macrobond-Status")
+    if macrobond_status:
+        raise ProblemDetailsException(response, detail=macrobond_status)
+
+    raise HttpException(response)
+
+
+class _ResponseAsFileObject(RawIOBase):
+    """A readable file object over the (decompressed) body of a streamed response."""
 
-    def read(self, n: int) -> bytes:
-        if n == 0:
-            return b""
-        return next(self.data, b"")
+    def __init__(
+        self, response: "Response", chunk_size: int = 65536, on_end: Optional[Callable[[int], None]] = None
+    ) -> None:
+        super().__init__()
+        self.data = self._count(response.iter_content(chunk_size=chunk_size), on_end)
+        self._chunk = memoryview(b"")
+        self.bytes_read = 0
+        """The number of decompressed bytes read from the response."""
+
+    def _count(self, chunks: Iterator[bytes], on_end: Optional[Callable[[int], None]]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.bytes_read += len(chunk)
+            yield chunk
+        if on_end is not None:
+            on_end(self.bytes_read)
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            return self.readall()
+        if not self._chunk:
+            chunk = next(self.data, None)
+            while chunk is not None and not chunk:
+                chunk = next(self.data, None)
+            if chunk is None:
+                return b""
+            if len(chunk) <= size:
+                # The whole chunk fits, so it is returned without copying
+                return cast(bytes, chunk)
+            self._chunk = memoryview(chunk)
+        n = min(size, len(self._chunk))
+        ret = self._chunk[:n].tobytes()
+        self._chunk = self._chunk[n:]
+        return ret
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._chunk:
+            chunk = next(self.data, None)
+            if chunk is None:
+                return 0
+            self._chunk = memoryview(chunk)
+        n = min(len(buffer), len(self._chunk))
+        buffer[:n] = self._chunk[:n]
+        self._chunk = self._chunk[n:]
+        return n
+
+
+def _wire_bytes(response: "Response", default: int) -> int:
+    """The number of bytes of the body received over the network, before it was decompressed."""
+    try:
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError, OSError):
+        return default
+
+
+class _PoolStatsHTTPAdapter(HTTPAdapter):
+    """A HTTPAdapter that can report how many connections its pools have opened and reused."""
+
+    def stats(self) -> Dict[str, int]:
+        pools = self.poolmanager.pools
+        requests = 0
+        connections = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests += pool.num_requests
+            connections += pool.num_connections
+        return {
+            "requests": requests,
+            "connections": connections,
+            "reused": max(0, requests - connections),
+        }
 
 
 class Session:
@@ -93,6 +191,15 @@ class Session:
         authorization_url: str = None,
         proxy: str = None,
         use_access_token_cache: bool = True,
+        access_token_cache_path: str = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: Union[float, Tuple[float, float], None] = None,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        compression: bool = True,
     ) -> None:
         if api_url is None:
             api_url = Configuration._default_api_url
@@ -113,11 +220,40 @@ class Session:
             api_url = api_url + "/"
         self.__api_url = api_url
 
+        self.timeout = timeout
+        """The connect and read timeout in seconds of each request, as a number or a tuple (connect, read)."""
+
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        """Controls how requests to the API are retried, see `macrobond_data_api.web.retry_policy.RetryPolicy`."""
+        self.rate_limiter = rate_limiter
+        """
+        Limits the rate and concurrency of the requests to the API, see
+        `macrobond_data_api.web.rate_limiter.RateLimiter`. None if the requests are not limited.
+        """
+        self._headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING if compression else "identity",
+        }
+        self._transfer_stats_lock = Lock()
+        self._transfer_stats: Dict[str, Dict[str, int]] = {}
+        self._sleep: Callable[[float], None] = time.sleep
+        self._retry_stats_lock = Lock()
+        self._retry_stats = {"retries": 0, "retried_requests": 0, "failed_after_retries": 0}
+
         self.requests_session = RequestsSession()
         if proxy:
             self.requests_session.proxies = {"https": proxy, "http": proxy}
+        if not keep_alive:
+            self.requests_session.headers["Connection"] = "close"
 
-        self._auth_client = _AuthClient(username, password, scopes, authorization_url, self, use_access_token_cache)
+        self._api_adapter = _PoolStatsHTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+        self.requests_session.mount(api_url, self._api_adapter)
+
+        self._auth_client = _AuthClient(
+            username, password, scopes, authorization_url, self, use_access_token_cache, access_token_cache_path
+        )
 
         self.__metadata = MetadataMethods(self)
         self.__search = SearchMethods(self)
@@ -178,25 +314,28 @@ class Session:
         return self.raise_on_error(self.delete(url, params, stream=stream), non_error_status)
 
     def raise_on_error(self, response: "Response", non_error_status: Sequence[int] = None) -> "Response":
-        if non_error_status is None:
-            non_error_status = [200]
-
-        if response.status_code in non_error_status:
-            return response
-
-        content_type = response.headers.get("Content-Type")
+        try:
+            return _raise_on_error(response, non_error_status)
+        except Exception:
+            response.close()
+            raise
 
-        if content_type in ["application/json; charset=utf-8", "application/json"]:
-            raise ProblemDetailsException.create_from_response(response)
-
-        macrobond_status = response.headers.get("X-Macrobond-Status")
-        if macrobond_status:
-            raise ProblemDetailsException(response, detail=macrobond_status)
+    def _response_to_file_object(self, response: "Response") -> _ResponseAsFileObject:
+        return _ResponseAsFileObject(
+            response,
+            Configuration._stream_buffer_size,
+            lambda uncompressed_bytes: self._record_transfer(response, uncompressed_bytes),
+        )
 
-        raise HttpException(response)
+    def _ijson_items(self, response: "Response", prefix: str, **config: Any) -> Iterator[Any]:
+        return ijson.items(
+            self._response_to_file_object(response), prefix, buf_size=Configuration._stream_buffer_size, **config
+        )
 
-    def _response_to_file_object(self, response: "Response") -> _ResponseAsFileObject:
-        return _ResponseAsFileObject(response)
+    def _ijson_parse(self, response: "Response", **config: Any) -> Iterator[Any]:
+        return ijson.parse(
+            self._response_to_file_object(response), buf_size=Configuration._stream_buffer_size, **config
+        )
 
     def _request(
         self, method: str, url: str, params: Optional[Dict[str, Any]], json: object, stream: bool
@@ -204,7 +343,124 @@ class Session:
         if not self._is_open:
             raise ValueError("Session is not open")
 
+        policy = self.retry_policy
+        retry = 0
+        while True:
+            try:
+                response = self._send_limited(method, url, params, json, stream)
+            except (RequestsConnectionError, RequestsTimeout):
+                delay = policy.get_delay(retry) if policy.is_idempotent(method, url) else None
+                if delay is None:
+                    self._count_retries(retry, failed=True)
+                    raise
+            else:
+                if not policy.should_retry_status(method, url, response.status_code):
+                    self._count_retries(retry, failed=False)
+                    return self._record_content_transfer(response, stream)
+                delay = policy.get_delay(retry, response.headers.get("Retry-After"))
+                if delay is None:
+                    self._count_retries(retry, failed=True)
+                    return self._record_content_transfer(response, stream)
+                response.close()
+
+            retry += 1
+            self._sleep(delay)
+
+    def _count_retries(self, retries: int, failed: bool) -> None:
+        if retries == 0:
+            return
+        with self._retry_stats_lock:
+            self._retry_stats["retries"] += retries
+            self._retry_stats["retried_requests"] += 1
+            if failed:
+                self._retry_stats["failed_after_retries"] += 1
+
+    def _record_content_transfer(self, response: "Response", stream: bool) -> "Response":
+        if not stream:
+            self._record_transfer(response, len(response.content or b""))
+        return response
+
+    def _record_transfer(self, response: "Response", uncompressed_bytes: int) -> None:
+        url = response.request.url if response.request is not None else response.url
+        endpoint = (url or "").split("?", 1)[0]
+        if endpoint.startswith(self.api_url):
+            endpoint = endpoint[len(self.api_url) :]
+        compressed_bytes = _wire_bytes(response, uncompressed_bytes)
+        with self._transfer_stats_lock:
+            stats = self._transfer_stats.get(endpoint)
+            if stats is None:
+                stats = self._transfer_stats[endpoint] = {
+                    "responses": 0,
+                    "compressed_bytes": 0,
+                    "uncompressed_bytes": 0,
+                }
+            stats["responses"] += 1
+            stats["compressed_bytes"] += compressed_bytes
+            stats["uncompressed_bytes"] += uncompressed_bytes
+
+    def transfer_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get the number of bytes received from the API for each endpoint.
+        The bytes of streamed responses are counted when the whole response has been read.
+
+        Returns
+        -------
+        Dict[str, Dict[str, int]]
+            For each endpoint, the number of responses ("responses"), the bytes received over the network
+            ("compressed_bytes") and the bytes after decompression ("uncompressed_bytes").
+        """
+        with self._transfer_stats_lock:
+            return {x: dict(y) for x, y in self._transfer_stats.items()}
+
+    def retry_stats(self) -> Dict[str, int]:
+        """
+        Get statistics of the retries made by `retry_policy`.
+
+        Returns
+        -------
+        Dict[str, int]
+            The total number of retries ("retries"), the number of requests that were retried ("retried_requests")
+            and how many of those still failed after the last retry ("failed_after_retries").
+        """
+        with self._retry_stats_lock:
+            return dict(self._retry_stats)
+
+    def _send_limited(
+        self, method: str, url: str, params: Optional[Dict[str, Any]], json: object, stream: bool
+    ) -> "Response":
+        rate_limiter = self.rate_limiter
+        if rate_limiter is None:
+            return self._send(method, url, params, json, stream)
+
+        rate_limiter.acquire()
+        try:
+            response = self._send(method, url, params, json, stream)
+        except BaseException:
+            rate_limiter.release()
+            raise
+
+        if not stream:
+            rate_limiter.release(response.status_code)
+            return response
+
+        # The body of a streamed response is downloaded later, so the slot is held until the response is closed
+        rate_limiter._record_status(response.status_code)
+        close = response.close
+        released = Lock()
+
+        def close_and_release() -> None:
+            try:
+                close()
+            finally:
+                if released.acquire(blocking=False):  # pylint: disable=consider-using-with
+                    rate_limiter._release_slot()
+
+        response.close = close_and_release  # type: ignore[method-assign]
+        return response
+
+    def _send(self, method: str, url: str, params: Optional[Dict[str, Any]], json: object, stream: bool) -> "Response":
         self._auth_client.fetch_token_if_necessary()
+        access_token = self._auth_client._cache._get().access_token
 
         response = self.requests_session.request(
             method,
@@ -212,25 +468,55 @@ class Session:
             params=params,
             json=json,
             stream=stream,
-            headers={"Accept": "application/json"},
+            headers=self._headers,
             auth=self._auth_client.requests_auth,
+            timeout=self.timeout,
         )
 
         if response.status_code == 401:
-            self._auth_client.fetch_token()
+            self._auth_client._fetch_token_if_current(access_token)
             response = self.requests_session.request(
                 method,
                 self.api_url + url,
                 params=params,
                 json=json,
                 stream=stream,
-                headers={"Accept": "application/json"},
+                headers=self._headers,
                 auth=self._auth_client.requests_auth,
+                timeout=self.timeout,
             )
         return response
 
+    def metadata_type_directory_stats(self) -> Dict[str, int]:
+        """
+        Get statistics of the cache of metadata attribute types, which is shared by all sessions in the process.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of lookups that were found in the cache ("hits") or not ("misses"),
+            the number of cached attributes ("size") and how many of those were not found by the server ("unknown").
+        """
+        return _MetadataTypeDirectory._stats()
+
+    def connection_pool_stats(self) -> Dict[str, int]:
+        """
+        Get statistics of the pooled connections to the API.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of requests sent ("requests"), the number of connections that were opened ("connections")
+            and how many requests reused an open connection ("reused").
+            If "connections" grows with "requests", the pool is too small for the number of threads.
+        """
+        return self._api_adapter.stats()
+
     def _create_metadata(self, data: Optional[Dict[str, Any]]) -> Metadata:
-        return cast(Metadata, _Metadata(data, self._metadata_type_directory)) if data else {}
+        if not data:
+            return {}
+        self._metadata_type_directory.register(data)
+        return cast(Metadata, _Metadata(data, self._metadata_type_directory))
 
     def debug(self) -> None:
         # pylint: disable=W0613
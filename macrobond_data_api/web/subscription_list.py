@@ -1,11 +1,51 @@
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Sequence, List, Dict, Iterator
+from threading import Lock
+from typing import Any, Callable, Sequence, List, Dict, Iterator, Optional, Tuple
 
-from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+from macrobond_data_api.common.types._parse_iso8601 import _Iso8601Memo, _parse_iso8601_fast
 
+from ._map_chunks import map_chunks
+from ._split_in_to_chunks import split_in_to_chunks
 from .session import Session
 
+_CHECK_TIMEOUT = 60.0
+_CHECK_FIRST_DELAY = 0.1
+_CHECK_MAX_DELAY = 5.0
+
+
+def _create_batches(endpoint: str, keys: Sequence[str], batch_size: int) -> List[Tuple[str, Sequence[str]]]:
+    """Split a change in requests of at most batch_size keys. Only the first request of a set replaces the list."""
+    if not isinstance(keys, Sequence):
+        raise TypeError("keys is not a sequence")
+    if batch_size < 1:
+        raise ValueError("batch_size must be 1 or greater")
+    if len(keys) <= batch_size:
+        return [(endpoint, keys)]
+    batches = list(split_in_to_chunks(keys, batch_size))
+    if endpoint == "v1/subscriptionlist/set":
+        return [(endpoint, batches[0])] + [("v1/subscriptionlist/add", x) for x in batches[1:]]
+    return [(endpoint, x) for x in batches]
+
+
+def _still_pending(endpoint: str, keys: Sequence[str], not_included: Sequence[str]) -> List[str]:
+    """Get the keys of a change that are not yet visible in the list."""
+    if endpoint == "v1/subscriptionlist/remove":
+        not_included_set = set(not_included)
+        return [x for x in keys if x not in not_included_set]
+    keys_set = set(keys)
+    return [x for x in not_included if x in keys_set]
+
+
+def _parse_updates(data: Dict[str, Any]) -> Tuple[bool, datetime, Dict[str, datetime]]:
+    memo = _Iso8601Memo()
+    return (
+        data["noMoreChanges"],
+        _parse_iso8601_fast(data["timeStampForIfModifiedSince"]),
+        {entity["name"]: memo.parse(entity["modified"]) for entity in data["entities"]},
+    )
+
 
 class SubscriptionList:
     """
@@ -67,7 +107,21 @@ class SubscriptionList:
         Specifies the time interval between polls.
         """
 
+        self.batch_size = 1000
+        """
+        The maximum number of series sent in each request when the list is changed.
+        """
+
+        self.max_workers = 4
+        """
+        The maximum number of batches that are checked at the same time when waiting for a change to be applied.
+        """
+
         self._next_poll = datetime.now(timezone.utc)
+        self._sleep: Callable[[float], None] = time.sleep
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+        self._closed = False
 
     def list(self) -> List[str]:
         """
@@ -97,7 +151,7 @@ class SubscriptionList:
         if not self._session._is_open:
             raise ValueError("WebApi is not open")
 
-        self._call("v1/subscriptionlist/set", keys)
+        self._change("v1/subscriptionlist/set", keys)
 
     def add(self, keys: Sequence[str]) -> None:
         """
@@ -113,7 +167,7 @@ class SubscriptionList:
         if not self._session._is_open:
             raise ValueError("WebApi is not open")
 
-        self._call("v1/subscriptionlist/add", keys)
+        self._change("v1/subscriptionlist/add", keys)
 
     def remove(self, keys: Sequence[str]) -> None:
         """
@@ -129,14 +183,61 @@ class SubscriptionList:
         if not self._session._is_open:
             raise ValueError("WebApi is not open")
 
-        key_set = set(keys)
-        self._session.post_or_raise("v1/subscriptionlist/remove", json=keys)
-        timeout = datetime.now(timezone.utc) + timedelta(minutes=1)
-        while (
-            datetime.now(timezone.utc) < timeout
-            and set(self._session.post_or_raise("v1/subscriptionlist/checkifnotincluded", json=keys).json()) != key_set
-        ):
-            time.sleep(1)
+        self._change("v1/subscriptionlist/remove", keys)
+
+    def set_nowait(self, keys: Sequence[str]) -> "Future[None]":
+        """
+        Set what series to include in the subscription list without waiting for the change to be applied.
+        This will replace all previous series in the list.
+
+        The changes made with `set_nowait`, `add_nowait` and `remove_nowait` are applied one at a time, in the
+        order they were made, on a worker thread that is stopped by `close`.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+
+        Returns
+        -------
+        `concurrent.futures.Future[None]`
+            A future that is done when the change has been applied.
+        """
+        return self._submit("v1/subscriptionlist/set", keys)
+
+    def add_nowait(self, keys: Sequence[str]) -> "Future[None]":
+        """
+        Add one or more series to the subscription list without waiting for the change to be applied.
+        See `set_nowait`.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+
+        Returns
+        -------
+        `concurrent.futures.Future[None]`
+            A future that is done when the change has been applied.
+        """
+        return self._submit("v1/subscriptionlist/add", keys)
+
+    def remove_nowait(self, keys: Sequence[str]) -> "Future[None]":
+        """
+        Remove one or more series from the subscription list without waiting for the change to be applied.
+        See `set_nowait`.
+
+        Parameters
+        ----------
+        keys : Sequence[str]
+            A sequence of series names.
+
+        Returns
+        -------
+        `concurrent.futures.Future[None]`
+            A future that is done when the change has been applied.
+        """
+        return self._submit("v1/subscriptionlist/remove", keys)
 
     def poll(self) -> Dict[str, datetime]:
         """
@@ -160,12 +261,11 @@ class SubscriptionList:
             "v1/subscriptionlist/getupdates", params={"ifModifiedSince": self.last_modified.isoformat()}
         ).json()
 
-        self.no_more_changes = data["noMoreChanges"]
+        self.no_more_changes, self.last_modified, changes = _parse_updates(data)
         if self.no_more_changes:
             self._next_poll = datetime.now(timezone.utc) + self.poll_interval
 
-        self.last_modified = _parse_iso8601(data["timeStampForIfModifiedSince"])
-        return {entity["name"]: _parse_iso8601(entity["modified"]) for entity in data["entities"]}
+        return changes
 
     def poll_until_no_more_changes(self) -> Iterator[Dict[str, datetime]]:
         """
@@ -183,13 +283,61 @@ class SubscriptionList:
             if self.no_more_changes:
                 break
 
-    def _call(self, endpoint: str, keys: Sequence[str]) -> None:
-        if not isinstance(keys, Sequence):
-            raise TypeError("keys is not a sequence")
-        self._session.post_or_raise(endpoint, json=keys)
-        timeout = datetime.now(timezone.utc) + timedelta(minutes=1)
-        while (
-            datetime.now(timezone.utc) < timeout
-            and self._session.post_or_raise("v1/subscriptionlist/checkifnotincluded", json=keys).json()
+    def close(self) -> None:
+        """
+        Wait for the changes started with `set_nowait`, `add_nowait` and `remove_nowait` and stop the worker thread.
+        """
+        with self._executor_lock:
+            self._closed = True
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> "SubscriptionList":
+        return self
+
+    def __exit__(self, exception_type: Any, exception_value: Any, traceback: Any) -> None:
+        self.close()
+
+    def _submit(self, endpoint: str, keys: Sequence[str]) -> "Future[None]":
+        if not self._session._is_open:
+            raise ValueError("WebApi is not open")
+
+        batches = _create_batches(endpoint, keys, self.batch_size)
+        with self._executor_lock:
+            if self._closed:
+                raise ValueError("SubscriptionList is closed")
+            if self._executor is None:
+                # One worker, so that the changes are applied in order
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SubscriptionList")
+            return self._executor.submit(self._apply, endpoint, batches)
+
+    def _change(self, endpoint: str, keys: Sequence[str]) -> None:
+        if not self._session._is_open:
+            raise ValueError("WebApi is not open")
+
+        self._apply(endpoint, _create_batches(endpoint, keys, self.batch_size))
+
+    def _apply(self, endpoint: str, batches: List[Tuple[str, Sequence[str]]]) -> None:
+        for batch_endpoint, batch in batches:
+            self._session.post_or_raise(batch_endpoint, json=batch)
+
+        timeout = time.monotonic() + _CHECK_TIMEOUT
+        for _ in map_chunks(
+            lambda x: self._wait_until_applied(endpoint, x, timeout),
+            [x for _, x in batches if x],
+            max(1, min(self.max_workers, len(batches))),
         ):
-            time.sleep(1)
+            ...
+
+    def _wait_until_applied(self, endpoint: str, keys: Sequence[str], timeout: float) -> None:
+        delay = _CHECK_FIRST_DELAY
+        while True:
+            not_included = self._session.post_or_raise("v1/subscriptionlist/checkifnotincluded", json=keys).json()
+            keys = _still_pending(endpoint, keys, not_included)
+            remaining = timeout - time.monotonic()
+            if not keys or remaining <= 0:
+                return
+            self._sleep(min(delay, remaining))
+            delay = min(delay * 2, _CHECK_MAX_DELAY)
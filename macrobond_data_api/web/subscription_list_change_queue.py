@@ -0,0 +1,177 @@
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, Generator, List, Mapping, Optional, Tuple
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import Series
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .web_api import WebApi
+    from .subscription_list import SubscriptionList
+
+__pdoc__ = {
+    "SubscriptionListChangeQueue.__init__": False,
+}
+
+
+class SubscriptionListChangeQueue:
+    """
+    Collects the changes from a `macrobond_data_api.web.subscription_list.SubscriptionList` and downloads the changed
+    series in batches, so that a series that changes several times in a short time is only downloaded once.
+
+    The changes are collected for `window` seconds after the first change, and only the latest modification time of
+    each series is kept. The series are then downloaded with `get_many_series`, using the modification time of the
+    previous download as ifModifiedSince, so that series that have not changed since are not downloaded again.
+
+    Parameters
+    ----------
+    api : WebApi
+        The API instance to use.
+    subscription_list : SubscriptionList
+        The subscription list to poll.
+    window : float
+        The number of seconds to collect changes before the series are downloaded.
+    max_pending : int
+        The series are downloaded without waiting for the window when this many series have changed.
+    last_downloaded : Mapping[str, datetime]
+        The saved value of `last_downloaded` from the previous run.
+    max_workers : int
+        The maximum number of chunks downloaded at the same time, see `get_many_series`.
+
+    Examples
+    --------
+    ```python
+    with WebClient() as api:
+        subscription_list = api.subscription_list(datetime.now(timezone.utc))
+        subscription_list.set(["sek", "nok"])
+        queue = SubscriptionListChangeQueue(api, subscription_list, window=60)
+        for series in queue.poll_series():
+            print(series.name, series.values[-1])
+    ```
+    """
+
+    def __init__(
+        self,
+        api: "WebApi",
+        subscription_list: "SubscriptionList",
+        window: float = 30,
+        max_pending: int = 10000,
+        last_downloaded: Optional[Mapping[str, datetime]] = None,
+        max_workers: int = 1,
+        _time: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._api = api
+        self._subscription_list = subscription_list
+        self._time = _time
+        self._pending: Dict[str, datetime] = {}
+        self._window_end: Optional[float] = None
+
+        self.window = window
+        """The number of seconds to collect changes before the series are downloaded."""
+        self.max_pending = max_pending
+        """The series are downloaded without waiting for the window when this many series have changed."""
+        self.max_workers = max_workers
+        """The maximum number of chunks downloaded at the same time."""
+
+        self.last_downloaded: Dict[str, datetime] = dict(last_downloaded) if last_downloaded else {}
+        """The modification time of each series when it was last downloaded. Save this for the next run."""
+
+        self.changes = 0
+        """The number of changes received from the subscription list."""
+        self.downloads = 0
+        """The number of series that were downloaded."""
+
+    @property
+    def pending(self) -> Dict[str, datetime]:
+        """The series that have changed but have not been downloaded, with their latest modification time."""
+        return dict(self._pending)
+
+    def add(self, changes: Mapping[str, datetime]) -> None:
+        """
+        Add changes to the queue. Only the latest modification time of each series is kept.
+
+        Parameters
+        ----------
+        changes : Mapping[str, datetime]
+            The names of the changed series and their modification time, as returned by `SubscriptionList.poll`.
+        """
+        if changes and not self._pending:
+            self._window_end = self._time() + self.window
+        self.changes += len(changes)
+        for name, modified in changes.items():
+            previous = self._pending.get(name)
+            if previous is None or modified > previous:
+                self._pending[name] = modified
+
+    def is_due(self) -> bool:
+        """True if there are pending changes and the window has passed or there are too many pending changes."""
+        if not self._pending:
+            return False
+        return len(self._pending) >= self.max_pending or (
+            self._window_end is not None and self._time() >= self._window_end
+        )
+
+    def download_pending(self) -> Generator[Series, None, None]:
+        """
+        Download the pending series now.
+        Series that have not been modified since the previous download are not returned.
+        Series that could not be downloaded are returned with an error and are downloaded again on the next change.
+        If the generator is closed early or the download fails, the series that were not returned stay pending.
+
+        Returns
+        -------
+        `Generator[macrobond_data_api.common.types.series.Series]`
+        """
+        pending = dict(self._pending)
+
+        def handled(name: str) -> None:
+            # A newer change that was added during the download stays pending
+            if self._pending.get(name) == pending[name]:
+                del self._pending[name]
+
+        requests: List[Tuple[str, Optional[datetime]]] = [(x, self.last_downloaded.get(x)) for x in pending]
+        try:
+            for series in self._api.get_many_series(requests, include_not_modified=True, max_workers=self.max_workers):
+                handled(series.name)
+                if series.status_code == StatusCode.NOT_MODIFIED:
+                    # Already up to date since the previous download
+                    self.last_downloaded[series.name] = pending[series.name]
+                    continue
+                if not series.is_error:
+                    self.downloads += 1
+                    self.last_downloaded[series.name] = pending[series.name]
+                yield series
+        finally:
+            if not self._pending:
+                self._window_end = None
+
+    def poll_series(self) -> Generator[Series, None, None]:
+        """
+        Poll the subscription list and download the changed series when the window has passed.
+        This continues until the generator is closed.
+
+        Returns
+        -------
+        `Generator[macrobond_data_api.common.types.series.Series]`
+        """
+        while True:
+            self.add(self._subscription_list.poll())
+            if self.is_due():
+                yield from self.download_pending()
+
+    def poll_series_until_no_more_changes(self) -> Generator[Series, None, None]:
+        """
+        Poll the subscription list until there are no more changes, then download all changed series once.
+
+        Returns
+        -------
+        `Generator[macrobond_data_api.common.types.series.Series]`
+        """
+        while True:
+            self.add(self._subscription_list.poll())
+            if len(self._pending) >= self.max_pending:
+                yield from self.download_pending()
+            if self._subscription_list.no_more_changes:
+                break
+        if self._pending:
+            yield from self.download_pending()
@@ -0,0 +1,284 @@
+import json
+import sqlite3
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sequence, Tuple
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import GetAllVintageSeriesResult, SeriesWithVintages, VintageSeries
+from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601_fast
+
+from ._map_chunks import map_chunk_streams
+from ._split_in_to_chunks import split_in_to_chunks
+from ._web_api_revision import _create_series_with_vintages
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .web_api import WebApi
+    from .web_types import SeriesWithVintagesResponse, RevisionHistoryRequest as WebRevisionHistoryRequest
+
+__pdoc__ = {
+    "VintageStore.__init__": False,
+}
+
+
+class VintageStore:
+    """
+    A local copy of all vintages of series, stored in a SQLite database file.
+
+    `sync` downloads the changes of the series since the previous sync. The values of the metadata
+    LastModifiedTimeStamp, LastRevisionTimeStamp and LastRevisionAdjustmentTimeStamp of the stored copy are sent with
+    the request, so that series that have not been modified are not downloaded and only the new vintages are downloaded
+    for series that have new revisions. If the history of a series has been adjusted, all vintages are downloaded
+    again.
+
+    The stored series can then be read without making any requests.
+
+    Parameters
+    ----------
+    api : WebApi
+        The API instance to use.
+    path : str
+        The path of the database file. It is created if it does not exist.
+
+    Examples
+    -------
+    ```python
+    with WebClient() as api, VintageStore(api, "vintages.db") as store:
+        store.sync(["usgdp", "segdp"])
+        print(store.get_all_vintage_series("usgdp").to_pd_data_frame())
+    ```
+    """
+
+    def __init__(self, api: "WebApi", path: str) -> None:
+        self._api = api
+        self._lock = Lock()
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS series ("
+            "name TEXT PRIMARY KEY, last_modified TEXT, last_revision TEXT, last_revision_adjustment TEXT, "
+            "metadata TEXT NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS vintages ("
+            "name TEXT NOT NULL, vintage_time_stamp TEXT NOT NULL, dates TEXT NOT NULL, vals TEXT NOT NULL, "
+            "PRIMARY KEY (name, vintage_time_stamp))"
+        )
+        self._connection.commit()
+
+        self.full_downloads = 0
+        """The number of series for which all vintages were downloaded."""
+        self.partial_downloads = 0
+        """The number of series for which only the new vintages were downloaded."""
+        self.not_modified = 0
+        """The number of series that had not been modified."""
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            raise ValueError("VintageStore is closed")
+        return self._connection
+
+    def sync(self, series_names: Sequence[str], max_workers: int = 1) -> Dict[str, StatusCode]:
+        """
+        Download the changes of the series since the previous sync and store them.
+
+        Parameters
+        ----------
+        series_names : Sequence[str]
+            The names of the series.
+        max_workers : int
+            The maximum number of chunks downloaded at the same time.
+
+        Returns
+        -------
+        Dict[str, `macrobond_data_api.common.enums.status_code.StatusCode`]
+            The result for each series: `OK` if all vintages were downloaded, `PARTIAL_CONTENT` if only the new
+            vintages were downloaded, `NOT_MODIFIED` if the series had not been modified, or the error.
+            Series with errors are not changed in the store.
+        """
+        if len(set(series_names)) != len(series_names):
+            raise ValueError("duplicate of series")
+
+        session = self._api.session
+
+        def stream_chunk(
+            requests: List["WebRevisionHistoryRequest"],
+        ) -> Generator[Tuple[str, "SeriesWithVintagesResponse"], None, None]:
+            with session.series.post_fetch_all_vintage_series(requests, stream=True) as response:
+                session.raise_on_error(response)
+                for item, request in zip(session._ijson_items(response, "item", use_float=True), requests):
+                    yield request["name"], item
+
+        result: Dict[str, StatusCode] = {}
+        requests_chunks = (self._create_requests(x) for x in split_in_to_chunks(series_names, 200))
+        for name, item in map_chunk_streams(stream_chunk, requests_chunks, max_workers):
+            error_code = item.get("errorCode")
+            status_code = StatusCode(error_code) if error_code else StatusCode.OK
+            with self._lock:
+                if status_code == StatusCode.OK:
+                    self.full_downloads += 1
+                    self._store(name, item, replace=True)
+                elif status_code == StatusCode.PARTIAL_CONTENT:
+                    self.partial_downloads += 1
+                    self._store(name, item, replace=False)
+                elif status_code == StatusCode.NOT_MODIFIED:
+                    self.not_modified += 1
+            result[name] = status_code
+        return result
+
+    def get_series_with_vintages(self, series_name: str) -> Optional[SeriesWithVintages]:
+        """
+        Get all stored vintages of a series, without making any requests.
+
+        Parameters
+        ----------
+        series_name : str
+            The name of the series.
+
+        Returns
+        -------
+        `macrobond_data_api.common.types.series_with_vintages.SeriesWithVintages`
+            The series, or None if it is not stored.
+        """
+        item = self._load(series_name)
+        if item is None:
+            return None
+        return _create_series_with_vintages(item, StatusCode.OK, self._api.session)
+
+    def get_all_vintage_series(self, series_name: str) -> GetAllVintageSeriesResult:
+        """
+        Get all stored vintages of a series as vintage series, without making any requests.
+
+        Parameters
+        ----------
+        series_name : str
+            The name of the series.
+
+        Returns
+        -------
+        `macrobond_data_api.common.types.get_all_vintage_series_result.GetAllVintageSeriesResult`
+        """
+        series = self.get_series_with_vintages(series_name)
+        if series is None:
+            raise ValueError(f"{series_name} is not in the store")
+        return GetAllVintageSeriesResult(
+            [
+                VintageSeries(
+                    series_name,
+                    None,
+                    StatusCode.OK,
+                    series.metadata,
+                    None,
+                    x.values,
+                    x.dates,
+                    x.vintage_time_stamp,
+                )
+                for x in series.vintages
+            ],
+            series_name,
+        )
+
+    def remove(self, series_names: Sequence[str]) -> None:
+        """
+        Remove one or more series from the store.
+
+        Parameters
+        ----------
+        series_names : Sequence[str]
+            The names of the series.
+        """
+        with self._lock:
+            db = self._db
+            db.executemany("DELETE FROM series WHERE name = ?", ((x,) for x in series_names))
+            db.executemany("DELETE FROM vintages WHERE name = ?", ((x,) for x in series_names))
+            db.commit()
+
+    def close(self) -> None:
+        """Close the database file."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _create_requests(self, series_names: Sequence[str]) -> List["WebRevisionHistoryRequest"]:
+        with self._lock:
+            stored: Dict[str, Tuple[Optional[str], Optional[str], Optional[str]]] = {
+                x[0]: x[1:]
+                for x in self._db.execute(
+                    "SELECT name, last_modified, last_revision, last_revision_adjustment FROM series "
+                    f"WHERE name IN ({','.join('?' * len(series_names))})",
+                    list(series_names),
+                ).fetchall()
+            }
+        requests: List["WebRevisionHistoryRequest"] = []
+        for name in series_names:
+            last_modified, last_revision, last_revision_adjustment = stored.get(name, (None, None, None))
+            requests.append(
+                {
+                    "name": name,
+                    "ifModifiedSince": last_modified,
+                    "lastRevision": last_revision,
+                    "lastRevisionAdjustment": last_revision_adjustment,
+                }
+            )
+        return requests
+
+    def _store(self, name: str, item: "SeriesWithVintagesResponse", replace: bool) -> None:
+        db = self._db
+        metadata: Dict[str, Any] = item.get("metadata") or {}
+        if not metadata and not replace:
+            row = db.execute("SELECT metadata FROM series WHERE name = ?", (name,)).fetchone()
+            metadata = json.loads(row[0]) if row else {}
+
+        def timestamp(key: str) -> Optional[str]:
+            value = metadata.get(key)
+            if isinstance(value, list):
+                value = value[0] if value else None
+            return value if isinstance(value, str) else None
+
+        if replace:
+            db.execute("DELETE FROM vintages WHERE name = ?", (name,))
+        db.executemany(
+            "INSERT OR REPLACE INTO vintages (name, vintage_time_stamp, dates, vals) VALUES (?, ?, ?, ?)",
+            (
+                (name, x.get("vintageTimeStamp") or "", json.dumps(x["dates"]), json.dumps(x["values"]))
+                for x in item.get("vintages") or []
+            ),
+        )
+        db.execute(
+            "INSERT OR REPLACE INTO series "
+            "(name, last_modified, last_revision, last_revision_adjustment, metadata) VALUES (?, ?, ?, ?, ?)",
+            (
+                name,
+                timestamp("LastModifiedTimeStamp"),
+                timestamp("LastRevisionTimeStamp"),
+                timestamp("LastRevisionAdjustmentTimeStamp"),
+                json.dumps(metadata),
+            ),
+        )
+        db.commit()
+
+    def _load(self, series_name: str) -> Optional["SeriesWithVintagesResponse"]:
+        with self._lock:
+            db = self._db
+            row = db.execute("SELECT metadata FROM series WHERE name = ?", (series_name,)).fetchone()
+            if row is None:
+                return None
+            vintages = db.execute(
+                "SELECT vintage_time_stamp, dates, vals FROM vintages WHERE name = ?", (series_name,)
+            ).fetchall()
+
+        # The vintage without a time stamp is the oldest
+        vintages.sort(key=lambda x: (x[0] != "", _parse_iso8601_fast(x[0]) if x[0] else None))
+        return {
+            "metadata": json.loads(row[0]),
+            "vintages": [
+                {"vintageTimeStamp": x[0] or None, "dates": json.loads(x[1]), "values": json.loads(x[2])}
+                for x in vintages
+            ],
+        }
+
+    def __enter__(self) -> "VintageStore":
+        return self
+
+    def __exit__(self, exception_type: Any, exception_value: Any, traceback: Any) -> None:
+        self.close()
@@ -46,6 +46,15 @@ class WebApi(Api):
         super().__init__()
         self._session = session
 
+        self.use_numpy_arrays = False
+        """
+        If True, `values` and `dates` of the series returned by `get_series`, `get_many_series`,
+        `get_vintage_series` and `get_nth_release` are numpy arrays instead of lists.
+        The values are a `numpy.ndarray` of float64 where missing values are NaN
+        and the dates are a `numpy.ndarray` of datetime64[ns].
+        This requires numpy and is faster and uses less memory for long series. The default value is "False".
+        """
+
     @property
     def session(self) -> Session:
         if not self._session._is_open:
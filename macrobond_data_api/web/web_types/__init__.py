@@ -1,7 +1,11 @@
 from .search_methods import SearchMethods
 
+from .async_search_methods import AsyncSearchMethods
+
 from .series_methods import SeriesMethods
 
+from .async_series_methods import AsyncSeriesMethods
+
 from .series_tree_methods import SeriesTreeMethods
 
 from .http_exception import HttpException
@@ -39,6 +43,8 @@ from .vintage_series_response import VintageSeriesResponse
 
 from .metadata_methods import MetadataMethods
 
+from .async_metadata_methods import AsyncMetadataMethods
+
 from .revision_history_request import RevisionHistoryRequest
 
 from .series_with_vintages_response import SeriesWithVintagesResponse
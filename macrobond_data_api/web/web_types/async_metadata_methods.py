@@ -0,0 +1,53 @@
+from typing import List, cast, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..async_session import AsyncSession
+    from .metadata import MetadataAttributeInformationResponse, MetadataValueInformationResponse
+
+
+class AsyncMetadataMethods:
+    """
+    Metadata operations.
+    The asyncio version of `macrobond_data_api.web.web_types.metadata_methods.MetadataMethods`
+    """
+
+    def __init__(self, session: "AsyncSession") -> None:
+        self.__session = session
+
+    # Get /v1/metadata/getattributeinformation
+    async def get_attribute_information(self, *attribute_names: str) -> List["MetadataAttributeInformationResponse"]:
+        """
+        Get information about metadata attributes.
+        The result will be in the same order as the request.
+
+        See `macrobond_data_api.web.web_types.metadata_methods.MetadataMethods.get_attribute_information`
+        """
+        response = await self.__session.get_or_raise(
+            "v1/metadata/getattributeinformation", params={"n": attribute_names}
+        )
+        return cast(List["MetadataAttributeInformationResponse"], response.json())
+
+    # Get /v1/metadata/getvalueinformation
+    async def get_value_information(self, *metadata_value: Tuple[str, str]) -> "MetadataValueInformationResponse":
+        """
+        Get information about metadata values.
+        The result will be in the same order as the request.
+
+        See `macrobond_data_api.web.web_types.metadata_methods.MetadataMethods.get_value_information`
+        """
+        response = await self.__session.get_or_raise(
+            "v1/metadata/getvalueinformation",
+            params={"v": list(map(lambda x: x[0] + "," + x[1], metadata_value))},
+        )
+        return cast("MetadataValueInformationResponse", response.json())
+
+    # Get /v1/metadata/listattributevalues
+    async def list_attribute_values(self, attribute_name: str) -> "MetadataValueInformationResponse":
+        """
+        List all metadata attribute values.
+        The attribute must have the property canListValues.
+
+        See `macrobond_data_api.web.web_types.metadata_methods.MetadataMethods.list_attribute_values`
+        """
+        response = await self.__session.get_or_raise("v1/metadata/listattributevalues", params={"n": attribute_name})
+        return cast("MetadataValueInformationResponse", response.json())
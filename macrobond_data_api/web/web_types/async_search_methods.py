@@ -0,0 +1,85 @@
+from typing import cast, List, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..async_session import AsyncSession
+    from .search import (
+        SearchResponse,
+        SearchRequest,
+        SearchForDisplayResponse,
+        SearchForDisplayRequest,
+        ItemListingResponse,
+    )
+
+
+class AsyncSearchMethods:
+    """
+    Search for time series and other entites.
+    The asyncio version of `macrobond_data_api.web.web_types.search_methods.SearchMethods`
+    """
+
+    def __init__(self, session: "AsyncSession") -> None:
+        self.__session = session
+
+    # get /entities
+    async def get_entities(
+        self,
+        entity_type: List[str] = None,
+        text: str = None,
+        include_discontinued: bool = None,
+        _filter: Dict[str, str] = None,
+        no_meta_data: bool = None,
+        allow_long_result: bool = None,
+    ) -> "SearchResponse":
+        """
+        Search for time series and other entites matching attribute values.
+
+        See `macrobond_data_api.web.web_types.search_methods.SearchMethods.get_entities`
+        """
+
+        params = {
+            "entityType": entity_type,
+            "text": text,
+            "filter": _filter,
+        }
+
+        if no_meta_data:
+            params["noMetaData"] = "true" if no_meta_data else "false"
+
+        if include_discontinued:
+            params["includeDiscontinued"] = "true" if include_discontinued else "false"
+
+        if allow_long_result:
+            params["allowLongResult"] = "true" if allow_long_result else "false"
+
+        response = await self.__session.get_or_raise("v1/search/entities", params=params)
+
+        return cast("SearchResponse", response.json())
+
+    # post /entities
+    async def post_entities(self, request: "SearchRequest") -> "SearchResponse":
+        """
+        Search for time series and other entites matching attribute values.
+
+        See `macrobond_data_api.web.web_types.search_methods.SearchMethods.post_entities`
+        """
+        response = await self.__session.post_or_raise("v1/search/entities", json=request)
+        return cast("SearchResponse", response.json())
+
+    async def filter_lists(self, entity_type: str) -> List["ItemListingResponse"]:
+        """
+        Get a structured list of all saved filter lists of the specified type.
+
+        See `macrobond_data_api.web.web_types.search_methods.SearchMethods.filter_lists`
+        """
+        response = await self.__session.get_or_raise("v1/search/filterlists", params={"entityType": entity_type})
+        return cast(List["ItemListingResponse"], response.json())
+
+    async def entities_for_display(self, request: "SearchForDisplayRequest") -> "SearchForDisplayResponse":
+        """
+        Search for time series and other entites matching attribute values and return the
+        selected metadata formatted for presentation purposes.
+
+        See `macrobond_data_api.web.web_types.search_methods.SearchMethods.entities_for_display`
+        """
+        response = await self.__session.post_or_raise("v1/search/entitiesfordisplay", json=request)
+        return cast("SearchForDisplayResponse", response.json())
@@ -0,0 +1,205 @@
+from typing import List, Sequence, cast, TYPE_CHECKING
+
+from datetime import datetime
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..async_session import AsyncSession
+    from ..async_transport import AsyncResponse
+    from .series_response import SeriesResponse
+    from .entity_response import EntityResponse
+    from .entity_request import EntityRequest
+    from .series_with_revisions_info_response import SeriesWithRevisionsInfoResponse
+    from .vintage_series_response import VintageSeriesResponse
+    from .series_with_times_of_change_response import SeriesWithTimesOfChangeResponse
+    from .series_observation_history_response import SeriesObservationHistoryResponse
+    from .feed_entities_response import FeedEntitiesResponse
+    from .entity_info_for_display_response import EntityInfoForDisplayResponse
+    from .unified_series_response import UnifiedSeriesResponse
+    from .unified_series_request import UnifiedSeriesRequest
+    from .revision_history_request import RevisionHistoryRequest
+
+
+class AsyncSeriesMethods:
+    """
+    Time series and entity operations.
+    The asyncio version of `macrobond_data_api.web.web_types.series_methods.SeriesMethods`
+    """
+
+    def __init__(self, session: "AsyncSession") -> None:
+        self.__session = session
+
+    # Get /fetchentities
+    async def fetch_entities(self, *entitie_names: str) -> List["EntityResponse"]:
+        """
+        Fetch one or more entities.
+        The result will be in the same order as the request.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.fetch_entities`
+        """
+        response = await self.__session.get_or_raise("v1/series/fetchentities", params={"n": entitie_names})
+        return cast(List["EntityResponse"], response.json())
+
+    # Get /v1/series/fetchseries
+    async def get_fetch_series(self, *series_names: str) -> List["SeriesResponse"]:
+        """
+        Fetch one or more series.
+        The result will be in the same order as the request.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.get_fetch_series`
+        """
+        response = await self.__session.get_or_raise("v1/series/fetchseries", params={"n": series_names})
+        return cast(List["SeriesResponse"], response.json())
+
+    # Post /v1/series/fetchseries
+    async def post_fetch_series(self, *series: "EntityRequest") -> List["SeriesResponse"]:
+        """
+        Fetch one or more series.
+        A timestamp can be specified for each series to conditionally retrieve a result.
+        The result will be in the same order as the request.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.post_fetch_series`
+        """
+        response = await self.__session.post_or_raise("v1/series/fetchseries", json=series)
+        return cast(List["SeriesResponse"], response.json())
+
+    # Get /v1/series/getrevisioninfo
+    async def get_revision_info(self, *series_names: str) -> List["SeriesWithRevisionsInfoResponse"]:
+        """
+        Get information about if a record of updates is stored
+        for one or more series and the dates of changes.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.get_revision_info`
+        """
+        response = await self.__session.get_or_raise("v1/series/getrevisioninfo", params={"n": series_names})
+        return cast(List["SeriesWithRevisionsInfoResponse"], response.json())
+
+    # Get /v1/series/fetchvintageseries
+    async def fetch_vintage_series(
+        self, time_of_vintage: datetime, *series_names: str, get_times_of_change: bool = None
+    ) -> List["VintageSeriesResponse"]:
+        """
+        Fetch one or more vintage series.
+        The result will be in the same order as the request.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.fetch_vintage_series`
+        """
+        params = {"t": time_of_vintage.isoformat(), "n": series_names}
+
+        if get_times_of_change:
+            params["getTimesOfChange"] = "true" if get_times_of_change else "false"
+
+        response = await self.__session.get_or_raise("v1/series/fetchvintageseries", params=params)
+        return cast(List["VintageSeriesResponse"], response.json())
+
+    # Get /v1/series/fetchallvintageseries
+    async def get_fetch_all_vintage_series(
+        self,
+        series_name: str,
+        if_modified_since: datetime = None,
+        last_revision: datetime = None,
+        last_revision_adjustment: datetime = None,
+    ) -> List["VintageSeriesResponse"]:
+        """
+        Fetch all vintage series and the complete history of changes.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.get_fetch_all_vintage_series`
+        """
+
+        params = {"n": series_name}
+
+        if if_modified_since:
+            params["ifModifiedSince"] = if_modified_since.isoformat()
+
+        if last_revision:
+            params["lastRevision"] = last_revision.isoformat()
+
+        if last_revision_adjustment:
+            params["lastRevisionAdjustment"] = last_revision_adjustment.isoformat()
+
+        response = await self.__session.get_or_raise("v1/series/fetchallvintageseries", params=params)
+        return cast(List["VintageSeriesResponse"], response.json())
+
+    # post /v1/series/fetchallvintageseries
+    async def post_fetch_all_vintage_series(self, requests: Sequence["RevisionHistoryRequest"]) -> "AsyncResponse":
+        """
+        Fetch all vintage series and the complete history of changes for one or more series.
+        The response is streamed and must be closed by the caller.
+        """
+        return await self.__session.post_stream_or_raise("v1/series/fetchallvintageseries", json=requests)
+
+    # Get /v1/series/fetchnthreleaseseries
+    async def fetch_nth_release_series(
+        self, nth: int, *series_names: str, get_times_of_change: bool = None
+    ) -> List["SeriesWithTimesOfChangeResponse"]:
+        """
+        Fetch one or more series where each value is the nth change of the value.
+        The result will be in the same order as the request.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.fetch_nth_release_series`
+        """
+        params = {
+            "n": series_names,
+            "nth": nth,
+        }
+
+        if get_times_of_change:
+            params["getTimesOfChange"] = "true" if get_times_of_change else "false"
+
+        response = await self.__session.get_or_raise("v1/series/fetchnthreleaseseries", params=params)
+        return cast(List["SeriesWithTimesOfChangeResponse"], response.json())
+
+    # Get /v1/series/fetchobservationhistory
+    async def fetch_observation_history(
+        self, series_name: str, date_of_the_observation: List[datetime]
+    ) -> List["SeriesObservationHistoryResponse"]:
+        """
+        Fetch the history of one or more observations in a time series.
+        The result will be in the same order as the request.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.fetch_observation_history`
+        """
+        response = await self.__session.get_or_raise(
+            "v1/series/fetchobservationhistory",
+            params={
+                "n": series_name,
+                "t": [x.isoformat() for x in date_of_the_observation],
+            },
+        )
+        return cast(List["SeriesObservationHistoryResponse"], response.json())
+
+    # Get /v1/series/getdatapackagelist
+    async def get_data_package_list(self, if_modified_since: datetime = None) -> "FeedEntitiesResponse":
+        """
+        Get a list of entities in the subscription list and timestamps when they were last changed.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.get_data_package_list`
+        """
+        params = {}
+
+        if if_modified_since:
+            params["ifModifiedSince"] = if_modified_since.isoformat()
+
+        response = await self.__session.get_or_raise("v1/series/getdatapackagelist", params=params)
+        return cast("FeedEntitiesResponse", response.json())
+
+    # Get /v1/series/entityinfofordisplay
+    async def entity_info_for_display(self, *entitie_names: str) -> "EntityInfoForDisplayResponse":
+        """
+        Get formatted information about a time series intended to be displayed to the user
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.entity_info_for_display`
+        """
+        response = await self.__session.get_or_raise("v1/series/entityinfofordisplay", params={"n": entitie_names})
+        return cast("EntityInfoForDisplayResponse", response.json())
+
+    # Post /v1/series/fetchunifiedseries
+    async def fetch_unified_series(self, request: "UnifiedSeriesRequest") -> "UnifiedSeriesResponse":
+        """
+        Fetch one or more series and convert them to a common frequency,
+        calendar and optionally a common currency.
+        The resulting list of series will be in the same order as in the request.
+
+        See `macrobond_data_api.web.web_types.series_methods.SeriesMethods.fetch_unified_series`
+        """
+        response = await self.__session.post_or_raise("v1/series/fetchunifiedseries", json=request)
+        return cast("UnifiedSeriesResponse", response.json())
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from typing import List, Sequence, TYPE_CHECKING, overload
 
-from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+from macrobond_data_api.common.types._parse_iso8601 import _Iso8601Memo, _parse_iso8601_fast
 
 from .data_package_list_state import DataPackageListState
 from .data_pacakge_list_item import DataPackageListItem
@@ -22,11 +22,12 @@ class DataPackageList(Sequence[DataPackageListItem], DataPackageBody):
         download_full = response.get("downloadFullListOnOrAfter")
         DataPackageBody.__init__(
             self,
-            _parse_iso8601(response["timeStampForIfModifiedSince"]),
-            _parse_iso8601(download_full) if download_full is not None else None,
+            _parse_iso8601_fast(response["timeStampForIfModifiedSince"]),
+            _parse_iso8601_fast(download_full) if download_full is not None else None,
             DataPackageListState(response["state"]),
         )
-        self.items = [DataPackageListItem(x["name"], _parse_iso8601(x["modified"])) for x in response["entities"]]
+        memo = _Iso8601Memo()
+        self.items = [DataPackageListItem(x["name"], memo.parse(x["modified"])) for x in response["entities"]]
 
     @overload
     def __getitem__(self, i: int) -> DataPackageListItem:
@@ -1,9 +1,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional, Tuple, Iterable, Iterator, List
 
-import ijson
 
-from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+from macrobond_data_api.common.types._parse_iso8601 import _Iso8601Memo, _parse_iso8601_fast
 
 from .data_package_list_state import DataPackageListState
 
@@ -24,6 +23,7 @@ class _DataPackageListContextIterator(Iterator[List[Tuple[str, datetime]]], Iter
     def __init__(self, ijson_parse: Any, chunk_size: int) -> None:
         self._ijson_parse = ijson_parse
         self.chunk_size = chunk_size
+        self._memo = _Iso8601Memo()
 
     def __iter__(self) -> Iterator[List[Tuple[str, datetime]]]:
         if self._is_uesd:
@@ -61,7 +61,7 @@ class _DataPackageListContextIterator(Iterator[List[Tuple[str, datetime]]], Iter
             elif prefix == "entities.item.modified":
                 if event != "string":
                     raise Exception("bad format: entities.item.modified is not a string")
-                modified = _parse_iso8601(value)
+                modified = self._memo.parse(value)
 
 
 class DataPackageListContext:
@@ -116,11 +116,11 @@ def _parse_body(
         if prefix == "timeStampForIfModifiedSince":
             if event != "string":
                 raise Exception("bad format: timeStampForIfModifiedSince is not a string")
-            time_stamp_for_if_modified_since = _parse_iso8601(value)
+            time_stamp_for_if_modified_since = _parse_iso8601_fast(value)
         elif prefix == "downloadFullListOnOrAfter":
             if event != "string":
                 raise Exception("bad format: downloadFullListOnOrAfter is not a string")
-            download_full_list_on_or_after = _parse_iso8601(value)
+            download_full_list_on_or_after = _parse_iso8601_fast(value)
         elif prefix == "state":
             if event != "number":
                 raise Exception("bad format: state is not a number")
@@ -153,7 +153,7 @@ class DataPackageListContextManager:
             self._web_api = None
             self._response = session.get_or_raise("v1/series/getdatapackagelist", params=params, stream=True)
 
-            ijson_parse = ijson.parse(session._response_to_file_object(self._response))
+            ijson_parse = session._ijson_parse(self._response)
 
             (
                 time_stamp_for_if_modified_since,
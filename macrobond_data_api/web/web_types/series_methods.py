@@ -62,6 +62,13 @@ class SeriesMethods:
         response = self.__session.get_or_raise("v1/series/fetchseries", params={"n": series_names})
         return cast(List["SeriesResponse"], response.json())
 
+    def get_fetch_series_stream(self, *series_names: str) -> "Response":
+        """
+        The same as `get_fetch_series`, but the body of the response is not read.
+        The response must be closed by the caller.
+        """
+        return self.__session.get_or_raise("v1/series/fetchseries", params={"n": series_names}, stream=True)
+
     # Post /v1/series/fetchseries
     def post_fetch_series(self, *series: "EntityRequest") -> List["SeriesResponse"]:
         """
@@ -84,6 +91,13 @@ class SeriesMethods:
         response = self.__session.post_or_raise("v1/series/fetchseries", json=series)
         return cast(List["SeriesResponse"], response.json())
 
+    def post_fetch_series_stream(self, *series: "EntityRequest") -> "Response":
+        """
+        The same as `post_fetch_series`, but the body of the response is not read.
+        The response must be closed by the caller.
+        """
+        return self.__session.post_or_raise("v1/series/fetchseries", json=series, stream=True)
+
     # Post /fetchseries
     def fetch_series_last_modified_time_stamp(self, *requests: "EntityRequest") -> List["SeriesResponse"]:
         """
@@ -328,3 +342,10 @@ class SeriesMethods:
         """
         response = self.__session.post_or_raise("v1/series/fetchunifiedseries", json=request)
         return cast("UnifiedSeriesResponse", response.json())
+
+    def fetch_unified_series_stream(self, request: "UnifiedSeriesRequest") -> "Response":
+        """
+        The same as `fetch_unified_series`, but the body of the response is not read.
+        The response must be closed by the caller.
+        """
+        return self.__session.post_or_raise("v1/series/fetchunifiedseries", json=request, stream=True)
@@ -0,0 +1,99 @@
+"""
+Measures how fast the items of a getdatapackagelist response are decoded while streaming.
+
+The payload is read from a recorded response body if a path is given,
+otherwise a payload with 500 000 items is generated.
+
+Usage: python scripts/benchmark_data_package_list.py [recorded_response.json]
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from io import BytesIO
+from json import dumps as json_dump
+from time import perf_counter
+from typing import Any, Callable
+
+import ijson
+from requests import Response
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from macrobond_data_api.web.session import _ResponseAsFileObject  # noqa: E402
+
+# pylint: enable=wrong-import-position
+
+
+class _LegacyResponseAsFileObject:
+    """The adapter used before, read ignores n and returns the next chunk."""
+
+    def __init__(self, response: Response, chunk_size: int = 65536) -> None:
+        self.data = response.iter_content(chunk_size=chunk_size)
+
+    def read(self, n: int) -> bytes:
+        if n == 0:
+            return b""
+        return next(self.data, b"")
+
+
+def _generate_payload(count: int) -> bytes:
+    start = datetime(2020, 1, 1)
+    return json_dump(
+        {
+            "downloadFullListOnOrAfter": "2021-01-01T00:00:00",
+            "timeStampForIfModifiedSince": "2021-01-02T00:00:00",
+            "state": 0,
+            "entities": [
+                {"name": "series" + str(x), "modified": (start + timedelta(seconds=x)).isoformat()}
+                for x in range(count)
+            ],
+        }
+    ).encode()
+
+
+def _response(payload: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.raw = BytesIO(payload)
+    return response
+
+
+def _count_items(file_object: Any, buf_size: int) -> int:
+    count = 0
+    for prefix, event, _ in ijson.parse(file_object, buf_size=buf_size):
+        if prefix == "entities.item" and event == "end_map":
+            count += 1
+    return count
+
+
+def _run(name: str, payload: bytes, create: Callable[[Response], Any], buf_size: int) -> None:
+    start = perf_counter()
+    count = _count_items(create(_response(payload)), buf_size)
+    seconds = perf_counter() - start
+    print(f"{name:<55} {count / seconds:12,.0f} items/s   {len(payload) / seconds / 1e6:8.1f} MB/s")
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "rb") as f:
+            payload = f.read()
+    else:
+        payload = _generate_payload(500000)
+
+    # Both use the default ijson backend, set IJSON_BACKEND to compare backends
+    print(f"payload {len(payload) / 1e6:.1f} MB, ijson backend: {ijson.backend_name}\n")
+
+    _run("before: chunk adapter", payload, _LegacyResponseAsFileObject, 65536)
+    for buf_size in (16384, 65536, 262144):
+        _run(
+            f"after: readinto adapter, {buf_size // 1024} kB",
+            payload,
+            lambda x, size=buf_size: _ResponseAsFileObject(x, size),  # type: ignore[misc]
+            buf_size,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares the strict ISO 8601 parser with the fast path used when converting web API responses.
+
+Usage: python scripts/benchmark_parse_iso8601.py
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+from timeit import timeit
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601, _parse_iso8601_many  # noqa: E402
+
+# pylint: enable=wrong-import-position
+
+
+def _daily_dates(count: int, time_format: str) -> List[str]:
+    start = datetime(1990, 1, 1)
+    return [(start + timedelta(days=x)).strftime(time_format) for x in range(count)]
+
+
+def _run(name: str, values: List[str], number: int) -> None:
+    def strict() -> List[datetime]:
+        return [_parse_iso8601(x) for x in values]
+
+    def fast() -> List[datetime]:
+        return _parse_iso8601_many(values)
+
+    assert strict() == fast()
+
+    def per_value(func: Callable[[], List[datetime]]) -> float:
+        return timeit(func, number=number) / number / len(values) * 1e9
+
+    strict_ns = per_value(strict)
+    fast_ns = per_value(fast)
+    print(f"{name:<40} strict {strict_ns:8.0f} ns/value   fast {fast_ns:8.0f} ns/value   {strict_ns / fast_ns:5.1f}x")
+
+
+def main() -> None:
+    count = 10000
+    number = 20
+    _run("date only", _daily_dates(count, "%Y-%m-%d"), number)
+    _run("date and time", _daily_dates(count, "%Y-%m-%dT%H:%M:%S"), number)
+    _run("date and time, UTC", _daily_dates(count, "%Y-%m-%dT%H:%M:%SZ"), number)
+    _run("date and time, milliseconds", _daily_dates(count, "%Y-%m-%dT%H:%M:%S.123"), number)
+    _run("repeated time stamp", ["2021-03-04T05:06:07Z"] * count, number)
+    _run("basic format (fallback)", _daily_dates(count, "%Y%m%dT%H%M%S"), number)
+
+
+if __name__ == "__main__":
+    main()
@@ -102,8 +102,10 @@ setuptools.setup(
             "types-setuptools==82.0.0.20260402",
             "filelock==3.25.2",
             "numpy>=1.24.4",
+            "httpx==0.28.1",
         ],
         "socks": ["requests[socks]>=2.32.5"],
+        "async": ["httpx>=0.27.0"],
     },
     project_urls={
         "Documentation": "https://macrobond.github.io/macrobond-data-api",
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import pytest
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import CompactVintages, SeriesWithVintages, VintageValues
+
+
+def _date(day: int) -> datetime:
+    return datetime(2000, 1, 1) + timedelta(days=day)
+
+
+def _vintage(time_stamp: Optional[int], days: List[int], values: List[Optional[float]]) -> VintageValues:
+    return VintageValues(_date(time_stamp) if time_stamp is not None else None, [_date(x) for x in days], values)
+
+
+def _growing_vintages(count: int) -> List[VintageValues]:
+    # Each vintage adds one observation and revises the previous one
+    vintages = []
+    values: List[Optional[float]] = []
+    for i in range(count):
+        if values:
+            values[-1] = float(i) + 0.5
+        values.append(float(i))
+        vintages.append(_vintage(i + 1000, list(range(len(values))), list(values)))
+    return vintages
+
+
+def _assert_equal(compact: CompactVintages, vintages: List[VintageValues]) -> None:
+    assert len(compact) == len(vintages)
+    for actual, expected in zip(compact, vintages):
+        assert actual.vintage_time_stamp == expected.vintage_time_stamp
+        assert actual.dates == expected.dates
+        assert actual.values == expected.values
+
+
+@pytest.mark.no_account
+class TestCompactVintages:
+    def test_growing(self) -> None:
+        vintages = _growing_vintages(250)
+
+        compact = CompactVintages.from_vintages(vintages, keyframe_interval=100)
+
+        _assert_equal(compact, vintages)
+        assert compact.dates == vintages[-1].dates
+        # The first vintages are so short that storing all values is smaller
+        assert sorted(compact._keyframes) == [0, 1, 2, 3, 103, 203]
+        assert all(len(x[0]) == 2 for x in compact._changes.values())
+
+    def test_revisions_and_missing_values(self) -> None:
+        vintages = [
+            _vintage(None, [0, 1], [1.0, 2.0]),
+            _vintage(1, [0, 1, 2, 3], [1.0, None, 3.0, 4.0]),
+            _vintage(2, [1, 2, 3], [2.5, 3.0, 4.0]),
+            _vintage(3, [0, 1, 2, 3, 4], [1.0, 2.5, 3.0, 4.0, 5.0]),
+            _vintage(4, [], []),
+            _vintage(5, [0, 1, 2, 3, 4], [1.0, 2.5, 3.0, 4.0, 5.5]),
+        ]
+
+        compact = CompactVintages.from_vintages(vintages)
+
+        _assert_equal(compact, vintages)
+        assert compact.vintage_time_stamps == [x.vintage_time_stamp for x in vintages]
+        assert compact[-1].values == [1.0, 2.5, 3.0, 4.0, 5.5]
+        assert [x.vintage_time_stamp for x in compact[1:3]] == [_date(1), _date(2)]
+        assert compact._changes[3] == ((0, 4), (1.0, 5.0))
+        assert 5 in compact._keyframes
+
+    def test_irregular_dates(self) -> None:
+        vintages = [
+            _vintage(1, [1, 2, 3], [1.0, 2.0, 3.0]),
+            _vintage(2, [0, 1, 2, 3], [0.5, 1.0, 2.0, 3.0]),
+            _vintage(3, [1, 3], [1.0, 3.0]),
+            _vintage(4, [1, 2, 3, 4], [1.0, 2.0, 3.5, 4.0]),
+        ]
+
+        compact = CompactVintages.from_vintages(vintages)
+
+        _assert_equal(compact, vintages)
+        assert sorted(compact._irregular) == [1, 2]
+
+    def test_from_series_with_vintages(self) -> None:
+        vintages = _growing_vintages(10)
+        series = SeriesWithVintages(None, StatusCode.OK, None, vintages)
+
+        _assert_equal(series.to_compact_vintages(keyframe_interval=3), vintages)
+
+    def test_errors(self) -> None:
+        compact = CompactVintages.from_vintages(_growing_vintages(2))
+
+        with pytest.raises(IndexError):
+            compact.get_values(2)
+        with pytest.raises(ValueError, match="keyframe_interval must be 1 or greater"):
+            CompactVintages.from_vintages([], keyframe_interval=0)
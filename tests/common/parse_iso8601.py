@@ -3,7 +3,12 @@ from datetime import datetime, timezone, timedelta
 import pytest
 
 from macrobond_data_api.common.types.format_exception import FormatException
-from macrobond_data_api.common.types._parse_iso8601 import _parse_iso8601
+from macrobond_data_api.common.types._parse_iso8601 import (
+    _parse_iso8601,
+    _parse_iso8601_fast,
+    _parse_iso8601_many,
+    _Iso8601Memo,
+)
 
 
 @pytest.mark.no_account
@@ -100,3 +105,74 @@ def test_parse_iso8601() -> None:
         _parse_iso8601("2000T01+01:")
     with pytest.raises(FormatException, match="Minute is missing or malformatted"):
         _parse_iso8601("2000T01+01:1")
+
+
+@pytest.mark.no_account
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2000",
+        "200002",
+        "2000-02",
+        "20000203",
+        "2000-02-03",
+        "2000-02-03T04",
+        "2000-02-03T04:05",
+        "2000-02-03T04:05:06",
+        "2000-02-03T04:05:06.7",
+        "2000-02-03T04:05:06.700",
+        "2000-02-03T04:05:06.700000",
+        "2000-02-03T04:05:06,700",
+        "2000-02-03T04:05:06Z",
+        "2000-02-03T04:05:06.123Z",
+        "2000-02-03T04:05:06+01",
+        "2000-02-03T04:05:06+01:30",
+        "2000-02-03T04:05:06-01:30",
+        "2000-02-03T04:05:06.123456-01:30",
+    ],
+)
+def test_parse_iso8601_fast_same_as_strict(value: str) -> None:
+    expected = _parse_iso8601(value)
+    actual = _parse_iso8601_fast(value)
+    assert actual == expected
+    assert actual.tzinfo == expected.tzinfo
+    assert actual.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.no_account
+def test_parse_iso8601_fast_errors() -> None:
+    with pytest.raises(FormatException, match="Year is missing or malformatted"):
+        _parse_iso8601_fast("abc")
+    with pytest.raises(FormatException, match="Day is missing or malformatted"):
+        _parse_iso8601_fast("2000-01-1")
+    with pytest.raises(FormatException, match="Year is missing or malformatted"):
+        _parse_iso8601_fast("\u0661\u0662\u0663\u0664-01-01")
+    with pytest.raises(ValueError):
+        _parse_iso8601_fast("2000-13-01")
+
+
+@pytest.mark.no_account
+def test_parse_iso8601_many() -> None:
+    result = _parse_iso8601_many(["2000-02-03", "2000-02-03T04:05:06Z", "2000-02-03", "20000203T04"])
+
+    assert result == [
+        datetime(2000, 2, 3),
+        datetime(2000, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+        datetime(2000, 2, 3),
+        datetime(2000, 2, 3, 4),
+    ]
+    assert result[0] is result[2]
+    assert _parse_iso8601_many([]) == []
+
+
+@pytest.mark.no_account
+def test_iso8601_memo() -> None:
+    memo = _Iso8601Memo(max_size=2)
+
+    first = memo.parse("2000-02-03T04:05:06")
+    assert first == datetime(2000, 2, 3, 4, 5, 6)
+    assert memo.parse("2000-02-03T04:05:06") is first
+
+    memo.parse("2000-02-04")
+    memo.parse("2000-02-05")
+    assert memo.parse("2000-02-03T04:05:06") is not first
@@ -0,0 +1,127 @@
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+
+import numpy
+import pytest
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import (
+    GetAllVintageSeriesResult,
+    SeriesWithVintages,
+    VintageIndex,
+    VintageSeries,
+    VintageValues,
+)
+
+
+def _vintage(revision_time_stamp: Optional[datetime], dates: Any, values: Any) -> VintageSeries:
+    return VintageSeries("s1", None, StatusCode.OK, {}, None, values, dates, revision_time_stamp)
+
+
+def _date(day: int) -> datetime:
+    return datetime(2000, 1, day, tzinfo=timezone.utc)
+
+
+def _index() -> VintageIndex:
+    return GetAllVintageSeriesResult(
+        [
+            _vintage(_date(20), [_date(1), _date(2), _date(3)], [1.1, 2.0, 3.1]),
+            _vintage(None, [_date(1)], [1.0]),
+            _vintage(_date(10), [_date(1), _date(2)], [1.0, 2.0]),
+            _vintage(_date(30), [_date(2), _date(3), _date(4)], [2.2, 3.1, 4.2]),
+        ],
+        "s1",
+    ).to_vintage_index()
+
+
+@pytest.mark.no_account
+class TestVintageIndex:
+    def test_vintage_series(self) -> None:
+        index = _index()
+
+        assert index.vintage_time_stamps == [_date(10), _date(20), _date(30)]
+        assert index.get_vintage_series(datetime(1999, 1, 1)).values == [1.0]
+        assert index.get_vintage_series(_date(10)).values == [1.0, 2.0]
+        assert index.get_vintage_series(datetime(2000, 1, 25)).values == [1.1, 2.0, 3.1]
+
+        series = index.get_vintage_series(datetime(2001, 1, 1, tzinfo=timezone.utc), include_times_of_change=True)
+        assert series.revision_time_stamp == _date(30)
+        assert series.dates == [_date(2), _date(3), _date(4)]
+        assert series.values_metadata == [
+            {"RevisionTimeStamp": _date(30)},
+            {"RevisionTimeStamp": _date(20)},
+            {"RevisionTimeStamp": _date(30)},
+        ]
+
+    def test_no_vintage(self) -> None:
+        index = VintageIndex("s1", None, [(_date(10), [_date(1)], [1.0])])
+
+        series = index.get_vintage_series(_date(9))
+
+        assert series.is_error
+        assert series.status_code == StatusCode.NOT_FOUND
+
+    def test_nth_release(self) -> None:
+        index = _index()
+
+        first = index.get_nth_release(0, include_times_of_change=True)
+        assert first.dates == [_date(1), _date(2), _date(3), _date(4)]
+        assert first.values == [1.0, 2.0, 3.1, 4.2]
+        assert first.values_metadata == [
+            {},
+            {"RevisionTimeStamp": _date(10)},
+            {"RevisionTimeStamp": _date(20)},
+            {"RevisionTimeStamp": _date(30)},
+        ]
+
+        second = index.get_nth_release(1)
+        assert second.dates == [_date(1), _date(2)]
+        assert second.values == [1.1, 2.2]
+        assert second.values_metadata is None
+
+        assert index.get_nth_release(2).values == []
+
+        with pytest.raises(ValueError, match="nth must be 0 or greater"):
+            index.get_nth_release(-1)
+
+    def test_numpy_arrays(self) -> None:
+        def vintage(revision_time_stamp: Optional[datetime], days: List[int], values: List[float]) -> VintageSeries:
+            dates = numpy.array([f"2000-01-0{x}" for x in days], dtype="datetime64[ns]")
+            return _vintage(revision_time_stamp, dates, numpy.array(values, dtype=numpy.float64))
+
+        index = GetAllVintageSeriesResult(
+            [
+                vintage(None, [1], [1.0]),
+                vintage(_date(10), [1, 2], [1.0, numpy.nan]),
+                vintage(_date(20), [1, 2, 3], [1.1, numpy.nan, 3.1]),
+                vintage(_date(30), [2, 3, 4], [2.2, 3.1, 4.2]),
+            ],
+            "s1",
+        ).to_vintage_index()
+
+        series = index.get_vintage_series(datetime(2000, 1, 25), include_times_of_change=True)
+        numpy.testing.assert_array_equal(series.values, [1.1, numpy.nan, 3.1])
+        assert series.dates == list(numpy.array(["2000-01-01", "2000-01-02", "2000-01-03"], dtype="datetime64[ns]"))
+        # A missing value that is still missing has not changed
+        assert series.values_metadata == [
+            {"RevisionTimeStamp": _date(20)},
+            {"RevisionTimeStamp": _date(10)},
+            {"RevisionTimeStamp": _date(20)},
+        ]
+        numpy.testing.assert_array_equal(index.get_nth_release(1).values, [1.1, 2.2])
+
+    def test_from_series_with_vintages(self) -> None:
+        series = SeriesWithVintages(
+            None,
+            StatusCode.OK,
+            None,
+            [
+                VintageValues(None, [datetime(2000, 1, 1)], [1.0]),
+                VintageValues(_date(10), [datetime(2000, 1, 1)], [1.5]),
+            ],
+        )
+
+        index = VintageIndex.from_series_with_vintages(series, "s1")
+
+        assert index.get_vintage_series(datetime(2000, 1, 5)).values == [1.0]
+        assert index.get_nth_release(1).values == [1.5]
@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Any, List, Optional
+
+import numpy
+import pandas
+import pytest
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.common.types import GetAllVintageSeriesResult, VintageSeries
+
+
+def _vintage(revision_time_stamp: datetime, dates: List[datetime], values: List[Optional[float]]) -> VintageSeries:
+    return VintageSeries("s1", None, StatusCode.OK, {}, None, values, dates, revision_time_stamp)
+
+
+def _date(day: int) -> datetime:
+    return datetime(2000, 1, day, tzinfo=timezone.utc)
+
+
+def _result() -> GetAllVintageSeriesResult:
+    return GetAllVintageSeriesResult(
+        [
+            _vintage(_date(20), [_date(1), _date(2), _date(3)], [1.1, 2.1, 3.1]),
+            _vintage(_date(10), [_date(1), _date(2)], [1.0, None]),
+            _vintage(_date(30), [_date(2), _date(3), _date(4)], [2.2, 3.2, 4.2]),
+        ],
+        "s1",
+    )
+
+
+@pytest.mark.no_account
+def test_vintage_matrix() -> None:
+    matrix = _result().to_vintage_matrix()
+
+    assert matrix.series_name == "s1"
+    assert matrix.dates.tolist() == [numpy.datetime64(f"2000-01-0{x}", "ns").item() for x in range(1, 5)]
+    assert matrix.vintages.tolist() == [numpy.datetime64(f"2000-01-{x}", "ns").item() for x in (10, 20, 30)]
+    numpy.testing.assert_array_equal(
+        matrix.to_numpy(),
+        [
+            [1.0, 1.1, numpy.nan],
+            [numpy.nan, 2.1, 2.2],
+            [numpy.nan, 3.1, 3.2],
+            [numpy.nan, numpy.nan, 4.2],
+        ],
+    )
+
+
+def _baseline_data_frame(result: GetAllVintageSeriesResult) -> pandas.DataFrame:
+    """The DataFrame as it was created before VintageMatrix."""
+    dates = sorted(set(chain.from_iterable(x.dates for x in result)))
+    df = pandas.DataFrame({"date": dates})
+    for x in result:
+        arg: Any = {"date": x.dates, x.revision_time_stamp: pandas.Series(data=x.values, dtype="float64")}
+        df = df.merge(pandas.DataFrame(arg), how="left", left_on="date", right_on="date")
+    return df
+
+
+@pytest.mark.no_account
+def test_to_pd_data_frame() -> None:
+    result = _result()
+
+    df = result.to_pd_data_frame()
+
+    assert list(df.columns) == ["date", _date(20), _date(10), _date(30)]
+    assert df["date"].tolist() == [_date(x) for x in range(1, 5)]
+    assert df[_date(20)].tolist()[:3] == [1.1, 2.1, 3.1]
+    assert numpy.isnan(df[_date(20)].tolist()[3])
+    pandas.testing.assert_frame_equal(df, _baseline_data_frame(result))
+
+
+@pytest.mark.no_account
+def test_to_pd_data_frame_naive_dates() -> None:
+    # The dates have no time zone but the vintage time stamps have
+    result = GetAllVintageSeriesResult(
+        [
+            _vintage(_date(20), [datetime(2000, 1, 1), datetime(2000, 1, 2)], [1.1, 2.1]),
+            _vintage(_date(10), [datetime(2000, 1, 1)], [1.0]),
+        ],
+        "s1",
+    )
+
+    df = result.to_pd_data_frame()
+
+    assert df["date"].dt.tz is None
+    pandas.testing.assert_frame_equal(df, _baseline_data_frame(result))
+
+    matrix_df = result.to_vintage_matrix().to_pd_data_frame()
+    assert matrix_df["date"].dt.tz is None
+    assert matrix_df.columns[1].tz is not None
+
+
+@pytest.mark.no_account
+def test_numpy_arrays() -> None:
+    vintage = _vintage(
+        _date(10),
+        numpy.array(["2000-01-02", "2000-01-01"], dtype="datetime64[ns]"),  # type: ignore[arg-type]
+        numpy.array([2.0, 1.0]),  # type: ignore[arg-type]
+    )
+
+    matrix = GetAllVintageSeriesResult([vintage], "s1").to_vintage_matrix()
+
+    assert matrix.to_numpy().tolist() == [[1.0], [2.0]]
+    # numpy dates have no time zone, even when the vintage time stamps have
+    assert matrix.to_pd_data_frame()["date"].dt.tz is None
@@ -1,8 +1,12 @@
+from io import BytesIO
+from json import dumps as json_dump, loads as json_load
+from threading import Lock
 from unittest.mock import Mock
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Optional
 
 from requests import Response
 from requests.adapters import BaseAdapter
+from requests.models import Response as ResponseModel
 
 
 class MockAdapter(BaseAdapter):
@@ -39,6 +43,8 @@ class MockAdapter(BaseAdapter):
 
         response = self.mock.send()
         assert response is not None
+        if response.request is None:
+            response.request = request
         return response
 
     def close(self) -> None:
@@ -47,3 +53,55 @@ class MockAdapter(BaseAdapter):
     def assert_this(self) -> None:
         assert len(self.urls_expected) != 0
         assert len(self.urls_expected) == self.index
+
+
+class ApiEndpointAdapter(BaseAdapter):
+    """
+    Serves an API endpoint that takes a list of requests, such as v1/series/fetchseries,
+    by calling create for each requested item.
+
+    Set on_request to a function that is called with each request body before the response is created,
+    for example to block a request until an event is set.
+    """
+
+    def __init__(self, endpoint: str, create: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+        super().__init__()
+        self.url = "https://api/" + endpoint
+        self.create = create
+        self.on_request: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self.fail_status: Optional[int] = None
+        self.lock = Lock()
+        self.requests: List[List[Dict[str, Any]]] = []
+        self.bodies: List[BytesIO] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Response:  # pylint: disable=unused-argument
+        assert request.url == self.url
+        body = json_load(request.body)
+        with self.lock:
+            self.requests.append(body)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.on_request is not None:
+                self.on_request(body)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+        response = ResponseModel()
+        response.request = request
+        if self.fail_status is not None:
+            response.status_code = self.fail_status
+            response.raw = BytesIO(b"")
+            return response
+
+        response.status_code = 200
+        response.raw = BytesIO(json_dump([self.create(x) for x in body]).encode())
+        with self.lock:
+            self.bodies.append(response.raw)
+        return response
+
+    def close(self) -> None:
+        pass
@@ -12,7 +12,7 @@ from macrobond_data_api.web._auth_client import _AuthClient
 from macrobond_data_api.web._access_token_cache import _AccessTokenCache
 from macrobond_data_api.web import WebApi
 
-from .mock_adapter import MockAdapter
+from .mock_adapter import ApiEndpointAdapter, MockAdapter
 
 API_URL = "https://api/"
 AUTHORIZATION_URL = "https://auth/"
@@ -27,6 +27,7 @@ class MockAdapterBuilder:
         self._responses: List[Response] = []
         self._access_token_index = 1
         self._leeway = 0
+        self._refresh_ahead = 0
         self._fetch_token_get_time: Optional[List[int]] = None
         self._is_expired_get_time: Optional[List[int]] = None
         self._remove_old_cache_items_time: Optional[List[int]] = None
@@ -37,6 +38,7 @@ class MockAdapterBuilder:
     def build(self) -> Tuple[MockAdapter, WebApi, Session, _AuthClient]:
 
         _AccessTokenCache._cache.clear()
+        _AccessTokenCache._token_endpoints.clear()
 
         session = Session(
             "",
@@ -48,8 +50,10 @@ class MockAdapterBuilder:
 
         self._mock_adapter = mock_adapter = MockAdapter(self._responses, self._urls)
         session.requests_session.mount("https://", mock_adapter)
+        session.requests_session.mount(session.api_url, mock_adapter)
         auth_client = session._auth_client
         auth_client.leeway = self._leeway
+        auth_client.refresh_ahead = self._refresh_ahead
 
         mock = Mock()
         if self._fetch_token_get_time:
@@ -66,6 +70,13 @@ class MockAdapterBuilder:
 
         return mock_adapter, WebApi(session), session, auth_client
 
+    def build_with_endpoint(self, adapter: ApiEndpointAdapter) -> Tuple[WebApi, Session]:
+        """Build an authenticated session where the requests to the API are served by adapter."""
+        _, api, session, auth_client = self.auth().build()
+        auth_client.fetch_token_if_necessary()
+        session.requests_session.mount(API_URL, adapter)
+        return api, session
+
     def use_access_token_cache(self) -> "MockAdapterBuilder":
         self._use_access_token_cache = True
         return self
@@ -78,6 +89,10 @@ class MockAdapterBuilder:
         self._leeway = leeway
         return self
 
+    def set_refresh_ahead(self, refresh_ahead: int) -> "MockAdapterBuilder":
+        self._refresh_ahead = refresh_ahead
+        return self
+
     def set_fetch_token_get_time(self, fetch_token_get_time: List[int]) -> "MockAdapterBuilder":
         self._fetch_token_get_time = fetch_token_get_time
         return self
@@ -92,10 +107,13 @@ class MockAdapterBuilder:
         status_code: int,
         json: Union[None, str, Any] = None,
         raw: Union[None, str, Dict[Any, Any], bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> "MockAdapterBuilder":
         response = ResponseModel()
         response.status_code = status_code
         response.history = []
+        if headers:
+            response.headers.update(headers)
 
         if raw:
             if isinstance(raw, dict):
@@ -108,6 +126,8 @@ class MockAdapterBuilder:
                 response._content = json.encode()
             elif json is not None:
                 response._content = json_dump(json).encode()
+            if isinstance(response._content, bytes):
+                response.raw = BytesIO(response._content)
 
         self._responses.append(response)
         self._urls.append(url)
@@ -1,8 +1,16 @@
+import os
+from threading import Event, Thread
+from typing import Any, cast
 from unittest.mock import Mock
 
 import pytest
 
+from macrobond_data_api.web import Scope
 from macrobond_data_api.web._access_token_cache import _AccessTokenCache, _CacheItem
+from macrobond_data_api.web._auth_client import _AuthClient
+from macrobond_data_api.web._file_access_token_cache import _FileAccessTokenCache
+
+from ..mock_adapter_builder import MAB
 
 CACHE_KEY = "test_key"
 
@@ -49,3 +57,74 @@ class TestAccessTokenCache:
         assert sut._remove_old() == 1
         assert len(_AccessTokenCache._cache) == 0
         assert sut._get()
+
+
+@pytest.mark.no_account
+class TestFileAccessTokenCache:
+
+    def test_shared(self, tmp_path: Any) -> None:
+        path = os.path.join(tmp_path, "tokens.json")
+        _AccessTokenCache._cache.clear()
+        _FileAccessTokenCache(CACHE_KEY, path)._set("token", 4000000000)
+
+        # a new process has an empty in-memory cache
+        _AccessTokenCache._cache.clear()
+        item = _FileAccessTokenCache(CACHE_KEY, path)._get()
+
+        assert item.access_token == "token"
+        assert item.expires_at == 4000000000
+        with open(path, "r", encoding="utf-8") as f:
+            assert CACHE_KEY not in f.read()
+
+    def test_newer_token_wins(self, tmp_path: Any) -> None:
+        path = os.path.join(tmp_path, "tokens.json")
+        _AccessTokenCache._cache.clear()
+        sut = _FileAccessTokenCache(CACHE_KEY, path)
+        sut._set("new", 4000000002)
+
+        _AccessTokenCache._cache.clear()
+        other = _FileAccessTokenCache(CACHE_KEY, path)
+        other._set("newest", 4000000003)
+
+        assert sut._get().access_token == "newest"
+
+    def test_exclusive(self, tmp_path: Any) -> None:
+        path = os.path.join(tmp_path, "tokens.json")
+        first = _FileAccessTokenCache(CACHE_KEY, path)
+        second = _FileAccessTokenCache(CACHE_KEY, path)
+        entered = Event()
+
+        def enter() -> None:
+            with second._exclusive():
+                entered.set()
+
+        with first._exclusive():
+            with first._exclusive():
+                thread = Thread(target=enter)
+                thread.start()
+                assert not entered.wait(0.1)
+
+        assert entered.wait(5)
+        thread.join()
+
+    def test_auth_client_reuses_token(self, mab: MAB, tmp_path: Any) -> None:
+        path = os.path.join(tmp_path, "tokens.json")
+        mock_adapter, _, session, auth_client = mab.auth().build()
+        auth_client._cache = _FileAccessTokenCache("key", path)
+        assert auth_client.fetch_token_if_necessary() is True
+        assert mock_adapter.index == 2
+
+        _AccessTokenCache._cache.clear()
+        auth_client_2 = _AuthClient(
+            auth_client._username,
+            auth_client._password,
+            cast(list[Scope], auth_client.scope.split(" ")),
+            auth_client.authorization_url,
+            session,
+            True,
+        )
+        auth_client_2._cache = _FileAccessTokenCache("key", path)
+        auth_client_2.is_expired_get_time = lambda: 0
+
+        assert auth_client_2.fetch_token_if_necessary() is False
+        assert mock_adapter.index == 2
@@ -0,0 +1,271 @@
+import asyncio
+from datetime import datetime, timezone
+from json import dumps as json_dump
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Tuple
+
+import pytest
+
+from macrobond_data_api.common.enums import MetadataAttributeType, StatusCode
+from macrobond_data_api.common.types import RevisionHistoryRequest
+from macrobond_data_api.web import AsyncResponse, AsyncSession, AsyncTransport, AsyncWebApi
+from macrobond_data_api.web.session import ProblemDetailsException
+
+TOKEN_ENDPOINT = "https://auth/get_a_nice_token"
+
+_Handler = Callable[[Optional[Mapping[str, Any]], object], Tuple[int, object]]
+
+
+class _StubResponse(AsyncResponse):
+    def __init__(self, status_code: int, body: object, chunk_size: int) -> None:
+        self._status_code = status_code
+        self._content = json_dump(body).encode()
+        self._chunk_size = chunk_size
+        self.closed = False
+
+    @property
+    def status_code(self) -> int:
+        return self._status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return {"Content-Type": "application/json"}
+
+    async def read(self) -> bytes:
+        return self._content
+
+    async def _iter_bytes(self) -> AsyncIterator[bytes]:
+        for i in range(0, len(self._content), self._chunk_size):
+            await asyncio.sleep(0)
+            yield self._content[i : i + self._chunk_size]
+
+    def iter_bytes(self) -> AsyncIterator[bytes]:
+        return self._iter_bytes()
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _StubTransport(AsyncTransport):
+    def __init__(self, chunk_size: int = 1 << 16) -> None:
+        self.chunk_size = chunk_size
+        self.handlers: Dict[Tuple[str, str], _Handler] = {
+            ("GET", "https://auth/.well-known/openid-configuration"): lambda p, j: (
+                200,
+                {"token_endpoint": TOKEN_ENDPOINT},
+            ),
+            ("POST", TOKEN_ENDPOINT): self._token,
+        }
+        self.calls: List[Tuple[str, str]] = []
+        self.responses: List[_StubResponse] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.token_count = 0
+
+    def _token(
+        self, params: Optional[Mapping[str, Any]], json: object  # pylint: disable=unused-argument
+    ) -> Tuple[int, object]:
+        self.token_count += 1
+        return 200, {"access_token": "token" + str(self.token_count), "expires_in": 3600, "token_type": "Bearer"}
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        json: object = None,
+        data: Optional[Mapping[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> AsyncResponse:
+        self.calls.append((method, url))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            status_code, body = self.handlers[(method, url)](params, json)
+        finally:
+            self.in_flight -= 1
+        response = _StubResponse(status_code, body, self.chunk_size)
+        self.responses.append(response)
+        return response
+
+    async def close(self) -> None:
+        pass
+
+
+def _create_api(transport: _StubTransport) -> AsyncWebApi:
+    return AsyncWebApi(
+        AsyncSession(
+            "",
+            "",
+            api_url="https://api/",
+            authorization_url="https://auth/",
+            transport=transport,
+            use_access_token_cache=False,
+        )
+    )
+
+
+def _series(name: str, **metadata: Any) -> Dict[str, Any]:
+    return {"dates": ["2021-01-01T00:00:00Z"], "values": [1], "metadata": {"PrimName": name, **metadata}}
+
+
+def _attribute_information(name: str, value_type: MetadataAttributeType) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "description": "",
+        "valueType": value_type,
+        "usesValueList": False,
+        "canListValues": False,
+        "canHaveMultipleValues": False,
+        "isDatabaseEntity": False,
+    }
+
+
+@pytest.mark.no_account
+class TestAsyncWebApi:
+    def test_get_series(self) -> None:
+        transport = _StubTransport()
+        attribute_requests: List[List[str]] = []
+
+        def get_attribute_information(params: Optional[Mapping[str, Any]], _: object) -> Tuple[int, object]:
+            assert params is not None
+            names = list(params["n"])
+            attribute_requests.append(names)
+            if "AsyncUnknown" in names:
+                return 404, {"status": 404, "detail": "not found"}
+            return 200, [_attribute_information(x, MetadataAttributeType.INT) for x in names]
+
+        transport.handlers[("GET", "https://api/v1/series/fetchseries")] = lambda p, j: (
+            200,
+            [_series("s1", AsyncInt="7"), _series("s2", AsyncInt="8", AsyncUnknown="x")],
+        )
+        transport.handlers[("GET", "https://api/v1/metadata/getattributeinformation")] = get_attribute_information
+
+        async def run() -> None:
+            async with _create_api(transport) as api:
+                series = await api.get_series(["s1", "s2"])
+
+                assert [x.name for x in series] == ["s1", "s2"]
+                assert series[0].values == [1.0]
+                assert series[0].dates == [datetime(2021, 1, 1, tzinfo=timezone.utc)]
+
+                call_count = len(transport.calls)
+                assert series[0].metadata["AsyncInt"] == 7
+                assert series[1].metadata["AsyncUnknown"] == "x"
+                assert len(transport.calls) == call_count
+
+        asyncio.run(run())
+
+        assert "AsyncInt" in attribute_requests[0]
+        assert ["AsyncUnknown"] in attribute_requests
+        assert transport.token_count == 1
+
+    def test_get_many_series(self) -> None:
+        transport = _StubTransport()
+
+        def fetch_series(_: Optional[Mapping[str, Any]], json: object) -> Tuple[int, object]:
+            assert isinstance(json, tuple)
+            return 200, [
+                {"errorText": "Not modified", "errorCode": 304} if x["name"] == "s1" else _series(x["name"])
+                for x in json
+            ]
+
+        transport.handlers[("POST", "https://api/v1/series/fetchseries")] = fetch_series
+        transport.handlers[("GET", "https://api/v1/metadata/getattributeinformation")] = lambda p, j: (
+            200,
+            [_attribute_information(x, MetadataAttributeType.STRING) for x in p["n"]] if p else [],
+        )
+
+        names = ["s" + str(x) for x in range(700)]
+
+        async def run() -> List[str]:
+            async with _create_api(transport) as api:
+                return [x.name async for x in api.get_many_series(names, max_workers=3)]
+
+        result = asyncio.run(run())
+
+        assert result == [x for x in names if x != "s1"]
+        assert transport.calls.count(("POST", "https://api/v1/series/fetchseries")) == 4
+        assert transport.max_in_flight == 3
+
+    def test_get_many_series_with_revisions(self) -> None:
+        transport = _StubTransport(chunk_size=7)
+        transport.handlers[("POST", "https://api/v1/series/fetchallvintageseries")] = lambda p, j: (
+            200,
+            [
+                {
+                    "metadata": {"PrimName": "s1"},
+                    "vintages": [
+                        {"vintageTimeStamp": "2021-01-02T00:00:00Z", "dates": ["2021-01-01"], "values": [1]},
+                        {"vintageTimeStamp": "2021-01-03T00:00:00Z", "dates": ["2021-01-01"], "values": [2]},
+                    ],
+                },
+                {"errorText": "Not modified", "errorCode": 304},
+            ],
+        )
+        transport.handlers[("GET", "https://api/v1/metadata/getattributeinformation")] = lambda p, j: (
+            200,
+            [_attribute_information(x, MetadataAttributeType.STRING) for x in p["n"]] if p else [],
+        )
+
+        async def run() -> None:
+            async with _create_api(transport) as api:
+                requests = [RevisionHistoryRequest("s1"), RevisionHistoryRequest("s2")]
+                result = [x async for x in api.get_many_series_with_revisions(requests)]
+
+                assert len(result) == 1
+                assert result[0].status_code == StatusCode.OK
+                assert [x.values for x in result[0].vintages] == [[1.0], [2.0]]
+
+                result = [x async for x in api.get_many_series_with_revisions(requests, include_not_modified=True)]
+
+                assert [x.status_code for x in result] == [StatusCode.OK, StatusCode.NOT_MODIFIED]
+
+        asyncio.run(run())
+
+        assert all(x.closed for x in transport.responses)
+
+    def test_refetch_token_on_401(self) -> None:
+        transport = _StubTransport()
+        statuses = [401, 200]
+        transport.handlers[("GET", "https://api/v1/series/getrevisioninfo")] = lambda p, j: (
+            statuses.pop(0),
+            [{"storesRevisions": False, "hasRevisions": False, "vintageTimeStamps": []}],
+        )
+
+        async def run() -> None:
+            async with _create_api(transport) as api:
+                result = await api.get_revision_info("s1")
+                assert result[0].stores_revisions is False
+
+        asyncio.run(run())
+
+        assert transport.token_count == 2
+
+    def test_problem_details(self) -> None:
+        transport = _StubTransport()
+        transport.handlers[("GET", "https://api/v1/series/fetchallvintageseries")] = lambda p, j: (
+            404,
+            {"status": 404, "detail": "not found"},
+        )
+
+        async def run() -> None:
+            async with _create_api(transport) as api:
+                with pytest.raises(ValueError, match="Series not found: s1"):
+                    await api.get_all_vintage_series("s1")
+
+                with pytest.raises(ProblemDetailsException):
+                    await api.session.series.get_fetch_all_vintage_series("s1")
+
+        asyncio.run(run())
+
+    def test_closed(self) -> None:
+        transport = _StubTransport()
+
+        async def run() -> None:
+            api = _create_api(transport)
+            await api.close()
+            with pytest.raises(ValueError, match="AsyncWebApi is not open"):
+                await api.get_series(["s1"])
+
+        asyncio.run(run())
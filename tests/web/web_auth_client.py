@@ -1,8 +1,19 @@
-from typing import cast
+import os
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps as json_dump
+from threading import Lock
+from time import sleep
+from typing import Any, List, cast
 
 import pytest
 
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.models import Response as ResponseModel
+
+from macrobond_data_api.web._access_token_cache import _AccessTokenCache
 from macrobond_data_api.web._auth_client import _AuthClient
+from macrobond_data_api.web._file_access_token_cache import _FileAccessTokenCache
 from macrobond_data_api.web import (
     AuthDiscoveryException,
     AuthFetchTokenException,
@@ -188,7 +199,7 @@ class TestAuthClient:
 class TestAuthClientCache:
 
     def test_1(self, mab: MAB) -> None:
-        _, _, _, auth_client1 = (mab.auth(10).auth(10).use_access_token_cache()).build()
+        _, _, _, auth_client1 = (mab.auth(10).token(10).use_access_token_cache()).build()
 
         auth_client_2 = _AuthClient(
             auth_client1._username,
@@ -224,3 +235,122 @@ class TestAuthClientCache:
         assert auth_client1.fetch_token_if_necessary() is True
 
         assert auth_client_2.fetch_token_if_necessary() is False
+
+
+@pytest.mark.no_account
+class TestAuthClientDiscoveryCache:
+
+    def test_shared_between_sessions(self, mab: MAB) -> None:
+        mock_adapter, _, session, auth_client = mab.auth().token().build()
+        auth_client.fetch_token()
+        assert mock_adapter.index == 2
+
+        auth_client_2 = _AuthClient("", "", [], auth_client.authorization_url, session, False)
+        auth_client_2.fetch_token()
+
+        assert mock_adapter.index == 3
+        assert auth_client_2.token_endpoint == TOKEN_ENDPOINT
+
+    def test_forget_on_error(self, mab: MAB) -> None:
+        mock_adapter, _, session, auth_client = (mab.auth().response(TOKEN_ENDPOINT, 500).discovery().token()).build()
+        auth_client.fetch_token()
+
+        auth_client_2 = _AuthClient("", "", [], auth_client.authorization_url, session, False)
+        with pytest.raises(AuthFetchTokenException, match="status code is not 200 or 400"):
+            auth_client_2.fetch_token()
+        assert auth_client_2.token_endpoint is None
+
+        auth_client_2.fetch_token()
+        assert mock_adapter.index == 5
+
+    def test_file(self, mab: MAB, tmp_path: Any) -> None:
+        path = os.path.join(tmp_path, "tokens.json")
+        mock_adapter, _, session, auth_client = mab.auth().token().build()
+        auth_client._cache = _FileAccessTokenCache("key", path)
+        auth_client.fetch_token()
+
+        # a new process has an empty in-memory cache
+        _AccessTokenCache._token_endpoints.clear()
+        auth_client_2 = _AuthClient("", "", [], auth_client.authorization_url, session, False)
+        auth_client_2._cache = _FileAccessTokenCache("key 2", path)
+        auth_client_2.fetch_token()
+
+        assert mock_adapter.index == 3
+        with open(path, "r", encoding="utf-8") as f:
+            assert "discovery:" not in f.read()
+
+
+class _TokenAdapter(BaseAdapter):
+    def __init__(self, delay: float = 0) -> None:
+        super().__init__()
+        self.delay = delay
+        self.lock = Lock()
+        self.token_count = 0
+        self.rejected: List[str] = []
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Response:  # pylint: disable=unused-argument
+        response = ResponseModel()
+        response.status_code = 200
+        if request.url == DISCOVERY_URL:
+            body: Any = {"token_endpoint": TOKEN_ENDPOINT}
+        elif request.url == TOKEN_ENDPOINT:
+            sleep(self.delay)
+            with self.lock:
+                self.token_count += 1
+                body = {"access_token": "token " + str(self.token_count), "expires_in": 100, "token_type": "Bearer"}
+        else:
+            body = "ok"
+            with self.lock:
+                if request.headers["Authorization"] in self.rejected:
+                    response.status_code = 401
+        response._content = json_dump(body).encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.no_account
+class TestAuthClientConcurrency:
+
+    def test_single_flight(self, mab: MAB) -> None:
+        _, _, session, auth_client = mab.set_no_assert().build()
+        adapter = _TokenAdapter(0.05)
+        session.requests_session.mount("https://", adapter)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: auth_client.fetch_token_if_necessary(), range(8)))
+
+        assert results.count(True) == 1
+        assert adapter.token_count == 1
+
+    def test_single_flight_on_401(self, mab: MAB) -> None:
+        _, _, session, auth_client = mab.set_no_assert().build()
+        adapter = _TokenAdapter(0.05)
+        session.requests_session.mount("https://", adapter)
+        session.requests_session.mount(session.api_url, adapter)
+        auth_client.fetch_token()
+        adapter.rejected.append("Bearer token 1")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: session.get_or_raise("test").json(), range(8)))
+
+        assert results == ["ok"] * 8
+        assert adapter.token_count == 2
+
+    def test_renewal(self, mab: MAB) -> None:
+        _, _, session, auth_client = mab.set_no_assert().set_refresh_ahead(30).build()
+        adapter = _TokenAdapter()
+        session.requests_session.mount("https://", adapter)
+        auth_client.fetch_token()
+
+        auth_client.is_expired_get_time = lambda: 10
+        assert auth_client.fetch_token_if_necessary() is False
+        assert adapter.token_count == 1
+
+        auth_client.is_expired_get_time = lambda: 80
+        assert auth_client.fetch_token_if_necessary() is False
+
+        with auth_client._renewal_lock:
+            assert adapter.token_count == 2
+        assert auth_client._cache._get().access_token == "token 2"
@@ -0,0 +1,204 @@
+import os
+from datetime import datetime
+from io import BytesIO
+from json import dumps as json_dump, loads as json_load
+from threading import Lock, get_ident
+from typing import Any, List, Optional, Set, Tuple
+
+import pytest
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.models import Response as ResponseModel
+
+from macrobond_data_api.common.types import Series
+from macrobond_data_api.web import DataPackageListPoller, SqliteDataPackageListCheckpointStore, WebApi
+from macrobond_data_api.web.web_types import DataPackageBody, DataPackageListItem
+
+from ..mock_adapter_builder import MAB
+
+
+class _Adapter(BaseAdapter):
+    def __init__(self, count: int, incremental_count: int = 0) -> None:
+        super().__init__()
+        self.count = count
+        self.incremental_count = incremental_count
+        self.lock = Lock()
+        self.fetched: List[str] = []
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Response:  # pylint: disable=unused-argument
+        response = ResponseModel()
+        response.status_code = 200
+        if request.url.startswith("https://api/v1/series/getdatapackagelist"):
+            body: Any = {
+                "downloadFullListOnOrAfter": "2000-02-01T04:05:06",
+                "timeStampForIfModifiedSince": "2000-02-02T04:05:06",
+                "state": 0,
+                "entities": [
+                    {"name": "s" + str(x), "modified": "2000-02-03T04:05:06"}
+                    for x in range(self.incremental_count if "ifModifiedSince" in request.url else self.count)
+                ],
+            }
+        else:
+            assert request.url == "https://api/v1/series/fetchseries"
+            names = [x["name"] for x in json_load(request.body)]
+            with self.lock:
+                self.fetched.extend(names)
+            body = [{"dates": ["2021-01-01"], "values": [1.0], "metadata": {"PrimName": x}} for x in names]
+        response.raw = BytesIO(json_dump(body).encode())
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class _Poller(DataPackageListPoller):
+    def __init__(
+        self,
+        api: WebApi,
+        fail: bool = False,
+        checkpoint_store: Optional[SqliteDataPackageListCheckpointStore] = None,
+        abort_after: Optional[int] = None,
+        time_stamp_for_if_modified_since: Optional[datetime] = None,
+    ) -> None:
+        super().__init__(
+            api,
+            time_stamp_for_if_modified_since=time_stamp_for_if_modified_since,
+            checkpoint_store=checkpoint_store,
+            _sleep=self._sleep_or_abort,
+        )
+        self.fail = fail
+        self.abort_after = abort_after
+        self.items: List[str] = []
+        self.series: List[str] = []
+        self.threads: Set[int] = set()
+        self.stops: List[Tuple[bool, Optional[Exception]]] = []
+        self.incremental_stops: List[Tuple[bool, Optional[Exception]]] = []
+        self.lock = Lock()
+
+    def _sleep_or_abort(self, seconds: int) -> None:
+        if seconds == self.up_to_date_delay:
+            self.abort()
+
+    def on_full_listing_start(self, subscription: DataPackageBody) -> None: ...
+
+    def on_full_listing_items(self, subscription: DataPackageBody, items: List[DataPackageListItem]) -> None:
+        self.items.extend(x.name for x in items)
+        if self.abort_after is not None and len(self.items) >= self.abort_after:
+            self.abort()
+
+    def on_full_listing_stop(self, is_aborted: bool, exception: Optional[Exception]) -> None:
+        self.stops.append((is_aborted, exception))
+
+    def on_incremental_start(self, subscription: DataPackageBody) -> None: ...
+
+    def on_incremental_items(self, subscription: DataPackageBody, items: List[DataPackageListItem]) -> None:
+        self.on_full_listing_items(subscription, items)
+
+    def on_incremental_stop(self, is_aborted: bool, exception: Optional[Exception]) -> None:
+        self.incremental_stops.append((is_aborted, exception))
+
+    def on_series(self, subscription: DataPackageBody, series: List[Series]) -> None:
+        if self.fail:
+            raise ValueError("on_series failed")
+        with self.lock:
+            self.series.extend(x.name for x in series)
+            self.threads.add(get_ident())
+
+
+def _build(mab: MAB, count: int, incremental_count: int = 0) -> Tuple[WebApi, _Adapter]:
+    _, api, session, auth_client = mab.auth().build()
+    auth_client.fetch_token_if_necessary()
+    adapter = _Adapter(count, incremental_count)
+    session.requests_session.mount("https://api/", adapter)
+    return api, adapter
+
+
+@pytest.mark.no_account
+class TestDataPackageListPoller:
+    def test_without_series_workers(self, mab: MAB) -> None:
+        api, adapter = _build(mab, 450)
+        poller = _Poller(api)
+
+        poller.start()
+
+        assert len(poller.items) == 450
+        assert not poller.series
+        assert not adapter.fetched
+        assert poller.stops == [(False, None)]
+
+    def test_series_workers(self, mab: MAB) -> None:
+        api, adapter = _build(mab, 1000)
+        poller = _Poller(api)
+        poller.series_workers = 3
+        poller.series_queue_size = 1
+
+        poller.start()
+
+        names = ["s" + str(x) for x in range(1000)]
+        assert poller.items == names
+        assert sorted(poller.series) == sorted(names)
+        assert sorted(adapter.fetched) == sorted(names)
+        assert get_ident() not in poller.threads
+        assert poller.stops == [(False, None)]
+
+    def test_series_worker_error(self, mab: MAB) -> None:
+        api, _ = _build(mab, 450)
+        poller = _Poller(api, fail=True)
+        poller.series_workers = 2
+
+        poller.start()
+
+        assert len(poller.stops) == 1
+        assert poller.stops[0][0] is False
+        assert str(poller.stops[0][1]) == "on_series failed"
+
+    def test_series_workers_without_on_series(self, mab: MAB) -> None:
+        _, api, _, _ = mab.auth().set_no_assert().build()
+
+        class _PollerWithoutOnSeries(_Poller):
+            on_series = DataPackageListPoller.on_series
+
+        poller = _PollerWithoutOnSeries(api)
+        poller.series_workers = 1
+
+        with pytest.raises(ValueError, match="on_series must be overridden when series_workers is greater than 0"):
+            poller.start()
+        assert not poller.stops
+
+    def test_abort_incremental_listing(self, mab: MAB) -> None:
+        api, _ = _build(mab, 0, 450)
+        poller = _Poller(api, abort_after=200, time_stamp_for_if_modified_since=datetime(2000, 1, 1))
+
+        poller.start()
+
+        assert len(poller.items) == 200
+        assert not poller.stops
+        assert [x[0] for x in poller.incremental_stops] == [True]
+
+    def test_checkpoint_store(self, mab: MAB, tmp_path: Any) -> None:
+        api, _ = _build(mab, 450)
+        path = os.path.join(str(tmp_path), "checkpoint.db")
+
+        with SqliteDataPackageListCheckpointStore(path) as store:
+            poller = _Poller(api, checkpoint_store=store, abort_after=400)
+            poller.start()
+
+            assert len(poller.items) == 400
+            assert [x[0] for x in poller.stops] == [True]
+            assert store.load() == (None, None)
+
+        # Restarted after the first two batches
+        with SqliteDataPackageListCheckpointStore(path) as store:
+            poller = _Poller(api, checkpoint_store=store)
+            poller.start()
+
+            assert poller.items == ["s" + str(x) for x in range(400, 450)]
+            assert poller.stops == [(False, None)]
+            assert store.load() == (datetime(2000, 2, 1, 4, 5, 6), datetime(2000, 2, 2, 4, 5, 6))
+
+        with SqliteDataPackageListCheckpointStore(path) as store:
+            poller = _Poller(api, checkpoint_store=store)
+
+            assert poller.download_full_list_on_or_after == datetime(2000, 2, 1, 4, 5, 6)
+            assert poller.time_stamp_for_if_modified_since == datetime(2000, 2, 2, 4, 5, 6)
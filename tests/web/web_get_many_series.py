@@ -0,0 +1,97 @@
+from json import dumps as json_dump
+from threading import Barrier, Event
+from typing import Any, Dict, List
+
+import pytest
+
+from ..mock_adapter import ApiEndpointAdapter
+from ..mock_adapter_builder import MAB
+
+
+def _create(x: Dict[str, Any]) -> Dict[str, Any]:
+    return {"dates": ["2021-01-01"], "values": [1.0], "metadata": {"PrimName": x["name"]}}
+
+
+def _adapter() -> ApiEndpointAdapter:
+    return ApiEndpointAdapter("v1/series/fetchseries", _create)
+
+
+def _names(count: int) -> List[str]:
+    return ["s" + str(x) for x in range(count)]
+
+
+@pytest.mark.no_account
+class TestGetManySeries:
+    def test_sequential(self, mab: MAB) -> None:
+        adapter = _adapter()
+        api, _ = mab.build_with_endpoint(adapter)
+
+        names = _names(450)
+        result = list(api.get_many_series(names))
+
+        assert [x.name for x in result] == names
+        assert len(adapter.requests) == 3
+        assert adapter.max_in_flight == 1
+
+    def test_concurrent_preserve_order(self, mab: MAB) -> None:
+        adapter = _adapter()
+        api, _ = mab.build_with_endpoint(adapter)
+        # The first three chunks are only answered when all of them have been requested
+        barrier = Barrier(3, timeout=10)
+
+        def on_request(body: List[Dict[str, Any]]) -> None:
+            if body[0]["name"] in ("s0", "s200", "s400"):
+                barrier.wait()
+
+        adapter.on_request = on_request
+
+        names = _names(1000)
+        result = list(api.get_many_series(names, max_workers=3))
+
+        assert [x.name for x in result] == names
+        assert len(adapter.requests) == 5
+        assert adapter.max_in_flight == 3
+
+    def test_concurrent_completion_order(self, mab: MAB) -> None:
+        adapter = _adapter()
+        api, _ = mab.build_with_endpoint(adapter)
+        # The first chunk is answered after a series of the second chunk has been returned
+        returned = Event()
+
+        def on_request(body: List[Dict[str, Any]]) -> None:
+            if body[0]["name"] == "s0":
+                returned.wait(10)
+
+        adapter.on_request = on_request
+
+        names = _names(400)
+        series = api.get_many_series(names, max_workers=2, preserve_order=False)
+        result = [next(series).name]
+        returned.set()
+        result += [x.name for x in series]
+
+        assert sorted(result) == sorted(names)
+        assert result[0] == "s200"
+
+    def test_bad_max_workers(self, mab: MAB) -> None:
+        _, api, _, _ = mab.auth().set_no_assert().build()
+
+        with pytest.raises(ValueError, match="max_workers must be 1 or greater"):
+            list(api.get_many_series(["s0"], max_workers=0))
+
+    def test_streaming(self, mab: MAB) -> None:
+        body = json_dump(
+            [{"dates": ["2021-01-01"] * 500, "values": [1.0] * 500, "metadata": {"PrimName": x}} for x in _names(200)]
+        ).encode()
+        _, api, _, _ = mab.auth().response("https://api/v1/series/fetchseries", 200, raw=body).build()
+        raw = mab._responses[-1].raw
+
+        result = api.get_many_series(_names(200))
+        first = next(result)
+
+        # The first series is decoded before the whole chunk is received
+        assert first.name == "s0"
+        assert raw.tell() < len(body)
+
+        assert len(list(result)) == 199
+        assert raw.tell() == len(body)
@@ -0,0 +1,116 @@
+from threading import Barrier, Event
+from typing import Any, Dict, List, Tuple, cast
+
+import pytest
+
+from macrobond_data_api.common.types import RevisionHistoryRequest, SeriesWithVintages
+from macrobond_data_api.web import WebApi
+
+from ..mock_adapter import ApiEndpointAdapter
+from ..mock_adapter_builder import MockAdapterBuilder as MAB
+
+
+def _create(x: Dict[str, Any]) -> Dict[str, Any]:
+    name = x["name"]
+    if name == "s1":
+        return {"errorCode": 304, "errorText": "Not modified"}
+    return {
+        "metadata": {"PrimName": name},
+        "vintages": [{"dates": ["2021-01-01"] * 100, "values": [float(name[1:])] * 100}],
+    }
+
+
+def _requests(count: int) -> List[RevisionHistoryRequest]:
+    return [RevisionHistoryRequest("s" + str(x)) for x in range(count)]
+
+
+def _names(count: int) -> List[str]:
+    return ["s" + str(x) for x in range(count) if x != 1]
+
+
+def _name(series: SeriesWithVintages) -> str:
+    # The series are numbered by their values, so that the metadata is not needed
+    return "s" + str(int(cast(float, series.vintages[0].values[0])))
+
+
+@pytest.mark.no_account
+class TestGetManySeriesWithRevisions:
+    def _adapter(self, mab: MAB) -> Tuple[WebApi, ApiEndpointAdapter]:
+        adapter = ApiEndpointAdapter("v1/series/fetchallvintageseries", _create)
+        api, _ = mab.build_with_endpoint(adapter)
+        return api, adapter
+
+    def test_sequential(self, mab: MAB) -> None:
+        api, adapter = self._adapter(mab)
+
+        result = list(api.get_many_series_with_revisions(_requests(450)))
+
+        assert [_name(x) for x in result] == _names(450)
+        assert len(adapter.requests) == 3
+        assert adapter.max_in_flight == 1
+
+    def test_concurrent_preserve_order(self, mab: MAB) -> None:
+        api, adapter = self._adapter(mab)
+        # The first three chunks are only answered when all of them have been requested
+        barrier = Barrier(3, timeout=10)
+
+        def on_request(body: List[Dict[str, Any]]) -> None:
+            if body[0]["name"] in ("s0", "s200", "s400"):
+                barrier.wait()
+
+        adapter.on_request = on_request
+
+        result = list(api.get_many_series_with_revisions(_requests(1000), max_workers=3, buffer_size=10))
+
+        assert [_name(x) for x in result] == _names(1000)
+        assert len(adapter.requests) == 5
+        assert adapter.max_in_flight == 3
+
+    def test_concurrent_completion_order(self, mab: MAB) -> None:
+        api, adapter = self._adapter(mab)
+        # The first chunk is answered after a series of the second chunk has been returned
+        returned = Event()
+
+        def on_request(body: List[Dict[str, Any]]) -> None:
+            if body[0]["name"] == "s0":
+                returned.wait(10)
+
+        adapter.on_request = on_request
+
+        series = api.get_many_series_with_revisions(_requests(400), max_workers=2, preserve_order=False)
+        result = [_name(next(series))]
+        returned.set()
+        result += [_name(x) for x in series]
+
+        assert sorted(result) == sorted(_names(400))
+        assert result[0] == "s200"
+        assert len(adapter.requests) == 2
+
+    def test_bounded_buffer(self, mab: MAB) -> None:
+        api, adapter = self._adapter(mab)
+        # The first chunk is answered after the second chunk has been requested
+        requested = Event()
+
+        def on_request(body: List[Dict[str, Any]]) -> None:
+            if body[0]["name"] == "s0":
+                requested.wait(10)
+            else:
+                requested.set()
+
+        adapter.on_request = on_request
+
+        result = api.get_many_series_with_revisions(_requests(400), max_workers=2, buffer_size=5)
+        assert _name(next(result)) == "s0"
+
+        # The workers wait for the consumer instead of decoding the whole chunks
+        assert len(adapter.requests) == 2
+        with adapter.lock:
+            assert all(x.tell() < len(x.getvalue()) for x in adapter.bodies)
+
+        result.close()
+
+    def test_bad_buffer_size(self, mab: MAB) -> None:
+        _, api, _, _ = mab.auth().set_no_assert().build()
+
+        with pytest.raises(ValueError, match="buffer_size must be 1 or greater"):
+            list(api.get_many_series_with_revisions(_requests(1), max_workers=2, buffer_size=0))
@@ -0,0 +1,183 @@
+import os
+import time
+from threading import Thread
+from typing import Any, Dict, Iterator, List
+from unittest.mock import Mock
+
+import pytest
+
+from macrobond_data_api.common.enums import MetadataAttributeType
+from macrobond_data_api.web.configuration import Configuration
+from macrobond_data_api.web._metadata_directory import _MetadataTypeDirectory
+
+from ..mock_adapter_builder import MockAdapterBuilder as MAB
+
+
+def _attribute_information(name: str, value_type: MetadataAttributeType) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "description": "",
+        "valueType": value_type,
+        "usesValueList": False,
+        "canListValues": False,
+        "canHaveMultipleValues": False,
+        "isDatabaseEntity": False,
+    }
+
+
+def _series(metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"dates": ["2021-01-01"], "values": [1.0], "metadata": metadata}]
+
+
+@pytest.fixture(autouse=True)
+def _clear_type_db() -> Iterator[None]:
+    def clear() -> None:
+        _MetadataTypeDirectory._type_db.clear()
+        _MetadataTypeDirectory._unknown_expires_at.clear()
+        _MetadataTypeDirectory._type_db_path = None
+        _MetadataTypeDirectory._hits = 0
+        _MetadataTypeDirectory._misses = 0
+
+    clear()
+    yield
+    clear()
+    Configuration.set_metadata_type_db_path(None)
+    Configuration.set_metadata_unknown_type_ttl(3600)
+
+
+@pytest.mark.no_account
+class TestMetadataTypeDirectory:
+    def test_one_request_per_response(self, mab: MAB) -> None:
+        _, api, _, _ = (
+            mab.auth()
+            .response(
+                "https://api/v1/series/fetchseries?n=s1",
+                200,
+                _series({"PrimName": "s1", "TestInt": "7", "TestDouble": "1.5"}),
+            )
+            .response(
+                "https://api/v1/metadata/getattributeinformation?n=PrimName&n=TestInt&n=TestDouble",
+                200,
+                [
+                    _attribute_information("PrimName", MetadataAttributeType.STRING),
+                    _attribute_information("TestInt", MetadataAttributeType.INT),
+                    _attribute_information("TestDouble", MetadataAttributeType.DOUBLE),
+                ],
+            )
+            .build()
+        )
+
+        metadata = api.get_one_series("s1").metadata
+
+        assert metadata["TestInt"] == 7
+        assert metadata["TestDouble"] == 1.5
+        assert metadata["PrimName"] == "s1"
+
+    def test_unknown_attribute(self, mab: MAB) -> None:
+        _, api, _, _ = (
+            mab.auth()
+            .response(
+                "https://api/v1/series/fetchseries?n=s1",
+                200,
+                _series({"TestInt": "7", "TestUnknown": "x"}),
+            )
+            .response(
+                "https://api/v1/metadata/getattributeinformation?n=TestInt&n=TestUnknown",
+                404,
+                {"status": 404, "detail": "not found"},
+                headers={"Content-Type": "application/json"},
+            )
+            .response(
+                "https://api/v1/metadata/getattributeinformation?n=TestInt",
+                200,
+                [_attribute_information("TestInt", MetadataAttributeType.INT)],
+            )
+            .response(
+                "https://api/v1/metadata/getattributeinformation?n=TestUnknown",
+                404,
+                {"status": 404, "detail": "not found"},
+                headers={"Content-Type": "application/json"},
+            )
+            .build()
+        )
+
+        metadata = api.get_one_series("s1").metadata
+
+        assert metadata["TestUnknown"] == "x"
+        assert metadata["TestUnknown"] == "x"
+        assert metadata["TestInt"] == 7
+
+    def test_type_db(self, mab: MAB, tmp_path: Any) -> None:
+        path = os.path.join(str(tmp_path), "types.json")
+        Configuration.set_metadata_type_db_path(path)
+
+        _, api, _, _ = (
+            mab.auth()
+            .response("https://api/v1/series/fetchseries?n=s1", 200, _series({"TestInt": "7"}))
+            .response(
+                "https://api/v1/metadata/getattributeinformation?n=TestInt",
+                200,
+                [_attribute_information("TestInt", MetadataAttributeType.INT)],
+            )
+            .build()
+        )
+        assert api.get_one_series("s1").metadata["TestInt"] == 7
+
+        # A new process only has the file
+        _MetadataTypeDirectory._type_db.clear()
+        _MetadataTypeDirectory._type_db_path = None
+
+        mab = MAB().auth().response("https://api/v1/series/fetchseries?n=s1", 200, _series({"TestInt": "8"}))
+        _, api, _, _ = mab.build()
+        assert api.get_one_series("s1").metadata["TestInt"] == 8
+        mab.assert_this()
+
+    def test_single_flight(self) -> None:
+        def get_attribute_information(*names: str) -> List[Dict[str, Any]]:
+            time.sleep(0.1)
+            return [_attribute_information(x, MetadataAttributeType.INT) for x in names]
+
+        session = Mock()
+        session.metadata.get_attribute_information.side_effect = get_attribute_information
+        directory = _MetadataTypeDirectory(session)
+
+        results: List[Any] = []
+        threads = [Thread(target=lambda: results.append(directory.convert("TestInt", "7"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [7] * 8
+        assert session.metadata.get_attribute_information.call_count == 1
+
+    def test_unknown_ttl_and_stats(self, mab: MAB) -> None:
+        _, api, session, _ = (
+            mab.auth()
+            .response("https://api/v1/series/fetchseries?n=s1", 200, _series({"TestUnknown": "x"}))
+            .response(
+                "https://api/v1/metadata/getattributeinformation?n=TestUnknown",
+                404,
+                {"status": 404, "detail": "not found"},
+                headers={"Content-Type": "application/json"},
+            )
+            .response(
+                "https://api/v1/metadata/getattributeinformation?n=TestUnknown",
+                404,
+                {"status": 404, "detail": "not found"},
+                headers={"Content-Type": "application/json"},
+            )
+            .build()
+        )
+
+        metadata = api.get_one_series("s1").metadata
+        assert metadata["TestUnknown"] == "x"
+        assert metadata["TestUnknown"] == "x"
+
+        assert session.metadata_type_directory_stats() == {"hits": 1, "misses": 1, "size": 1, "unknown": 1}
+
+        Configuration.set_metadata_unknown_type_ttl(0)
+        _MetadataTypeDirectory._unknown_expires_at["TestUnknown"] = 0
+        assert metadata["TestUnknown"] == "x"
+
+        assert session.metadata_type_directory_stats()["misses"] == 2
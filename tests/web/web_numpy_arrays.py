@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import cast
+
+import numpy
+import pytest
+
+from macrobond_data_api.web._numpy_arrays import _dates_to_array, _values_to_array
+
+from ..mock_adapter_builder import MAB
+
+
+@pytest.mark.no_account
+class TestNumpyArrays:
+    def test_values(self) -> None:
+        values = _values_to_array([1.0, None, 3])
+
+        assert values.dtype == numpy.float64
+        assert values[0] == 1.0
+        assert numpy.isnan(values[1])
+        assert values[2] == 3.0
+
+    def test_dates(self) -> None:
+        dates = _dates_to_array(["2021-01-01", "2021-01-02T04:05:06", "2021-01-03T04:05:06.5"])
+
+        assert dates.dtype == numpy.dtype("datetime64[ns]")
+        assert list(dates) == [
+            numpy.datetime64("2021-01-01T00:00:00"),
+            numpy.datetime64("2021-01-02T04:05:06"),
+            numpy.datetime64("2021-01-03T04:05:06.5"),
+        ]
+
+    def test_dates_with_time_zone(self) -> None:
+        dates = _dates_to_array(["2021-01-01T04:05:06Z", "2021-01-01T04:05:06+01:00", "2021-01-01T04:05:06-01:00"])
+
+        assert list(dates) == [
+            numpy.datetime64("2021-01-01T04:05:06"),
+            numpy.datetime64("2021-01-01T03:05:06"),
+            numpy.datetime64("2021-01-01T05:05:06"),
+        ]
+
+    def test_get_series(self, mab: MAB) -> None:
+        _, api, _, _ = mab.auth().series_response("usgdp").build()
+        api.use_numpy_arrays = True
+
+        series = api.get_one_series("usgdp")
+
+        assert isinstance(series.values, numpy.ndarray)
+        assert isinstance(series.dates, numpy.ndarray)
+        assert list(series.values) == [1.0, 2.0]
+        assert list(series.dates) == [numpy.datetime64("2021-01-01"), numpy.datetime64("2021-01-02")]
+
+    def test_get_series_default_is_list(self, mab: MAB) -> None:
+        _, api, _, _ = mab.auth().series_response("usgdp").build()
+
+        series = api.get_one_series("usgdp")
+
+        assert series.values == [1.0, 2.0]
+        assert series.dates == [datetime(2021, 1, 1), datetime(2021, 1, 2)]
+
+    def test_get_nth_release(self, mab: MAB) -> None:
+        _, api, _, _ = (
+            mab.auth()
+            .response(
+                "https://api/v1/series/fetchnthreleaseseries?n=usgdp&nth=1",
+                200,
+                [{"dates": ["2021-01-01", "2021-02-01"], "values": [None, 2.0], "metadata": {"PrimName": "usgdp"}}],
+            )
+            .build()
+        )
+        api.use_numpy_arrays = True
+
+        series = api.get_one_nth_release(1, "usgdp")
+
+        assert numpy.isnan(cast(float, series.values[0]))
+        assert series.values[1] == 2.0
+        assert list(series.dates) == [numpy.datetime64("2021-01-01"), numpy.datetime64("2021-02-01")]
@@ -0,0 +1,109 @@
+from threading import Thread
+from typing import List
+
+import pytest
+
+from macrobond_data_api.web import RateLimiter
+
+from ..mock_adapter_builder import MockAdapterBuilder as MAB
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.no_account
+class TestRateLimiter:
+    def test_token_bucket(self) -> None:
+        clock = _Clock()
+        limiter = RateLimiter(requests_per_second=10, burst=2, _time=clock.time, _sleep=clock.sleep)
+
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release(200)
+
+        assert clock.sleeps == [pytest.approx(0.1), pytest.approx(0.1)]
+        assert limiter.stats() == {"requests": 4, "delayed": 2, "throttled": 0, "requests_per_second": 10}
+
+    def test_adaptive(self) -> None:
+        clock = _Clock()
+        limiter = RateLimiter(
+            requests_per_second=8, adaptive=True, min_requests_per_second=3, _time=clock.time, _sleep=clock.sleep
+        )
+
+        limiter.acquire()
+        limiter.release(429)
+        assert limiter.current_requests_per_second == 4
+        limiter.acquire()
+        limiter.release(429)
+        assert limiter.current_requests_per_second == 3
+
+        limiter.increase = 4
+        limiter.acquire()
+        limiter.release(200)
+        assert limiter.current_requests_per_second == 7
+        limiter.acquire()
+        limiter.release(200)
+        assert limiter.current_requests_per_second == 8
+        assert limiter.stats()["throttled"] == 2
+
+    def test_max_concurrent(self) -> None:
+        limiter = RateLimiter(max_concurrent=1)
+        limiter.acquire()
+
+        acquired: List[bool] = []
+
+        def acquire() -> None:
+            limiter.acquire()
+            acquired.append(True)
+
+        thread = Thread(target=acquire)
+        thread.start()
+        thread.join(0.05)
+        assert not acquired
+
+        limiter.release()
+        thread.join()
+        assert acquired == [True]
+        limiter.release()
+
+    def test_session(self, mab: MAB) -> None:
+        _, _, session, _ = (
+            mab.auth().response("https://api/test", 429).response("https://api/test", 200, "test")
+        ).build()
+        session._sleep = lambda x: None
+        session.rate_limiter = limiter = RateLimiter(requests_per_second=1000, max_concurrent=2, adaptive=True)
+
+        assert session.get_or_raise("test").text == "test"
+        assert limiter.stats()["requests"] == 2
+        assert limiter.stats()["throttled"] == 1
+        assert limiter.current_requests_per_second == pytest.approx(500.1)
+
+    def test_stream_holds_slot_until_closed(self, mab: MAB) -> None:
+        _, _, session, _ = (
+            mab.auth().response("https://api/test", 200, "first").response("https://api/test", 200, "second")
+        ).build()
+        session.rate_limiter = RateLimiter(max_concurrent=1)
+
+        first = session.get_or_raise("test", stream=True)
+        texts: List[str] = []
+        thread = Thread(target=lambda: texts.append(session.get_or_raise("test").text))
+        thread.start()
+        thread.join(0.05)
+        # The body of the first response has not been read, so the second request waits
+        assert not texts
+
+        with first:
+            assert first.text == "first"
+        first.close()
+        thread.join()
+        assert texts == ["second"]
@@ -0,0 +1,78 @@
+import os
+from typing import Any, Dict
+
+import pytest
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.web import SeriesCache
+
+from ..mock_adapter import ApiEndpointAdapter
+from ..mock_adapter_builder import MAB
+
+LAST_MODIFIED = "2021-03-04T05:06:07Z"
+
+
+class _Server:
+    def __init__(self) -> None:
+        self.value = 1.0
+
+    def create(self, x: Dict[str, Any]) -> Dict[str, Any]:
+        if x["name"] == "missing":
+            return {"errorText": "Not found", "errorCode": 404}
+        if x["ifModifiedSince"] == LAST_MODIFIED:
+            return {"errorText": "Not modified", "errorCode": 304}
+        return {
+            "dates": ["2021-01-01", "2021-01-02"],
+            "values": [self.value, None],
+            "metadata": {"PrimName": x["name"], "LastModifiedTimeStamp": LAST_MODIFIED},
+        }
+
+
+@pytest.mark.no_account
+class TestSeriesCache:
+    def test_revalidation(self, mab: MAB, tmp_path: Any) -> None:
+        server = _Server()
+        adapter = ApiEndpointAdapter("v1/series/fetchseries", server.create)
+        api, _ = mab.build_with_endpoint(adapter)
+        path = os.path.join(tmp_path, "cache.db")
+
+        with SeriesCache(api, path) as cache:
+            first = list(cache.get_many_series(["a", "missing"]))
+            assert [x.status_code for x in first] == [StatusCode.OK, StatusCode.NOT_FOUND]
+            assert first[0].values == [1.0, None]
+            assert adapter.requests[0] == [
+                {"name": "a", "ifModifiedSince": None},
+                {"name": "missing", "ifModifiedSince": None},
+            ]
+            assert (cache.hits, cache.misses) == (0, 1)
+
+        server.value = 2.0
+        with SeriesCache(api, path) as cache:
+            second = list(cache.get_many_series(["a", "b"]))
+            assert adapter.requests[1] == [
+                {"name": "a", "ifModifiedSince": LAST_MODIFIED},
+                {"name": "b", "ifModifiedSince": None},
+            ]
+            assert [x.name for x in second] == ["a", "b"]
+            assert [x.status_code for x in second] == [StatusCode.OK, StatusCode.OK]
+            assert second[0].values == [1.0, None]
+            assert list(second[0].metadata) == ["PrimName", "LastModifiedTimeStamp"]
+            assert second[1].values == [2.0, None]
+            assert (cache.hits, cache.misses) == (1, 1)
+
+            cache.remove(["a"])
+            assert cache.get_one_series("a").values == [2.0, None]
+            assert adapter.requests[2] == [{"name": "a", "ifModifiedSince": None}]
+
+            cache.clear()
+            cache.get_one_series("b")
+            assert adapter.requests[3] == [{"name": "b", "ifModifiedSince": None}]
+
+    def test_closed(self, mab: MAB, tmp_path: Any) -> None:
+        _, api, _, _ = mab.set_no_assert().build()
+
+        cache = SeriesCache(api, os.path.join(tmp_path, "cache.db"))
+        cache.close()
+
+        with pytest.raises(ValueError, match="SeriesCache is closed"):
+            cache.clear()
@@ -1,4 +1,17 @@
+import gzip
+from io import BytesIO
+from json import dumps as json_dump
+from typing import Any, List, Tuple, cast
+
 import pytest
+from requests import Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+
+from macrobond_data_api.web import RetryPolicy
+from macrobond_data_api.web.session import Session, _ResponseAsFileObject
+from macrobond_data_api.web.web_types import HttpException
+
 from ..mock_adapter_builder import MAB
 
 # TODO @mb-jp add tests using proxie
@@ -23,3 +36,199 @@ class TestWebSession:
 
         assert response.status_code == 200
         assert response.text == "test"
+
+
+@pytest.mark.no_account
+class TestRetryPolicy:
+    def test_retry_status(self, mab: MAB) -> None:
+        _, _, session, _ = (
+            mab.auth()
+            .response("https://api/v1/series/fetchseries", 503)
+            .response("https://api/v1/series/fetchseries", 429, headers={"Retry-After": "7"})
+            .response("https://api/v1/series/fetchseries", 200, [])
+        ).build()
+        delays: List[float] = []
+        session._sleep = delays.append
+        session.retry_policy = RetryPolicy(jitter=False)
+
+        assert session.post_or_raise("v1/series/fetchseries", json=[]).json() == []
+        assert delays == [0.5, 7]
+        assert session.retry_stats() == {"retries": 2, "retried_requests": 1, "failed_after_retries": 0}
+
+    def test_give_up(self, mab: MAB) -> None:
+        _, _, session, _ = (
+            mab.auth()
+            .response("https://api/test", 502)
+            .response("https://api/test", 502)
+            .response("https://api/test", 502)
+        ).build()
+        delays: List[float] = []
+        session._sleep = delays.append
+        session.retry_policy = RetryPolicy(max_retries=2, backoff_factor=1, max_delay=1.5, jitter=False)
+
+        with pytest.raises(HttpException):
+            session.get_or_raise("test")
+        assert delays == [1, 1.5]
+        assert session.retry_stats() == {"retries": 2, "retried_requests": 1, "failed_after_retries": 1}
+
+    def test_not_idempotent(self, mab: MAB) -> None:
+        _, _, session, _ = (mab.auth().response("https://api/v1/series/uploadseries", 503)).build()
+        session._sleep = lambda x: None
+
+        with pytest.raises(HttpException):
+            session.post_or_raise("v1/series/uploadseries", json={})
+        assert session.retry_stats()["retries"] == 0
+
+    def test_get_delay(self) -> None:
+        policy = RetryPolicy(max_retries=3, backoff_factor=1, max_delay=10)
+
+        assert 0 <= cast(float, policy.get_delay(2)) <= 4
+        assert policy.get_delay(3) is None
+        assert policy.get_delay(0, "3") == 3
+        assert policy.get_delay(0, "60") is None
+        assert policy.get_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+class _GzipAdapter(HTTPAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.accept_encodings: List[str] = []
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Response:  # pylint: disable=unused-argument
+        self.accept_encodings.append(request.headers["Accept-Encoding"])
+        if request.url.endswith("openid-configuration"):
+            body: Any = {"token_endpoint": "https://auth/token"}
+        elif request.url.startswith("https://auth/"):
+            body = {"access_token": "token", "expires_in": 100, "token_type": "Bearer"}
+        else:
+            body = [{"value": x} for x in range(1000)]
+        raw = HTTPResponse(
+            body=BytesIO(gzip.compress(json_dump(body).encode())),
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+            status=200,
+            preload_content=False,
+            decode_content=True,
+        )
+        return self.build_response(request, raw)
+
+
+@pytest.mark.no_account
+class TestCompression:
+    @staticmethod
+    def _session(**kwargs: Any) -> Tuple[Session, _GzipAdapter]:
+        session = Session(
+            "", "", api_url="https://api/", authorization_url="https://auth/", use_access_token_cache=False, **kwargs
+        )
+        adapter = _GzipAdapter()
+        session.requests_session.mount("https://", adapter)
+        session.requests_session.mount(session.api_url, adapter)
+        return session, adapter
+
+    def test_transfer_stats(self) -> None:
+        session, adapter = self._session()
+
+        assert len(session.get_or_raise("v1/series/getdatapackagelist", params={"a": 1}).json()) == 1000
+        with session.get_or_raise("v1/series/getdatapackagelist", stream=True) as response:
+            assert len(list(session._ijson_items(response, "item"))) == 1000
+
+        assert "gzip" in adapter.accept_encodings[-1]
+        stats = session.transfer_stats()["v1/series/getdatapackagelist"]
+        assert stats["responses"] == 2
+        assert stats["uncompressed_bytes"] == 2 * len(json_dump([{"value": x} for x in range(1000)]))
+        assert 0 < stats["compressed_bytes"] < stats["uncompressed_bytes"] / 4
+
+    def test_no_compression(self) -> None:
+        session, adapter = self._session(compression=False)
+
+        session.get_or_raise("test")
+
+        assert adapter.accept_encodings[-1] == "identity"
+
+
+class _TimeoutAdapter(BaseAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.timeouts: List[Any] = []
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Response:  # pylint: disable=unused-argument
+        self.timeouts.append(kwargs.get("timeout"))
+        if request.url.endswith("openid-configuration"):
+            body: Any = {"token_endpoint": "https://auth/token"}
+        elif request.url.startswith("https://auth/"):
+            body = {"access_token": "token", "expires_in": 100, "token_type": "Bearer"}
+        else:
+            body = request.headers.get("Connection")
+        response = Response()
+        response.status_code = 200
+        response._content = json_dump(body).encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.no_account
+class TestConnectionPool:
+    @staticmethod
+    def _session(**kwargs: Any) -> Session:
+        return Session(
+            "", "", api_url="https://api/", authorization_url="https://auth/", use_access_token_cache=False, **kwargs
+        )
+
+    def test_api_adapter(self) -> None:
+        session = self._session(pool_maxsize=32, pool_block=True)
+
+        adapter = session.requests_session.get_adapter("https://api/v1/series/fetchseries")
+
+        assert adapter is session._api_adapter
+        assert adapter._pool_maxsize == 32  # type: ignore[attr-defined]
+        assert adapter._pool_block is True  # type: ignore[attr-defined]
+
+    def test_timeout_and_keep_alive(self) -> None:
+        session = self._session(timeout=(3, 30), keep_alive=False)
+        adapter = _TimeoutAdapter()
+        session.requests_session.mount("https://", adapter)
+        session.requests_session.mount(session.api_url, adapter)
+
+        assert session.get_or_raise("test").json() == "close"
+        assert adapter.timeouts and all(x == (3, 30) for x in adapter.timeouts)
+
+    def test_stats(self) -> None:
+        session = self._session()
+        assert session.connection_pool_stats() == {"requests": 0, "connections": 0, "reused": 0}
+
+        pool = session._api_adapter.poolmanager.connection_from_url("https://api/")
+        pool.num_requests = 5
+        pool.num_connections = 2
+
+        assert session.connection_pool_stats() == {"requests": 5, "connections": 2, "reused": 3}
+
+
+@pytest.mark.no_account
+class TestResponseAsFileObject:
+    @staticmethod
+    def _file_object(body: bytes, chunk_size: int) -> _ResponseAsFileObject:
+        response = Response()
+        response.raw = BytesIO(body)
+        return _ResponseAsFileObject(response, chunk_size)
+
+    def test_read(self) -> None:
+        file_object = self._file_object(b"0123456789", 4)
+
+        assert file_object.read(0) == b""
+        assert file_object.read(3) == b"012"
+        assert file_object.read(3) == b"3"
+        assert file_object.read(10) == b"4567"
+        assert file_object.read() == b"89"
+        assert file_object.read(1) == b""
+
+    def test_readinto(self) -> None:
+        file_object = self._file_object(b"0123456789", 4)
+        buffer = bytearray(3)
+
+        assert file_object.readinto(buffer) == 3
+        assert buffer == b"012"
+        assert file_object.readinto(buffer) == 1
+        assert buffer[:1] == b"3"
+        assert file_object.readall() == b"456789"
+        assert file_object.readinto(buffer) == 0
@@ -1,6 +1,20 @@
+import asyncio
 from datetime import datetime, timezone
+from io import BytesIO
+from json import dumps as json_dump, loads as json_load
+from threading import Lock
+from typing import Any, List, Set, Tuple
+
+import pytest
+
+from requests import Response
+from requests.adapters import BaseAdapter
 
 from macrobond_data_api.web import WebApi
+from macrobond_data_api.web.subscription_list import SubscriptionList
+
+from ..mock_adapter_builder import MockAdapterBuilder as MAB
+from .web_async_web_api import _StubTransport, _create_api
 
 
 def test_subscription_list(web: WebApi) -> None:
@@ -16,3 +30,140 @@ def test_subscription_list(web: WebApi) -> None:
     assert set(subscription_list.list()) == {"sek", "dkk"}
 
     assert subscription_list.poll() == {}
+
+
+class _SubscriptionListServer:
+    """Applies the changes after a number of checks, like the server does after a while."""
+
+    def __init__(self, checks_before_applied: int = 2) -> None:
+        self.checks_before_applied = checks_before_applied
+        self.included: Set[str] = set()
+        self.pending: List[Tuple[str, List[str], int]] = []
+        self.requests: List[Tuple[str, List[str]]] = []
+        self.lock = Lock()
+
+    def handle(self, endpoint: str, keys: List[str]) -> object:
+        with self.lock:
+            self.requests.append((endpoint, keys))
+            if endpoint == "checkifnotincluded":
+                self.pending = [(x, y, z - 1) for x, y, z in self.pending]
+                for change, change_keys, _ in [x for x in self.pending if x[2] <= 0]:
+                    if change == "set":
+                        self.included = set(change_keys)
+                    elif change == "add":
+                        self.included.update(change_keys)
+                    else:
+                        self.included.difference_update(change_keys)
+                self.pending = [x for x in self.pending if x[2] > 0]
+                return [x for x in keys if x not in self.included]
+            self.pending.append((endpoint, keys, self.checks_before_applied))
+            return None
+
+
+class _SubscriptionListAdapter(BaseAdapter):
+    def __init__(self, server: _SubscriptionListServer) -> None:
+        super().__init__()
+        self.server = server
+
+    def send(self, request: Any, *args: Any, **kwargs: Any) -> Response:  # pylint: disable=unused-argument
+        endpoint = request.url[len("https://api/v1/subscriptionlist/") :]
+        body = self.server.handle(endpoint, json_load(request.body))
+        response = Response()
+        response.status_code = 200
+        response.raw = BytesIO(json_dump(body).encode())
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.no_account
+class TestSubscriptionListChanges:
+    def _create(self, mab: MAB, server: _SubscriptionListServer) -> SubscriptionList:
+        _, api, session, auth_client = mab.auth().build()
+        auth_client.fetch_token_if_necessary()
+        session.requests_session.mount("https://api/", _SubscriptionListAdapter(server))
+        subscription_list = api.subscription_list(datetime.now(timezone.utc))
+        subscription_list._sleep = lambda x: None
+        return subscription_list
+
+    def test_batches(self, mab: MAB) -> None:
+        server = _SubscriptionListServer()
+        subscription_list = self._create(mab, server)
+        subscription_list.batch_size = 2
+
+        subscription_list.set(["a", "b", "c", "d", "e"])
+
+        assert server.included == {"a", "b", "c", "d", "e"}
+        assert [x for x in server.requests if x[0] != "checkifnotincluded"] == [
+            ("set", ["a", "b"]),
+            ("add", ["c", "d"]),
+            ("add", ["e"]),
+        ]
+
+        subscription_list.remove(["a", "b", "c"])
+        assert server.included == {"d", "e"}
+
+    def test_only_pending_keys_are_checked(self, mab: MAB) -> None:
+        server = _SubscriptionListServer()
+        server.included = {"a"}
+        subscription_list = self._create(mab, server)
+        subscription_list.max_workers = 1
+
+        subscription_list.add(["a", "b"])
+
+        assert server.requests == [
+            ("add", ["a", "b"]),
+            ("checkifnotincluded", ["a", "b"]),
+            ("checkifnotincluded", ["b"]),
+        ]
+
+    def test_nowait(self, mab: MAB) -> None:
+        server = _SubscriptionListServer()
+        subscription_list = self._create(mab, server)
+
+        first = subscription_list.add_nowait(["a", "b"])
+        second = subscription_list.remove_nowait(["a"])
+
+        second.result(timeout=10)
+        assert first.done()
+        assert server.included == {"b"}
+
+    def test_close(self, mab: MAB) -> None:
+        server = _SubscriptionListServer()
+
+        with self._create(mab, server) as subscription_list:
+            future = subscription_list.add_nowait(["a"])
+            executor = subscription_list._executor
+
+        # Closing waits for the pending change and stops the worker
+        assert future.done()
+        assert server.included == {"a"}
+        assert executor is not None and executor._shutdown
+        with pytest.raises(ValueError, match="SubscriptionList is closed"):
+            subscription_list.add_nowait(["b"])
+        subscription_list.close()
+
+    def test_not_a_sequence(self, mab: MAB) -> None:
+        subscription_list = self._create(mab, _SubscriptionListServer())
+
+        with pytest.raises(TypeError, match="keys is not a sequence"):
+            subscription_list.add_nowait({"a"})  # type: ignore[arg-type]
+
+    def test_async(self) -> None:
+        server = _SubscriptionListServer()
+        transport = _StubTransport()
+        for endpoint in ["set", "add", "remove", "checkifnotincluded"]:
+            transport.handlers[("POST", "https://api/v1/subscriptionlist/" + endpoint)] = (
+                lambda p, j, endpoint=endpoint: (200, server.handle(endpoint, j))  # type: ignore[misc]
+            )
+
+        async def run() -> None:
+            async with _create_api(transport) as api:
+                subscription_list = api.subscription_list(datetime.now(timezone.utc))
+                subscription_list.batch_size = 2
+                await asyncio.gather(subscription_list.set(["a", "b", "c"]), subscription_list.remove(["a"]))
+
+        asyncio.run(run())
+
+        assert server.included == {"b", "c"}
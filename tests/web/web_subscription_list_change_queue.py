@@ -0,0 +1,132 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from macrobond_data_api.web import SubscriptionListChangeQueue, WebApi
+from macrobond_data_api.web.session import HttpException
+
+from ..mock_adapter import ApiEndpointAdapter
+from ..mock_adapter_builder import MockAdapterBuilder as MAB
+
+
+def _time(hour: int) -> datetime:
+    return datetime(2024, 1, 1, hour, tzinfo=timezone.utc)
+
+
+class _Server:
+    def __init__(self) -> None:
+        self.modified: Dict[str, datetime] = {}
+
+    def create(self, x: Dict[str, Any]) -> Dict[str, Any]:
+        if_modified_since = x["ifModifiedSince"]
+        if if_modified_since and datetime.fromisoformat(if_modified_since) >= self.modified[x["name"]]:
+            return {"errorText": "Not modified", "errorCode": 304}
+        return {"dates": ["2021-01-01"], "values": [1.0], "metadata": {"PrimName": x["name"]}}
+
+
+class _SubscriptionList:
+    def __init__(self, polls: List[Dict[str, datetime]]) -> None:
+        self.polls = polls
+        self.no_more_changes = False
+
+    def poll(self) -> Dict[str, datetime]:
+        changes = self.polls.pop(0)
+        self.no_more_changes = not self.polls
+        return changes
+
+
+def _build(mab: MAB) -> Tuple[WebApi, _Server, ApiEndpointAdapter]:
+    server = _Server()
+    adapter = ApiEndpointAdapter("v1/series/fetchseries", server.create)
+    api, _ = mab.build_with_endpoint(adapter)
+    return api, server, adapter
+
+
+@pytest.mark.no_account
+class TestSubscriptionListChangeQueue:
+    def test_coalesce_burst(self, mab: MAB) -> None:
+        api, server, adapter = _build(mab)
+        server.modified = {"sek": _time(3), "nok": _time(2)}
+        subscription_list = _SubscriptionList(
+            [{"sek": _time(1)}, {"sek": _time(2), "nok": _time(2)}, {"sek": _time(3)}, {}]
+        )
+        now = [0.0]
+        queue = SubscriptionListChangeQueue(
+            api, subscription_list, window=10, _time=lambda: now[0]  # type: ignore[arg-type]
+        )
+
+        result = []
+        for series in queue.poll_series_until_no_more_changes():
+            result.append(series.name)
+
+        assert sorted(result) == ["nok", "sek"]
+        assert len(adapter.requests) == 1
+        assert queue.changes == 4
+        assert queue.downloads == 2
+        assert queue.last_downloaded == {"sek": _time(3), "nok": _time(2)}
+
+    def test_window_and_if_modified_since(self, mab: MAB) -> None:
+        api, server, adapter = _build(mab)
+        server.modified = {"sek": _time(1)}
+        now = [0.0]
+        subscription_list = _SubscriptionList([{"sek": _time(1)}, {}, {"sek": _time(1)}, {}])
+        queue = SubscriptionListChangeQueue(
+            api, subscription_list, window=10, _time=lambda: now[0]  # type: ignore[arg-type]
+        )
+
+        queue.add(subscription_list.poll())
+        assert not queue.is_due()
+        now[0] = 10
+        assert queue.is_due()
+        assert [x.name for x in queue.download_pending()] == ["sek"]
+
+        # The same modification again is not downloaded again
+        queue.add(subscription_list.poll())
+        queue.add(subscription_list.poll())
+        now[0] = 20
+        assert queue.is_due()
+        assert not list(queue.download_pending())
+        assert adapter.requests[1] == [{"name": "sek", "ifModifiedSince": _time(1).isoformat()}]
+        assert queue.downloads == 1
+
+    def test_max_pending(self, mab: MAB) -> None:
+        api, _, _ = _build(mab)
+        queue = SubscriptionListChangeQueue(
+            api, _SubscriptionList([]), window=10, max_pending=2  # type: ignore[arg-type]
+        )
+
+        queue.add({"sek": _time(1)})
+        assert not queue.is_due()
+        queue.add({"nok": _time(1)})
+        assert queue.is_due()
+
+    def test_closed_early_keeps_remaining(self, mab: MAB) -> None:
+        api, _, _ = _build(mab)
+        queue = SubscriptionListChangeQueue(api, _SubscriptionList([]))  # type: ignore[arg-type]
+        queue.add({"sek": _time(1), "nok": _time(1), "dkk": _time(1)})
+
+        download = queue.download_pending()
+        assert next(download).name == "sek"
+        # A newer change of a series that is being downloaded is kept
+        queue.add({"nok": _time(2)})
+        download.close()
+
+        assert queue.pending == {"nok": _time(2), "dkk": _time(1)}
+        assert queue.last_downloaded == {"sek": _time(1)}
+
+        assert sorted(x.name for x in queue.download_pending()) == ["dkk", "nok"]
+        assert not queue.pending
+
+    def test_failed_download_keeps_pending(self, mab: MAB) -> None:
+        api, _, adapter = _build(mab)
+        queue = SubscriptionListChangeQueue(api, _SubscriptionList([]), window=0)  # type: ignore[arg-type]
+        queue.add({"sek": _time(1), "nok": _time(1)})
+        adapter.fail_status = 500
+
+        with pytest.raises(HttpException):
+            list(queue.download_pending())
+
+        assert queue.pending == {"sek": _time(1), "nok": _time(1)}
+        assert queue.is_due()
+        assert not queue.last_downloaded
@@ -0,0 +1,40 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from macrobond_data_api.common.types import GetEntitiesError
+
+from ..mock_adapter_builder import MAB
+
+_RESPONSE = {
+    "dates": ["2021-01-01T00:00:00Z", "2021-02-01T00:00:00Z"],
+    "series": [
+        {"values": [1, None], "metadata": {"PrimName": "s1"}},
+        {"errorText": "Not found"},
+        {"values": [2.5, 3], "metadata": {"PrimName": "s3"}},
+    ],
+}
+
+
+@pytest.mark.no_account
+class TestUnifiedSeries:
+    def test_streaming(self, mab: MAB) -> None:
+        _, api, _, _ = mab.auth().response("https://api/v1/series/fetchunifiedseries", 200, _RESPONSE).build()
+
+        result = api.get_unified_series("s1", "s2", "s3", raise_error=False)
+
+        assert result.dates == [
+            datetime(2021, 1, 1, tzinfo=timezone.utc),
+            datetime(2021, 2, 1, tzinfo=timezone.utc),
+        ]
+        assert [x.name for x in result] == ["s1", "s2", "s3"]
+        assert result[0].values == [1.0, None]
+        assert result[1].error_message == "Not found"
+        assert result[2].values == [2.5, 3.0]
+        assert isinstance(result[2].values[1], float)
+
+    def test_raise_error(self, mab: MAB) -> None:
+        _, api, _, _ = mab.auth().response("https://api/v1/series/fetchunifiedseries", 200, _RESPONSE).build()
+
+        with pytest.raises(GetEntitiesError):
+            api.get_unified_series("s1", "s2", "s3", raise_error=True)
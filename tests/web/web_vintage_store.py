@@ -0,0 +1,127 @@
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from macrobond_data_api.common.enums import StatusCode
+from macrobond_data_api.web import VintageStore
+
+from ..mock_adapter import ApiEndpointAdapter
+from ..mock_adapter_builder import MAB
+
+
+class _Server:
+    """Serves one series with revision history, like the server does."""
+
+    def __init__(self) -> None:
+        self.vintages: List[Dict[str, Any]] = [
+            {"dates": ["2021-01-01"], "values": [1.0]},
+            {"vintageTimeStamp": "2021-02-01T00:00:00Z", "dates": ["2021-01-01", "2021-02-01"], "values": [1.5, 2.0]},
+        ]
+        self.last_modified = "2021-02-01T00:00:00Z"
+        self.last_revision_adjustment = "2021-01-01T00:00:00Z"
+
+    def add_vintage(self, time_stamp: str, values: List[float]) -> None:
+        self.vintages.append(
+            {
+                "vintageTimeStamp": time_stamp,
+                "dates": ["2021-01-01", "2021-02-01", "2021-03-01"][: len(values)],
+                "values": values,
+            }
+        )
+        self.last_modified = time_stamp
+
+    def create(self, x: Dict[str, Any]) -> Dict[str, Any]:
+        if x["name"] == "missing":
+            return {"errorText": "Not found", "errorCode": 404}
+        metadata = {
+            "LastModifiedTimeStamp": self.last_modified,
+            "LastRevisionTimeStamp": self.vintages[-1]["vintageTimeStamp"],
+            "LastRevisionAdjustmentTimeStamp": self.last_revision_adjustment,
+        }
+        if x["ifModifiedSince"] == self.last_modified:
+            return {"errorText": "Not modified", "errorCode": 304}
+        if x["lastRevision"] and x["lastRevisionAdjustment"] == self.last_revision_adjustment:
+            new = [y for y in self.vintages if y.get("vintageTimeStamp", "") > x["lastRevision"]]
+            return {"errorCode": 206, "metadata": metadata, "vintages": new}
+        return {"metadata": metadata, "vintages": self.vintages}
+
+
+def _values(store: VintageStore) -> List[List[Optional[float]]]:
+    series = store.get_series_with_vintages("a")
+    assert series is not None
+    return [x.values for x in series.vintages]
+
+
+@pytest.mark.no_account
+class TestVintageStore:
+    def _store(self, mab: MAB, tmp_path: Any) -> Tuple[VintageStore, _Server, ApiEndpointAdapter]:
+        server = _Server()
+        adapter = ApiEndpointAdapter("v1/series/fetchallvintageseries", server.create)
+        api, _ = mab.build_with_endpoint(adapter)
+        return VintageStore(api, os.path.join(tmp_path, "vintages.db")), server, adapter
+
+    def test_incremental_sync(self, mab: MAB, tmp_path: Any) -> None:
+        store, server, adapter = self._store(mab, tmp_path)
+        with store:
+            assert store.sync(["a", "missing"]) == {"a": StatusCode.OK, "missing": StatusCode.NOT_FOUND}
+            assert adapter.requests[0][0] == {
+                "name": "a",
+                "ifModifiedSince": None,
+                "lastRevision": None,
+                "lastRevisionAdjustment": None,
+            }
+            assert _values(store) == [[1.0], [1.5, 2.0]]
+            assert store.get_series_with_vintages("missing") is None
+
+            assert store.sync(["a"]) == {"a": StatusCode.NOT_MODIFIED}
+
+            server.add_vintage("2021-03-01T00:00:00Z", [1.5, 2.5, 3.0])
+            assert store.sync(["a"]) == {"a": StatusCode.PARTIAL_CONTENT}
+            assert adapter.requests[-1][0] == {
+                "name": "a",
+                "ifModifiedSince": "2021-02-01T00:00:00Z",
+                "lastRevision": "2021-02-01T00:00:00Z",
+                "lastRevisionAdjustment": "2021-01-01T00:00:00Z",
+            }
+            assert _values(store) == [[1.0], [1.5, 2.0], [1.5, 2.5, 3.0]]
+
+            # An adjustment of the history downloads all vintages again
+            server.vintages = server.vintages[1:]
+            server.last_revision_adjustment = server.last_modified = "2021-03-02T00:00:00Z"
+            assert store.sync(["a"]) == {"a": StatusCode.OK}
+            assert _values(store) == [[1.5, 2.0], [1.5, 2.5, 3.0]]
+
+            assert (store.full_downloads, store.partial_downloads, store.not_modified) == (2, 1, 1)
+
+    def test_read_as_vintage_series(self, mab: MAB, tmp_path: Any) -> None:
+        store, _, _ = self._store(mab, tmp_path)
+        with store:
+            store.sync(["a"])
+            result = store.get_all_vintage_series("a")
+
+            assert result.series_name == "a"
+            assert [x.revision_time_stamp for x in result] == [
+                None,
+                datetime(2021, 2, 1, tzinfo=timezone.utc),
+            ]
+            assert result.to_vintage_matrix().values.shape == (2, 2)
+
+            with pytest.raises(ValueError, match="b is not in the store"):
+                store.get_all_vintage_series("b")
+
+    def test_persisted(self, mab: MAB, tmp_path: Any) -> None:
+        store, _, adapter = self._store(mab, tmp_path)
+        store.sync(["a"])
+        store.close()
+
+        with pytest.raises(ValueError, match="VintageStore is closed"):
+            store.sync(["a"])
+
+        with VintageStore(store._api, os.path.join(tmp_path, "vintages.db")) as store:
+            assert store.sync(["a"]) == {"a": StatusCode.NOT_MODIFIED}
+            assert _values(store) == [[1.0], [1.5, 2.0]]
+            store.remove(["a"])
+            assert store.get_series_with_vintages("a") is None
+        assert len(adapter.requests) == 2